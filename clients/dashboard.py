@@ -1,10 +1,20 @@
 from django.db import models
+from django.db.models.functions import TruncMonth
+from django.utils.functional import cached_property
 from rest_framework import serializers
 from rest_framework.generics import RetrieveAPIView
 from rest_framework.response import Response
 
 from clients.models import Client
-from projects.models.project import Project, ProjectStatusChoices
+from core.services.dashboard import (
+    CLIENT_ACCEPTED_PROJECTS,
+    CLIENT_PENDING_PROJECTS,
+    CLIENT_PROJECTS,
+    CLIENT_REVIEWS,
+    DashboardRollups,
+    DashboardRollupService,
+)
+from projects.models.project import Project
 from users.models import User
 from utilities.formatters import get_month_index_by_name, get_month_name_by_index
 
@@ -61,6 +71,11 @@ class ClientDashboardAPIView(RetrieveAPIView):
 
 
 class ClientDashboardQuery:
+    """
+    Computes the client dashboard. The month-over-month statistics are read
+    from the client's monthly rollups, the per category charts from grouped
+    queries, so the number of queries doesn't grow with the client's history.
+    """
 
     def __init__(
         self,
@@ -84,59 +99,43 @@ class ClientDashboardQuery:
 
         self.instance = instance
 
-        self.__projects = (
-            Project.objects.select_related()
-            .filter(
-                contract__client=self.instance,
-            )
-            .annotate(
-                budget=models.F("contract__proposal__budget"),
-            )
+        self.__projects = Project.objects.filter(
+            contract__client=self.instance,
+        ).annotate(
+            budget=models.F("contract__proposal__budget"),
         )
 
-        project_ids = self.__projects.values_list("id", flat=True)
-
-        self.__jobs = Job.objects.select_related().filter(
-            proposals__contract__project__id__in=project_ids,
+        self.__jobs = Job.objects.filter(
+            proposals__contract__project__in=self.__projects.values("id"),
             client=self.instance,
         )
 
+    @cached_property
+    def rollups(self) -> DashboardRollups:
+        return DashboardRollupService.read(
+            self.instance.pk,
+            [
+                CLIENT_PROJECTS,
+                CLIENT_ACCEPTED_PROJECTS,
+                CLIENT_PENDING_PROJECTS,
+                CLIENT_REVIEWS,
+            ],
+            self.year or self.today.year,
+            self.month,
+            total_year=self.year,
+        )
+
     def total_spending(self):
 
         try:
-            projects_budgets = self.__projects
-
-            accepted_projects = (
-                projects_budgets.filter(status=ProjectStatusChoices.ACCEPTED).aggregate(
-                    models.Sum("budget")
-                )["budget__sum"]
-                or 0.00
-            )
-
-            pending_projects = (
-                projects_budgets.filter(
-                    status__in=[
-                        ProjectStatusChoices.PENDING,
-                        ProjectStatusChoices.COMPLETED,
-                    ]
-                ).aggregate(models.Sum("budget"))["budget__sum"]
-                or 0.00
-            )
+            this_month = self.rollups.this_month(CLIENT_PROJECTS)
+            last_month = self.rollups.last_month(CLIENT_PROJECTS)
 
-            spent = accepted_projects
-            pending_spent = pending_projects
+            spent = self.rollups.total(CLIENT_ACCEPTED_PROJECTS)
+            pending_spent = self.rollups.total(CLIENT_PENDING_PROJECTS)
 
-            last_month = (
-                projects_budgets.filter(
-                    created_at__month=(self.month - 1) or 1
-                ).aggregate(models.Sum("budget"))["budget__sum"]
-            ) or 0.01
-
-            this_month = (
-                projects_budgets.filter(created_at__month=self.month).aggregate(
-                    models.Sum("budget")
-                )["budget__sum"]
-            ) or 0.00
+            last_month = (last_month and last_month.total) or 0.01
+            this_month = (this_month and this_month.total) or 0.00
 
             percentage = (float(this_month / 100) / float(last_month / 100)) * 100
 
@@ -155,11 +154,12 @@ class ClientDashboardQuery:
 
     def get_total_projects(self):
         try:
-            total = self.__projects.count()
-            last_month = self.__projects.filter(
-                created_at__month=(self.month - 1) or 1
-            ).count()
-            this_month = self.__projects.filter(created_at__month=self.month).count()
+            total = self.rollups.count(CLIENT_PROJECTS)
+            last_month = self.rollups.last_month(CLIENT_PROJECTS)
+            this_month = self.rollups.this_month(CLIENT_PROJECTS)
+
+            last_month = last_month.count if last_month else 0
+            this_month = this_month.count if this_month else 0
             percentage = (
                 float(this_month or 0.01 / 100) / float(last_month or 0.01 / 100)
             ) * 100
@@ -178,74 +178,54 @@ class ClientDashboardQuery:
 
     def get_project_spending(self):
 
-        try:
-
-            # Annotate custom fields with month, year and category
-            projects = self.__projects.values("id", "budget").annotate(
+        # The client's spending by month (latest first) and category
+        rows = (
+            self.__projects.annotate(
+                period=TruncMonth("created_at"),
                 category=models.F("contract__job__category__name"),
-                year=models.F("created_at__year"),
-                month=models.F("created_at__month"),
             )
+            .values("period", "category")
+            .annotate(spent=models.Sum("budget"), latest_id=models.Max("id"))
+            .order_by("-period", "category")
+        )
 
-            result = []
-
-            for category in projects:
-
-                # Groups all projects by category and month
-                months = projects.filter(created_at__month=category["month"]).annotate(
-                    spent=models.Sum("budget"),
-                    month=models.F("created_at__month"),
-                    year=models.F("created_at__year"),
-                )
-
-                unique = {}
-
-                # Loop through months
-                for single_month in months:
-
-                    unique[single_month["category"]] = single_month
+        months: dict = {}
+        for row in rows:
+            month = months.setdefault(
+                row["period"], {"id": row["latest_id"], "categories": {}}
+            )
+            month["id"] = max(month["id"], row["latest_id"])
+            month["categories"][row["category"]] = row["spent"] or 0
 
-                result.append(
+        return [
+            {
+                "id": month["id"],
+                "name": period.month,
+                "year": period.year,
+                "data": [
                     {
-                        "id": category["id"],
-                        "name": category["month"],
-                        "year": category["year"],
-                        "data": [
-                            {
-                                "year": month["year"],
-                                "label": get_month_name_by_index(month["month"]),
-                                "category": month["category"],
-                                "x": get_month_name_by_index(month["month"]),
-                                "y": projects.filter(
-                                    created_at__month=month["month"],
-                                )
-                                .aggregate(budget=models.Sum("budget"))
-                                .get("budget"),
-                            }
-                            for month in list(unique.values())[:6]
-                        ],
+                        "year": period.year,
+                        "label": get_month_name_by_index(period.month),
+                        "category": category,
+                        "x": get_month_name_by_index(period.month),
+                        "y": spent,
                     }
-                )
-            return result
-        except Exception:
-
-            # DokoolaLogger.critical(message)
-
-            return []
+                    for category, spent in list(month["categories"].items())[:6]
+                ],
+            }
+            for period, month in months.items()
+        ]
 
     def get_average_rating(self):
-        reviews = self.instance.reviews.select_related()
-
-        this_month = reviews.filter(created_at__month=(self.month - 1) or 1)
-        last_month = reviews.filter(created_at__month=self.month)
+        count = self.rollups.count(CLIENT_REVIEWS)
+        this_month = self.rollups.this_month(CLIENT_REVIEWS)
+        last_month = self.rollups.last_month(CLIENT_REVIEWS)
 
         data = {
-            "count": reviews.count(),
-            "average": reviews.aggregate(models.Avg("rating"))["rating__avg"] or 0.01,
-            "this_month": this_month.aggregate(models.Avg("rating"))["rating__avg"]
-            or 0.01,
-            "last_month": last_month.aggregate(models.Avg("rating"))["rating__avg"]
-            or 0.01,
+            "count": count,
+            "average": (count and self.rollups.total(CLIENT_REVIEWS) / count) or 0.01,
+            "this_month": (this_month and this_month.total / this_month.count) or 0.01,
+            "last_month": (last_month and last_month.total / last_month.count) or 0.01,
         }
         data["percentage"] = (
             (data["this_month"] / 100) / (data["last_month"] / 100)
@@ -257,34 +237,26 @@ class ClientDashboardQuery:
         return data
 
     def get_project_types(self):
-        projects = (
-            self.__jobs.order_by("-created_at")
-            # .distinct("category")
-            .values("slug").annotate(
-                label=models.F("category__name"),
-                year=models.F("created_at__year"),
-                month=models.F("created_at__month"),
+        categories = (
+            self.__jobs.values(
+                label=models.F("category__name"), slug=models.F("category__slug")
             )
+            .annotate(
+                latest=models.Max("created_at"),
+                count=models.Count("id", distinct=True),
+            )
+            .order_by("-latest")[:6]
         )
 
-        _projects = {}
-
-        for p in projects:
-            _projects[p["label"]] = p
-
-        projects = list(_projects.values())[:6]
-
         return [
             {
-                "id": project["slug"],
-                "year": project["year"],
-                "month": get_month_name_by_index(project["month"]),
-                "label": project["label"],
-                "count": self.__jobs.filter(category__name=project["label"])
-                .values()
-                .count(),
+                "id": category["slug"],
+                "year": category["latest"].year,
+                "month": get_month_name_by_index(category["latest"].month),
+                "label": category["label"],
+                "count": category["count"],
             }
-            for project in projects
+            for category in categories
         ]
 
     def get_recent_projects(self):
@@ -304,38 +276,13 @@ class ClientDashboardQuery:
         return computed
 
     def get_talent_reviews(self):
-        try:
-            _query = models.Q(pk__isnull=False)
-
-            ratings = (
-                self.instance.reviews.select_related()
-                .filter(_query)
-                .values("id")
-                .annotate(
-                    year=models.F("created_at__year"),
-                    month=models.F("created_at__month"),
-                )
-            )
-
-            duplicate = {}
-            for review in ratings:
-                duplicate[review["month"]] = review
-
-            result = [
-                {
-                    "id": rating["id"],
-                    "year": rating["year"],
-                    "month": get_month_name_by_index(rating["month"]),
-                    **self.instance.reviews.select_related()
-                    .filter(_query, created_at__month=rating["month"])
-                    .aggregate(
-                        count=models.Count("id", 0),
-                        avg_rating=models.Avg("rating", 0, distinct=True),
-                    ),
-                }
-                for rating in list(duplicate.values())[:6]
-            ]
-            return result
-        except Exception:
-
-            return []
+        return [
+            {
+                "id": month.pk,
+                "year": month.year,
+                "month": get_month_name_by_index(month.month),
+                "count": month.count,
+                "avg_rating": month.total / month.count,
+            }
+            for month in self.rollups.recent(CLIENT_REVIEWS)
+        ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.2 on 2026-10-18 13:31
+
+from django.db import migrations, models
+
+
+def backfill_ratings(apps, schema_editor):
+    Client = apps.get_model("clients", "Client")
+
+    Client.objects.update(rating_sum=0, reviews_count=0)
+    rated = (
+        Client.objects.annotate(
+            total=models.Sum("reviews__rating"), count=models.Count("reviews")
+        )
+        .filter(count__gt=0)
+        .values_list("pk", "total", "count")
+    )
+    for pk, total, count in rated:
+        Client.objects.filter(pk=pk).update(
+            rating_sum=total, reviews_count=count, rating=total / count
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clients", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="client",
+            name="rating_sum",
+            field=models.FloatField(blank=True, default=0),
+        ),
+        migrations.RunPython(backfill_ratings, migrations.RunPython.noop),
+    ]
@@ -3,7 +3,7 @@ from functools import partial
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
-from reviews.models import Review
+from reviews.models import RatedProfileMixin, Review
 from utilities.generator import (
     default_pid_generator,
     primary_key_generator,
@@ -46,7 +46,7 @@ class Company(models.Model):
         return super().save(*args, **kwargs)
 
 
-class Client(models.Model):
+class Client(RatedProfileMixin, models.Model):
 
     id = models.UUIDField(
         primary_key=True, default=primary_key_generator, editable=False, max_length=100
@@ -68,6 +68,7 @@ class Client(models.Model):
     reviews_count = models.IntegerField(default=0, blank=True, null=False)
     reviews = models.ManyToManyField(Review, blank=True, related_name="client")
     rating = models.FloatField(default=0, blank=True, null=False, max_length=5)
+    rating_sum = models.FloatField(default=0, blank=True)
 
     country = models.JSONField(encoder=DjangoJSONEncoder, null=True, max_length=500)
     address = models.CharField(max_length=1000, default="", blank=True)
@@ -77,30 +78,11 @@ class Client(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
 
     PUBLIC_ID_PREFIX = "CL"
+    DEFAULT_RATING = 3.7
 
     def __str__(self):
         return self.name
 
-    # Calculates the client's average rating
-    def average_rating(self, recalculate=False, db_commit=False):
-        default_rating = 3.7
-
-        if not recalculate:
-            return self.rating or default_rating
-        
-        rating = float(
-            self.reviews.select_related().aggregate(rating=models.Avg("rating"))[
-                "rating"
-            ]
-            or default_rating
-        )
-
-        if db_commit and float(self.rating) != rating:
-            self.rating = rating
-            self.save()
-
-        return rating
-
     @property
     def name(self):
         if self._company:
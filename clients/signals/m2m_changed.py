@@ -0,0 +1,14 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from clients.models import Client
+from core.services.dashboard import CLIENT_REVIEWS, DashboardRollupService
+
+
+@receiver(m2m_changed, sender=Client.reviews.through)
+def update_client_reviews_dashboard(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    DashboardRollupService.schedule_reviews(
+        CLIENT_REVIEWS, "client", instance, action, reverse, pk_set
+    )
@@ -0,0 +1,106 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from contracts.models import Contract
+from core.models import Category
+from jobs.models import Job, JobStatusChoices
+from projects.models.project import Project, ProjectStatusChoices
+from proposals.models import Proposal
+from reviews.models import Review
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def client_user(db):
+    cache.clear()
+    user = User.objects.create(
+        username="client", email="client@mail.com", is_active=True, is_client=True
+    )
+    Client.objects.create(user=user)
+    return user
+
+
+def create_projects(client: Client, count: int, category_name: str):
+    category = Category.objects.create(
+        name=category_name,
+        slug=category_name.lower(),
+        keywords="",
+        image_url="",
+        description="",
+    )
+    for index in range(count):
+        user = User.objects.create(
+            username=f"{category.slug}{index}",
+            email=f"{category.slug}{index}@mail.com",
+            is_talent=True,
+        )
+        talent = Talent.objects.create(user=user)
+        job = Job.objects.create(
+            title=f"{category_name} job {index}",
+            description="Job description",
+            country={"name": "Gambia", "code": "GM"},
+            address="Serrekunda",
+            required_skills=[],
+            status=JobStatusChoices.PUBLISHED,
+            client=client,
+            category=category,
+        )
+        proposal = Proposal.objects.create(
+            job=job, talent=talent, cover_letter="Hi", budget=100
+        )
+        contract = Contract.objects.create(
+            job=job, client=client, proposal=proposal, talent=talent
+        )
+        Project.objects.create(
+            contract=contract, duration="1 week", status=ProjectStatusChoices.ACCEPTED
+        )
+
+
+def fetch_dashboard(user: User):
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(reverse("client_stats"))
+    assert response.status_code == 200
+    return response.data, [q for q in queries if not q["sql"].startswith("EXPLAIN")]
+
+
+@pytest.mark.django_db
+def test_dashboard_query_count_is_constant(
+    client_user, django_capture_on_commit_callbacks
+):
+    client = client_user.client_profile
+    with django_capture_on_commit_callbacks(execute=True):
+        create_projects(client, 2, "Design")
+        client.reviews.add(
+            Review.objects.create(author=client_user, rating=4),
+            Review.objects.create(author=client_user, rating=5),
+        )
+
+    data, queries = fetch_dashboard(client_user)
+
+    assert data["total_spending"]["spent"] == 200
+    assert data["total_spending"]["this_month"] == 200
+    assert data["total_projects"]["total"] == 2
+    assert data["project_types"][0]["label"] == "Design"
+    assert data["project_types"][0]["count"] == 2
+    assert data["project_spending"][0]["data"][0]["y"] == 200
+    assert data["talent_reviews"][0]["count"] == 2
+    assert data["talent_reviews"][0]["avg_rating"] == 4.5
+    assert data["avg_rating"]["count"] == 2
+    assert data["avg_rating"]["this_month"] == 4.5
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_projects(client, 3, "Writing")
+
+    data, more_queries = fetch_dashboard(client_user)
+
+    assert data["total_projects"]["total"] == 5
+    assert sorted(t["count"] for t in data["project_types"]) == [2, 3]
+    assert len(more_queries) == len(queries)
@@ -9,11 +9,6 @@ urlpatterns = [
         views.ClientGenericAPIView.as_view(),
         name="client_generic_view",
     ),
-    path(
-        "<public_id>/",
-        views.ClientGenericAPIView.as_view(),
-        name="client_generic_view",
-    ),
     path("info/", views.ClientJobDetailView.as_view(), name="client_info"),
     path(
         "dashboard/",
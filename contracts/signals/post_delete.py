@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from contracts.models import Contract
+from core.services.dashboard import TALENT_CONTRACT_METRICS, DashboardRollupService
+
+
+@receiver(post_delete, sender=Contract)
+def update_talent_dashboard(sender, instance: Contract, **kwargs):
+    DashboardRollupService.schedule(
+        TALENT_CONTRACT_METRICS,
+        instance.talent_id,
+        [instance.created_at, instance.completed_at],
+    )
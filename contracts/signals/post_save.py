@@ -3,6 +3,8 @@ from django.dispatch import receiver
 from django.utils import timezone
 
 from contracts.models import Contract, ContractProgressChoices, ContractStatusChoices
+from core.services.dashboard import TALENT_CONTRACT_METRICS, DashboardRollupService
+from core.services.notifications import NotificationService
 from jobs.models import JobStatusChoices
 from notifications.models import Notification
 from projects.models.project import Project
@@ -73,7 +75,7 @@ def on_accepted_contract(sender, instance: Contract, created, **kwargs):
         # TODO: Notify client through email
     )
 
-    Notification.objects.bulk_create(notifications)
+    NotificationService.fan_out(notifications)
 
 
 @receiver(post_save, sender=Contract)
@@ -88,32 +90,46 @@ def on_completed_contract(sender, instance: Contract, created, **kwargs):
     client = instance.client
     talent = instance.talent
 
-    # Notify the talent
-    Notification.objects.create(
-        hint_text="Project Completed",
-        content_text=f"You've marked the contract {instance.pk}: {instance.job.title} as <strong>{instance.progress}</strong>! Dokoola congrats you for this 🎇",
-        recipient=talent.user,
-        object_api_link=f"/contracts/view/{instance.pk}",
-    )
-    # TODO: Notify talent through email
-    # Notify the talent
-    Notification.objects.create(
-        hint_text="Project Awaiting Review",
-        content_text=f"We'll prompt <strong>{instance.client.user.name}</strong> to review and validate your work",
-        recipient=talent.user,
-        object_api_link=f"/contracts/view/{instance.pk}",
-    )
-    # TODO: Notify talent through email
-
-    # Notify the client
-    Notification.objects.create(
-        hint_text="Project Completed",
-        content_text=f"Your contract {instance.pk}: {instance.job.title} was marked completed by <strong>{talent.user.name}</strong> please review and acknowledge the status",
-        recipient=client.user,
-        sender=talent.user,
-        object_api_link=f"/contracts/view/{instance.pk}",
+    NotificationService.fan_out(
+        [
+            # Notify the talent
+            Notification(
+                hint_text="Project Completed",
+                content_text=f"You've marked the contract {instance.pk}: {instance.job.title} as <strong>{instance.progress}</strong>! Dokoola congrats you for this 🎇",
+                recipient=talent.user,
+                object_api_link=f"/contracts/view/{instance.pk}",
+            ),
+            # TODO: Notify talent through email
+            # Notify the talent
+            Notification(
+                hint_text="Project Awaiting Review",
+                content_text=f"We'll prompt <strong>{instance.client.user.name}</strong> to review and validate your work",
+                recipient=talent.user,
+                object_api_link=f"/contracts/view/{instance.pk}",
+            ),
+            # TODO: Notify talent through email
+            # Notify the client
+            Notification(
+                hint_text="Project Completed",
+                content_text=f"Your contract {instance.pk}: {instance.job.title} was marked completed by <strong>{talent.user.name}</strong> please review and acknowledge the status",
+                recipient=client.user,
+                sender=talent.user,
+                object_api_link=f"/contracts/view/{instance.pk}",
+            ),
+        ]
     )
 
     instance.completed_at = timezone.now()
     instance.save()
     # TODO: Notify client through email
+
+
+@receiver(post_save, sender=Contract)
+def update_talent_dashboard(sender, instance: Contract, **kwargs):
+    """Refreshes the talent's dashboard months touched by the contract"""
+
+    DashboardRollupService.schedule(
+        TALENT_CONTRACT_METRICS,
+        instance.talent_id,
+        [instance.created_at, instance.completed_at],
+    )
@@ -11,7 +11,7 @@ from contracts.serializers import (
     ContractCreateSerializer,
     ProposalContractRetrieveSerializer,
 )
-from core.services.after.main import AfterResponseService
+from core.services.notifications import NotificationService
 from jobs.models.job import Job, JobStatusChoices
 from notifications.models import Notification
 from proposals.models import Proposal, ProposalStatusChoices
@@ -176,9 +176,7 @@ class ContractCreateAPIView(GenericAPIView):
                     job_activity.hired.add(proposal.talent)
 
                     # Save notifications
-                    AfterResponseService.schedule_task(
-                        Notification.objects.bulk_create, notifications
-                    )
+                    NotificationService.fan_out(notifications)
 
                     return Response(
                         {
@@ -1,5 +1,9 @@
 from .category import CategoryModelAdmin
+from .dashboard_rollup import DashboardMonthlyRollupModelAdmin
+from .task import TaskModelAdmin
 
 __all__ = [
     "CategoryModelAdmin",
+    "DashboardMonthlyRollupModelAdmin",
+    "TaskModelAdmin",
 ]
@@ -0,0 +1,28 @@
+from django.contrib import admin
+from rest_framework import serializers
+
+from src.features.streaming import StreamingJSONResponse, is_asgi
+
+
+def export_serializer(model):
+    """A serializer of every field of `model`, relations as primary keys"""
+
+    meta = type("Meta", (), {"model": model, "fields": "__all__"})
+    return type(
+        f"{model.__name__}ExportSerializer",
+        (serializers.ModelSerializer,),
+        {"Meta": meta},
+    )
+
+
+@admin.action(description="Export selected as JSON")
+def export_as_json(modeladmin, request, queryset):
+    model = queryset.model
+    many_to_many = [field.name for field in model._meta.many_to_many]
+
+    return StreamingJSONResponse(
+        queryset.prefetch_related(*many_to_many).order_by("pk"),
+        export_serializer(model),
+        filename=f"{model._meta.model_name}s.json",
+        asynchronous=is_asgi(request),
+    )
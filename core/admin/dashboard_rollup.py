@@ -0,0 +1,11 @@
+from django.contrib import admin
+from unfold.admin import ModelAdmin
+
+from core import models
+
+
+@admin.register(models.DashboardMonthlyRollup)
+class DashboardMonthlyRollupModelAdmin(ModelAdmin):
+    list_display = ["profile_id", "metric", "year", "month", "total", "count"]
+    list_filter = ["metric", "year"]
+    search_fields = ["profile_id"]
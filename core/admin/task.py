@@ -0,0 +1,11 @@
+from django.contrib import admin
+from unfold.admin import ModelAdmin
+
+from core import models
+
+
+@admin.register(models.Task)
+class TaskModelAdmin(ModelAdmin):
+    list_display = ["name", "status", "attempts", "run_at", "duration_ms"]
+    list_filter = ["status", "name"]
+    readonly_fields = ["last_error"]
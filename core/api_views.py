@@ -1,8 +1,11 @@
 from rest_framework import serializers
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from core.models import Category, Feedback, Waitlist
+from core.services.events import EventService
+from core.services.events.main import EVENTS_TICKET_TIMEOUT
 from utilities.generator import get_serializer_error_message
 from utilities.privacy import mask_email
 
@@ -216,3 +219,14 @@ class FeedbackAPIView(GenericAPIView):
 
         error_message = get_serializer_error_message(feedback.errors)
         return Response({"message": error_message}, status=400)
+
+
+# Events -------------------------------------------------------------------------
+class EventTicketAPIView(APIView):
+    """Issues the single use ticket an EventSource opens /api/events/ with"""
+
+    def post(self, request):
+        ticket = EventService.create_ticket(request.user.pk)
+        return Response(
+            {"ticket": ticket, "expires_in": EVENTS_TICKET_TIMEOUT}, status=201
+        )
@@ -0,0 +1,98 @@
+import re
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from core.processors.base import email_environment
+from core.services.email.templates import render_email
+
+
+def sample_context() -> dict[str, Any]:
+    user = SimpleNamespace(name="Jane Doe", first_name="Jane")
+    job = SimpleNamespace(
+        public_id="job123",
+        title="Build a marketing website",
+        client=SimpleNamespace(user=user),
+        application_deadline=timezone.now(),
+        updated_at=timezone.now(),
+        get_job_type_display="Contract",
+        category=SimpleNamespace(name="Web Development"),
+        pricing=SimpleNamespace(currency=SimpleNamespace(symbol="D")),
+    )
+    proposal = SimpleNamespace(
+        public_id="proposal123",
+        job=job,
+        talent=SimpleNamespace(user=user),
+        budget=1500,
+        duration="2 weeks",
+        created_at=timezone.now(),
+        short_cover_letter="I have built many websites like this one.",
+    )
+    return {
+        "name": "Jane",
+        "content": "Welcome to Dokoola",
+        "job": job,
+        "proposal": proposal,
+        "client": SimpleNamespace(name="Jane Doe", user=user),
+        "talent": SimpleNamespace(user=user),
+    }
+
+
+def render_legacy(template_name: str, context: dict[str, Any]) -> tuple[str, str]:
+    """How emails were rendered before the text templates"""
+
+    context = {**context, **email_environment()}
+    html = render_to_string(template_name, context=context)
+    content = re.search(r'<span id="__content">(.*?)</span>', html, re.DOTALL)
+    text = strip_tags(content.group(1) if content else html).strip()
+    return html, text
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders every email template with the legacy html-only path and with "
+        "the cached html and text templates, printing the time per render"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--runs",
+            default=200,
+            type=int,
+            help="The number of times each template is rendered",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        templates_dir = Path(settings.BASE_DIR) / "core" / "templates"
+        names = sorted(
+            str(path.relative_to(templates_dir))
+            for path in (templates_dir / "emails").rglob("*.html")
+            if path.name != "base.html"
+        )
+
+        context = sample_context()
+        variants = {
+            "legacy": render_legacy,
+            "cached": render_email,
+        }
+        for template_name in names:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{template_name}"))
+            for name, render in variants.items():
+                render(template_name, context)
+
+                started = time.perf_counter()
+                for _ in range(options["runs"]):
+                    render(template_name, context)
+                elapsed = (time.perf_counter() - started) / options["runs"] * 1000
+
+                self.stdout.write(
+                    self.style.SUCCESS(f"{name}: {elapsed:.3f} ms per render")
+                )
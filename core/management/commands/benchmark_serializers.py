@@ -0,0 +1,103 @@
+import time
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+from django.utils import timezone
+
+from clients.models import Client
+from core.models import Category
+from jobs.models import Job
+from jobs.serializers import JobListSerializer
+from notifications.models import Notification
+from notifications.serializer import NotificationSerializer
+from users.models.user import User
+
+
+def serialize(serializer_class, instances: list, context: dict) -> list:
+    return serializer_class(instances, many=True, context=context).data
+
+
+def sample_rows(count: int) -> dict[type, list]:
+    """Unsaved instances shaped like the rows the list endpoints serialize"""
+
+    now = timezone.now()
+    user = User(id=1, username="jane", email="jane@mail.com", first_name="Jane")
+    client = Client(user=user, public_id="client123", _company={"name": "Kora"})
+    category = Category(name="Web Development", slug="web-development")
+
+    jobs = [
+        Job(
+            public_id=f"job{index}",
+            title="Build a marketing website",
+            description="We need a marketing website for our new product " * 10,
+            country={"name": "Gambia", "code": "GM"},
+            address="Serrekunda",
+            required_skills=["django", "react"],
+            pricing={"budget": 1500, "currency": "GMD"},
+            category=category,
+            client=client,
+            application_deadline=now,
+            created_at=now,
+        )
+        for index in range(count)
+    ]
+    notifications = [
+        Notification(
+            id=index,
+            sender=user if index % 2 else None,
+            recipient=user,
+            hint_text="New proposal",
+            content_text="Jane Doe submitted a proposal for your job",
+            created_at=now,
+        )
+        for index in range(count)
+    ]
+    return {
+        JobListSerializer: jobs,
+        NotificationSerializer: notifications,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Serializes in-memory rows of the hot list endpoints with the stock DRF "
+        "fields and with the compiled fast path, printing the time per row"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rows",
+            default=100,
+            type=int,
+            help="The number of rows serialized at once",
+        )
+        parser.add_argument(
+            "--runs",
+            default=50,
+            type=int,
+            help="The number of times the rows are serialized",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        rows, runs = options["rows"], options["runs"]
+        variants = {
+            "drf": {"compiled": False},
+            "compiled": {},
+        }
+
+        for serializer_class, instances in sample_rows(rows).items():
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(f"\n{serializer_class.__name__}")
+            )
+            for name, context in variants.items():
+                serialize(serializer_class, instances, context)
+
+                started = time.perf_counter()
+                for _ in range(runs):
+                    serialize(serializer_class, instances, context)
+                elapsed = (time.perf_counter() - started) / (runs * rows) * 1000
+
+                self.stdout.write(
+                    self.style.SUCCESS(f"{name}: {elapsed:.4f} ms per row")
+                )
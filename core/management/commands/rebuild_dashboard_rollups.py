@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+
+from core.services.dashboard import DashboardRollupService
+from core.services.dashboard.main import ROLLUP_METRICS
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the monthly rollups behind the client and talent dashboards"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--metric",
+            action="append",
+            choices=list(ROLLUP_METRICS),
+            help="Only rebuild this metric, can be repeated",
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=1000,
+            type=int,
+            help="The number of rollup rows inserted per query",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        written = DashboardRollupService.rebuild(
+            options["metric"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"✅ Wrote {written} rollup rows"))
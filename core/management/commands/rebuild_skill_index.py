@@ -0,0 +1,52 @@
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+
+from core.models import Skill
+from jobs.models import Job, JobSkill
+from talents.models import Talent, TalentSkill
+
+
+class Command(BaseCommand):
+    help = "Backfills the normalized skills of every job and talent"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            default=500,
+            type=int,
+            help="The number of jobs/talents synced per batch",
+        )
+
+    def sync(self, queryset, field: str, through, owner_field: str, batch_size: int):
+        count = 0
+        batch = {}
+        for pk, value in queryset.values_list("pk", field).iterator(
+            chunk_size=batch_size
+        ):
+            batch[pk] = value
+            if len(batch) >= batch_size:
+                Skill.objects.sync(through, owner_field, batch)
+                count += len(batch)
+                batch = {}
+
+        if batch:
+            Skill.objects.sync(through, owner_field, batch)
+            count += len(batch)
+        return count
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        batch_size = options["batch_size"]
+
+        jobs = self.sync(
+            Job.objects.order_by("pk"), "required_skills", JobSkill, "job", batch_size
+        )
+        self.stdout.write(self.style.SUCCESS(f"✅ Indexed the skills of {jobs} jobs"))
+
+        talents = self.sync(
+            Talent.objects.order_by("pk"), "skills", TalentSkill, "talent", batch_size
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Indexed the skills of {talents} talents")
+        )
@@ -0,0 +1,61 @@
+from datetime import timedelta
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+from django.utils import timezone
+
+from core.services.badges import BadgeService
+from messaging.models import ThreadSummary
+from notifications.models import Notification
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Recounts the cached unread notification and message counters "
+        "of the users active in the last hours"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--hours",
+            default=24,
+            type=int,
+            help="Reconcile the users with notifications or messages this recent",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Reconcile every user",
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=500,
+            type=int,
+            help="The number of users recounted per batch",
+        )
+
+    def get_user_ids(self, options) -> list:
+        if options["all"]:
+            return list(User.objects.order_by("pk").values_list("pk", flat=True))
+
+        since = timezone.now() - timedelta(hours=options["hours"])
+        notified = Notification.objects.filter(created_at__gte=since).values_list(
+            "recipient", flat=True
+        )
+        messaged = ThreadSummary.objects.filter(
+            last_activity_at__gte=since
+        ).values_list("owner", flat=True)
+        return sorted(set(notified) | set(messaged))
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        batch_size = options["batch_size"]
+        user_ids = self.get_user_ids(options)
+
+        for start in range(0, len(user_ids), batch_size):
+            BadgeService.reconcile(user_ids[start : start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Reconciled the badges of {len(user_ids)} users")
+        )
@@ -0,0 +1,80 @@
+import json
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+from django.utils import timezone
+
+from core.models import Task
+from core.services.tasks import TaskWorker
+
+# Seconds between two purges of the finished tasks
+PURGE_INTERVAL = 60 * 60
+
+
+class Command(BaseCommand):
+    help = "Runs the queued background tasks"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--concurrency",
+            default=4,
+            type=int,
+            help="The number of tasks run at the same time",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            default=1.0,
+            type=float,
+            help="Seconds to wait when there's no task due",
+        )
+        parser.add_argument(
+            "--lock-timeout",
+            default=300,
+            type=int,
+            help="Seconds after which a running task is considered lost and re-run",
+        )
+        parser.add_argument(
+            "--keep-days",
+            default=7,
+            type=int,
+            help="Days the finished tasks are kept for",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the due tasks, then exit",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Print the task metrics, then exit",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        if options["stats"]:
+            self.stdout.write(json.dumps(Task.objects.metrics(), indent=2))
+            return
+
+        worker = TaskWorker(options["concurrency"], options["lock_timeout"])
+
+        if options["once"]:
+            count = 0
+            while ran := worker.run_once():
+                count += ran
+            self.stdout.write(self.style.SUCCESS(f"✅ Ran {count} tasks"))
+            return
+
+        self.stdout.write(f"Running tasks with {options['concurrency']} threads")
+        purged_at = 0.0
+        while True:
+            if time.monotonic() - purged_at > PURGE_INTERVAL:
+                Task.objects.purge(
+                    timezone.now() - timedelta(days=options["keep_days"])
+                )
+                purged_at = time.monotonic()
+
+            if not worker.run_once():
+                time.sleep(options["poll_interval"])
@@ -39,6 +39,22 @@ class Command(BaseCommand):
         categories_seeding()
         sys.stdout.write("✅ Database seeding applied successfully\n")
 
+        # Backfill the jobs full-text search index
+        argv = ["manage.py", "rebuild_job_search_index"]
+        execute_from_command_line(argv)
+
+        # Backfill the normalized skills of jobs and talents
+        argv = ["manage.py", "rebuild_skill_index"]
+        execute_from_command_line(argv)
+
+        # Precompute the talent/job relevance scores
+        argv = ["manage.py", "refresh_job_relevance", "--full"]
+        execute_from_command_line(argv)
+
+        # Backfill the messaging inbox summaries
+        argv = ["manage.py", "rebuild_thread_summaries"]
+        execute_from_command_line(argv)
+
         # Create superuser
         argv = ["manage.py", "superadmin"]
         execute_from_command_line(argv)
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.2 on 2026-10-18 13:27
+
+from django.db import migrations, models
+
+
+def backfill_rollups(apps, schema_editor):
+    from core.services.dashboard import DashboardRollupService
+
+    DashboardRollupService.rebuild(registry=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_task"),
+        ("contracts", "0004_initial"),
+        ("projects", "0001_initial"),
+        ("proposals", "0003_proposal_proposal_talent_job_idx"),
+        ("reviews", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DashboardMonthlyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("profile_id", models.CharField(max_length=100)),
+                ("metric", models.CharField(max_length=50)),
+                ("year", models.PositiveSmallIntegerField()),
+                ("month", models.PositiveSmallIntegerField()),
+                ("total", models.FloatField(default=0)),
+                ("count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="dashboardmonthlyrollup",
+            constraint=models.UniqueConstraint(
+                fields=("profile_id", "metric", "year", "month"),
+                name="dashboard_rollup_unique",
+            ),
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
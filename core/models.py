@@ -1,5 +1,11 @@
+import re
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any
+
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 
 class Waitlist(models.Model):
@@ -67,3 +73,257 @@ class Category(models.Model):
 
     def __str__(self) -> str:
         return self.name
+
+
+class SkillManager(models.Manager):
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Returns the lookup key of a skill name e.g ' Django  REST ' -> 'django rest'"""
+        return re.sub(r"\s+", " ", str(name or "")).strip().lower()[:100]
+
+    @staticmethod
+    def parse(value: Any) -> list[str]:
+        """Extracts skill names from a comma-separated string, a list or a dict"""
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split(",")
+        elif isinstance(value, dict):
+            value = value.values()
+        return [str(name).strip() for name in value if str(name or "").strip()]
+
+    def keys(self, value: Any) -> list[str]:
+        keys = [self.normalize(name) for name in self.parse(value)]
+        return list(dict.fromkeys(key for key in keys if key))
+
+    def resolve(self, names: Iterable[str]) -> dict[str, "Skill"]:
+        """Returns the skills of the given names keyed by slug, creating the missing ones"""
+
+        names_by_key = {}
+        for name in names:
+            key = self.normalize(name)
+            if key:
+                names_by_key.setdefault(key, name.strip()[:100])
+
+        if not names_by_key:
+            return {}
+
+        skills = {
+            skill.slug: skill for skill in self.filter(slug__in=names_by_key.keys())
+        }
+        missing = [
+            self.model(name=name, slug=key)
+            for key, name in names_by_key.items()
+            if key not in skills
+        ]
+
+        if missing:
+            self.bulk_create(missing, ignore_conflicts=True)
+            skills.update(
+                {
+                    skill.slug: skill
+                    for skill in self.filter(slug__in=[s.slug for s in missing])
+                }
+            )
+        return skills
+
+    def sync(
+        self, through: type[models.Model], owner_field: str, values: dict[Any, Any]
+    ) -> None:
+        """
+        Brings the through-table rows of each owner in line with its raw skills value.
+        `values` maps an owner's primary key to its raw skills (string, list or dict).
+        """
+
+        if not values:
+            return
+
+        owner_column = f"{owner_field}_id"
+        names = {pk: self.parse(value) for pk, value in values.items()}
+        skills = self.resolve(name for _names in names.values() for name in _names)
+
+        existing: dict[Any, set[int]] = {pk: set() for pk in values}
+        for owner_id, skill_id in through.objects.filter(  # type: ignore
+            **{f"{owner_column}__in": values.keys()}
+        ).values_list(owner_column, "skill_id"):
+            existing[owner_id].add(skill_id)
+
+        created, removed = [], []
+        for pk, _names in names.items():
+            wanted = {skills[self.normalize(name)].pk for name in _names}
+            created.extend(
+                through(**{owner_column: pk, "skill_id": skill_id})
+                for skill_id in wanted - existing[pk]
+            )
+            removed.extend((pk, skill_id) for skill_id in existing[pk] - wanted)
+
+        if removed:
+            query = models.Q()
+            for pk, skill_id in removed:
+                query |= models.Q(**{owner_column: pk, "skill_id": skill_id})
+            through.objects.filter(query).delete()  # type: ignore
+
+        if created:
+            through.objects.bulk_create(created, ignore_conflicts=True)  # type: ignore
+
+
+class Skill(models.Model):
+    """A normalized skill/tag shared by jobs and talents"""
+
+    name = models.CharField(max_length=100)
+    slug = models.CharField(max_length=100, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = SkillManager()
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class TaskStatusChoices(models.TextChoices):
+    PENDING = "PENDING", "Pending"
+    RUNNING = "RUNNING", "Running"
+    DONE = "DONE", "Done"
+    FAILED = "FAILED", "Failed"
+
+
+class TaskManager(models.Manager):
+
+    def claim(self, limit: int, lock_timeout: int) -> list["Task"]:
+        """
+        Locks up to `limit` due tasks for the calling worker. Tasks left running
+        for more than `lock_timeout` seconds (their worker died) are claimed again.
+        """
+
+        now = timezone.now()
+        stale = now - timedelta(seconds=lock_timeout)
+        due = models.Q(status=TaskStatusChoices.PENDING, run_at__lte=now) | models.Q(
+            status=TaskStatusChoices.RUNNING, locked_at__lt=stale
+        )
+
+        with transaction.atomic():
+            tasks = list(
+                self.select_for_update(skip_locked=True)
+                .filter(due)
+                .order_by("run_at", "pk")[:limit]
+            )
+            if tasks:
+                self.filter(pk__in=[task.pk for task in tasks]).update(
+                    status=TaskStatusChoices.RUNNING,
+                    locked_at=now,
+                    attempts=models.F("attempts") + 1,
+                )
+        for task in tasks:
+            task.status = TaskStatusChoices.RUNNING
+            task.locked_at = now
+            task.attempts += 1
+        return tasks
+
+    def purge(self, before) -> int:
+        """Deletes the finished tasks older than `before`"""
+        return self.filter(
+            status__in=[TaskStatusChoices.DONE, TaskStatusChoices.FAILED],
+            finished_at__lt=before,
+        ).delete()[0]
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Counts the tasks of each name by status, with their average duration"""
+
+        metrics: dict[str, dict[str, Any]] = {}
+        rows = self.values("name", "status").annotate(
+            count=models.Count("pk"), duration_ms=models.Avg("duration_ms")
+        )
+        for row in rows.order_by("name", "status"):
+            entry = metrics.setdefault(row["name"], {"avg_duration_ms": None})
+            entry[row["status"]] = row["count"]
+            if row["status"] == TaskStatusChoices.DONE:
+                entry["avg_duration_ms"] = row["duration_ms"]
+        return metrics
+
+
+class Task(models.Model):
+    """A unit of background work, run by the `run_tasks` worker"""
+
+    name = models.CharField(max_length=255)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=TaskStatusChoices.choices,
+        default=TaskStatusChoices.PENDING,
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    last_error = models.TextField(blank=True, default="")
+
+    run_at = models.DateTimeField()
+    locked_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TaskManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "run_at"])]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
+
+
+class DashboardMonthlyRollupManager(models.Manager):
+
+    def window(self, profile_id, metrics, year: int, month: int, months: int = 12):
+        """The rows of the `months` months up to (and including) year/month"""
+
+        start_year, start_month = divmod(year * 12 + month - months, 12)
+        return self.filter(
+            models.Q(year=year, month__lte=month)
+            | models.Q(year=start_year, month__gt=start_month),
+            profile_id=str(profile_id),
+            metric__in=metrics,
+        )
+
+    def totals(self, profile_id, metrics, year: int | None = None) -> dict:
+        """The sum of each metric's months, optionally within a year"""
+
+        queryset = self.filter(profile_id=str(profile_id), metric__in=metrics)
+        if year:
+            queryset = queryset.filter(year=year)
+        rows = (
+            queryset.values("metric")
+            .annotate(total=models.Sum("total"), count=models.Sum("count"))
+            .order_by()
+        )
+        return {row["metric"]: row for row in rows}
+
+
+class DashboardMonthlyRollup(models.Model):
+    """
+    The total and count of a dashboard metric (e.g. a client's spending) over
+    a month, kept by the DashboardRollupService.
+    """
+
+    profile_id = models.CharField(max_length=100)
+    metric = models.CharField(max_length=50)
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+
+    total = models.FloatField(default=0)
+    count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = DashboardMonthlyRollupManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["profile_id", "metric", "year", "month"],
+                name="dashboard_rollup_unique",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.metric} {self.year}-{self.month:02d} ({self.profile_id})"
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 
 def application_environment(request=None):
@@ -6,6 +7,13 @@ def application_environment(request=None):
     Return the application environment variables to be used in the templates
     """
 
+    return dict(read_application_environment())
+
+
+@lru_cache(maxsize=1)
+def read_application_environment() -> dict:
+    """The environment doesn't change while running, it's read once"""
+
     return {
         "DEBUG": os.getenv("DEBUG"),
         "BASE_URL": os.getenv("BASE_URL"),
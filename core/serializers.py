@@ -1,3 +1,12 @@
+from collections.abc import Callable
+from functools import cached_property
+from operator import attrgetter
+
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+
 class MergeSerializer:
     """
     A utility class for merging a serializer-instance with serializer_data
@@ -23,3 +32,99 @@ class MergeSerializer:
             payload[field] = getattr(instance, field)
 
         return cls(instance=instance, data=payload, **kwargs)
+
+
+def _to_str(value):
+    return value if type(value) is str else str(value)
+
+
+def _to_int(value):
+    return value if type(value) is int else int(value)
+
+
+def _to_float(value):
+    return value if type(value) is float else float(value)
+
+
+def _identity(value):
+    return value
+
+
+def _same_instance(instance):
+    return instance
+
+
+class CompiledSerializerMixin:
+    """
+    A faster `to_representation` for read-heavy serializers, mixed in before
+    the (Model)Serializer base.
+
+    The readable fields are compiled once per serializer instance (so once per
+    list) into a plan of attribute getters and converters: plain model fields
+    are read with `attrgetter` and converted by their type, anything else goes
+    through the DRF field. The output is the same as the DRF serializer's, a
+    `{"compiled": False}` context falls back to it (see `benchmark_serializers`).
+    """
+
+    def to_representation(self, instance):
+        if not self.context.get("compiled", True):  # type: ignore
+            return super().to_representation(instance)  # type: ignore
+
+        data = {}
+        for name, getter, converter in self._field_plan:
+            try:
+                attribute = getter(instance)
+            except SkipField:
+                continue
+
+            if attribute is None or (
+                isinstance(attribute, PKOnlyObject) and attribute.pk is None
+            ):
+                data[name] = None
+            else:
+                data[name] = converter(attribute)
+        return data
+
+    @cached_property
+    def _field_plan(self) -> list[tuple[str, Callable, Callable]]:
+        model = getattr(getattr(self, "Meta", None), "model", None)
+        concrete = set()
+        if model is not None:
+            concrete = {
+                field.name
+                for field in model._meta.concrete_fields
+                if not field.is_relation
+            }
+
+        plan = []
+        for field in self.fields.values():  # type: ignore
+            if field.write_only:
+                continue
+
+            getter = field.get_attribute
+            if isinstance(field, serializers.SerializerMethodField):
+                getter = _same_instance
+            elif len(field.source_attrs) == 1 and field.source_attrs[0] in concrete:
+                getter = attrgetter(field.source_attrs[0])
+
+            plan.append((field.field_name, getter, self._field_converter(field)))
+        return plan
+
+    def _field_converter(self, field) -> Callable:
+        if isinstance(field, serializers.SerializerMethodField):
+            return getattr(self, field.method_name)
+
+        converter = COMPILED_CONVERTERS.get(type(field))
+        if converter is not None:
+            return converter
+        if type(field) is serializers.JSONField and not field.binary:
+            return _identity
+        return field.to_representation
+
+
+# Converters of the field types whose `to_representation` only casts the value
+COMPILED_CONVERTERS: dict[type, Callable] = {
+    serializers.CharField: _to_str,
+    serializers.IntegerField: _to_int,
+    serializers.FloatField: _to_float,
+}
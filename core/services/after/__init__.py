@@ -1,3 +0,0 @@
-from .main import AfterResponseService
-
-__all__ = ["AfterResponseService"]
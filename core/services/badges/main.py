@@ -0,0 +1,87 @@
+from collections.abc import Iterable
+from contextlib import suppress
+from typing import Literal
+
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+BadgeKind = Literal["notifications", "messages"]
+BADGE_KINDS: tuple[BadgeKind, ...] = ("notifications", "messages")
+
+
+def badge_key(user_id, kind: BadgeKind) -> str:
+    return f"badges:{user_id}:{kind}"
+
+
+class BadgeService:
+    """
+    Per-user unread counters kept in the cache tier.
+
+    The counters are moved by the paths creating and reading notifications and
+    messages, a missing counter is recounted from the database on its next read
+    and `reconcile` corrects the ones that drifted.
+    """
+
+    @classmethod
+    def get(cls, user_id) -> dict[str, int]:
+        keys = {kind: badge_key(user_id, kind) for kind in BADGE_KINDS}
+        counters = cache.get_many(keys.values())
+
+        if len(counters) < len(keys):
+            return cls.reconcile([user_id])[user_id]
+        return {kind: max(counters[key], 0) for kind, key in keys.items()}
+
+    @classmethod
+    def increment(cls, user_id, kind: BadgeKind, delta: int = 1) -> None:
+        if not delta:
+            return
+        # Not cached yet (ValueError), it's counted on its next read
+        with suppress(ValueError):
+            cache.incr(badge_key(user_id, kind), delta)
+
+    @classmethod
+    def decrement(cls, user_id, kind: BadgeKind, delta: int = 1) -> None:
+        cls.increment(user_id, kind, -delta)
+
+    @classmethod
+    def count(cls, user_ids: Iterable) -> dict:
+        """Counts the unread notifications and messages of the users"""
+
+        from messaging.models import ThreadSummary
+        from notifications.models import Notification
+
+        user_ids = list(user_ids)
+        counts = {user_id: {kind: 0 for kind in BADGE_KINDS} for user_id in user_ids}
+
+        notifications = (
+            Notification.objects.filter(recipient__in=user_ids, is_seen=False)
+            .values_list("recipient")
+            .annotate(count=Count("id"))
+        )
+        for user_id, count in notifications:
+            counts[user_id]["notifications"] = count
+
+        messages = (
+            ThreadSummary.objects.filter(owner__in=user_ids, unread_count__gt=0)
+            .values_list("owner")
+            .annotate(count=Sum("unread_count"))
+        )
+        for user_id, count in messages:
+            counts[user_id]["messages"] = count
+
+        return counts
+
+    @classmethod
+    def reconcile(cls, user_ids: Iterable) -> dict:
+        """Recounts the counters of the users from the database"""
+
+        counts = cls.count(user_ids)
+        cache.set_many(
+            {
+                badge_key(user_id, kind): value
+                for user_id, badges in counts.items()
+                for kind, value in badges.items()
+            },
+            None,
+        )
+        return counts
@@ -1 +1,2 @@
-from .main import DokoolaCacheService
\ No newline at end of file
+from .main import DokoolaCacheService
+from .response import CachedResponseMixin
@@ -0,0 +1,65 @@
+import time
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from src.settings.logger import LOG_CONFIG
+
+logger = LOG_CONFIG.logger
+
+# How long the in-process cache is used before Redis is tried again
+RETRY_AFTER = 30
+
+
+def _with_fallback(name: str):
+    def method(self, *args, **kwargs):
+        if time.monotonic() >= self._redis_retry_at:
+            try:
+                return getattr(RedisCache, name)(self, *args, **kwargs)
+            except (RedisConnectionError, RedisTimeoutError) as error:
+                self._redis_retry_at = time.monotonic() + self._retry_after
+                logger.warning(
+                    f"Redis cache unavailable, using the local cache: {error}"
+                )
+        return getattr(self._fallback, name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+class RedisFallbackCache(RedisCache):
+    """
+    Redis cache that serves from an in-process LRU cache (LocMemCache)
+    while Redis can't be reached, and tries Redis again after `RETRY_AFTER` seconds.
+    """
+
+    def __init__(self, server, params):
+        params = params.copy()
+        fallback = params.pop("FALLBACK", {})
+        super().__init__(server, params)
+
+        self._retry_after = fallback.get("RETRY_AFTER", RETRY_AFTER)
+        self._redis_retry_at = 0.0
+        self._fallback = LocMemCache(
+            "dokoola-redis-fallback",
+            {
+                "TIMEOUT": self.default_timeout,
+                "KEY_PREFIX": self.key_prefix,
+                "VERSION": self.version,
+                "OPTIONS": fallback.get("OPTIONS", {}),
+            },
+        )
+
+    add = _with_fallback("add")
+    get = _with_fallback("get")
+    set = _with_fallback("set")
+    touch = _with_fallback("touch")
+    delete = _with_fallback("delete")
+    get_many = _with_fallback("get_many")
+    has_key = _with_fallback("has_key")
+    incr = _with_fallback("incr")
+    set_many = _with_fallback("set_many")
+    delete_many = _with_fallback("delete_many")
+    clear = _with_fallback("clear")
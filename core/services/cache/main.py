@@ -1,41 +1,131 @@
-from typing import Any
-import json
+import math
+import random
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
 from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+T = TypeVar("T")
 
-import after_response
+# How long a recompute may hold the lock of a key before it's released
+LOCK_TIMEOUT = 30
 
-@after_response.enable
-def set_cache(key:str, value:Any, stringify=False):
-    try:
-        if stringify and not isinstance(value, str):
-            value = json.dumps(value)
-    except:
-        pass
-    cache.set(key, value)
+# How long a caller waits for another worker's recompute before doing it itself
+LOCK_WAIT = 5
+LOCK_POLL_INTERVAL = 0.05
 
 
 class DokoolaCacheService:
-    """Service for managing and executing callbacks after HTTP response"""
+    """
+    Thin wrapper over the configured cache (Redis or the in-process fallback).
+    Values are pickled by the backend, no JSON round trip is needed.
+    """
 
     @classmethod
-    def set(cls, key: str, value: Any, stringify=True) -> None:
-        set_cache.after_response(key, value, stringify)
+    def set(cls, key: str, value: Any, timeout: Any = DEFAULT_TIMEOUT) -> None:
+        cache.set(key, value, timeout)
 
     @classmethod
-    def get(cls, key: str, default: Any=None, is_json=True) -> Any | None:
-        data = cache.get(key, default=default)
-
-        try:
-            if is_json and isinstance(data, str):
-                data = json.loads(data)     
-        except:
-            pass
-
-        return data
+    def get(cls, key: str, default: Any = None) -> Any | None:
+        return cache.get(key, default=default)
 
     @classmethod
     def delete(cls, key: str) -> None:
         cache.delete(key)
 
+    @classmethod
+    def delete_many(cls, keys: list[str]) -> None:
+        cache.delete_many(keys)
+
+    @classmethod
+    def get_versions(cls, keys: list[str]) -> list[int]:
+        """Returns the current value of each version counter"""
+
+        versions = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # Seeded from the clock, so an evicted counter never goes back
+                # to a value an old cache entry was stored under
+                cache.add(key, time.time_ns() // 1000, None)
+                versions[key] = cache.get(key, 0)
+        return [versions[key] for key in keys]
+
+    @classmethod
+    def bump_version(cls, key: str) -> None:
+        """Invalidates every entry stored under the current version of `key`"""
+
+        if cache.add(key, time.time_ns() // 1000, None):
+            return
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns() // 1000, None)
+
+    @classmethod
+    def get_or_compute(
+        cls,
+        key: str,
+        compute: Callable[[], T],
+        timeout: int | None = None,
+        beta: float = 1.0,
+        cacheable: Callable[[T], bool] | None = None,
+    ) -> T:
+        """
+        Returns the cached value of `key`, calling `compute` on a miss.
+        Computed values `cacheable` rejects are returned without being stored.
+
+        Hot keys are protected from stampedes in two ways:
+        - an entry is refreshed a little before it expires, with a probability
+          growing as the expiry gets closer and the compute gets slower (XFetch),
+        - only the caller holding the key's lock recomputes it, the others keep
+          serving the current value or wait for the lock holder's result.
+        """
+
+        if timeout is None:
+            timeout = cache.default_timeout
+        lifetime = math.inf if timeout is None else timeout
+
+        entry = cache.get(key)
+        if entry is not None and not cls._should_refresh(entry, beta):
+            return entry["value"]
+
+        lock_key = f"{key}:lock"
+        if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+            if entry is not None:
+                return entry["value"]
+
+            deadline = time.monotonic() + LOCK_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL_INTERVAL)
+                entry = cache.get(key)
+                if entry is not None:
+                    return entry["value"]
+
+            return compute()
+
+        try:
+            started = time.monotonic()
+            value = compute()
+            if cacheable is None or cacheable(value):
+                entry = {
+                    "value": value,
+                    "delta": time.monotonic() - started,
+                    "expires": time.time() + lifetime,
+                }
+                cache.set(key, entry, timeout)
+        finally:
+            cache.delete(lock_key)
+
+        return value
+
+    @staticmethod
+    def _should_refresh(entry: dict, beta: float) -> bool:
+        # -log(U) is exponentially distributed, an early refresh becomes likely
+        # once the remaining lifetime is within a few compute times
+        gap = entry["delta"] * beta * -math.log(1 - random.random())
+        return time.time() + gap >= entry["expires"]
+
 
 __all__ = ["DokoolaCacheService"]
@@ -0,0 +1,74 @@
+from hashlib import md5
+from urllib.parse import urlencode
+
+from rest_framework.response import Response
+
+from .main import DokoolaCacheService
+
+
+class CachedResponseMixin:
+    """
+    Caches the successful GET responses of a DRF view.
+
+    A response is keyed by the request path, its query params, the audience of
+    the request and the current value of the view's version counters.
+    Bumping one of the counters invalidates every response built on it.
+    Responses are built through `DokoolaCacheService.get_or_compute`, so
+    concurrent misses of a key build it once.
+    """
+
+    cache_timeout = 60 * 5
+    cache_prefix = "cached-response"
+
+    # Whether authenticated users get responses of their own,
+    # otherwise they are shared by everyone with the same role
+    cache_per_user = True
+
+    def get_cache_versions(self) -> list[str]:
+        return []
+
+    def should_cache(self, request) -> bool:
+        return True
+
+    def get_cache_audience(self, request) -> str:
+        user = request.user
+        if not user or not user.is_authenticated:
+            return "guest"
+
+        role = "talent" if user.is_talent else "client" if user.is_client else "user"
+        if self.cache_per_user:
+            return f"{role}:{user.pk}"
+        return role
+
+    def get_response_cache_key(self, request) -> str:
+        versions = DokoolaCacheService.get_versions(self.get_cache_versions())
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+
+        path = f"{request.get_host()}{request.path}"
+        parts = [path, query, self.get_cache_audience(request), *versions]
+        digest = md5(":".join(map(str, parts)).encode()).hexdigest()
+        return f"{self.cache_prefix}:{self.__class__.__name__}:{digest}"
+
+    def get(self, request, *args, **kwargs):
+        if not self.should_cache(request):
+            return super().get(request, *args, **kwargs)  # type: ignore
+
+        key = self.get_response_cache_key(request)
+        get_response = super().get  # type: ignore
+        response = None
+
+        def compute():
+            nonlocal response
+            response = get_response(request, *args, **kwargs)
+            return response.data if response.status_code == 200 else None
+
+        data = DokoolaCacheService.get_or_compute(
+            key, compute, self.cache_timeout, cacheable=lambda data: data is not None
+        )
+        # The response built by this request, which may not be a success
+        if response is not None:
+            return response
+        return Response(data)
+
+
+__all__ = ["CachedResponseMixin"]
@@ -0,0 +1,13 @@
+from .main import (
+    CLIENT_ACCEPTED_PROJECTS,
+    CLIENT_PENDING_PROJECTS,
+    CLIENT_PROJECT_METRICS,
+    CLIENT_PROJECTS,
+    CLIENT_REVIEWS,
+    TALENT_COMPLETED_CONTRACTS,
+    TALENT_CONTRACT_METRICS,
+    TALENT_CONTRACTS,
+    TALENT_REVIEWS,
+    DashboardRollups,
+    DashboardRollupService,
+)
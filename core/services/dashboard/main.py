@@ -0,0 +1,323 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from core.models import DashboardMonthlyRollup
+from core.services.tasks import TaskQueue
+from projects.models.project import ProjectStatusChoices
+
+# Client metrics, keyed by the client's id
+CLIENT_PROJECTS = "client_projects"
+CLIENT_ACCEPTED_PROJECTS = "client_accepted_projects"
+CLIENT_PENDING_PROJECTS = "client_pending_projects"
+CLIENT_REVIEWS = "client_reviews"
+
+# Talent metrics, keyed by the talent's id
+TALENT_CONTRACTS = "talent_contracts"
+TALENT_COMPLETED_CONTRACTS = "talent_completed_contracts"
+TALENT_REVIEWS = "talent_reviews"
+
+CLIENT_PROJECT_METRICS = [
+    CLIENT_PROJECTS,
+    CLIENT_ACCEPTED_PROJECTS,
+    CLIENT_PENDING_PROJECTS,
+]
+TALENT_CONTRACT_METRICS = [TALENT_CONTRACTS, TALENT_COMPLETED_CONTRACTS]
+
+
+class RollupMetric:
+    """
+    Where a metric is computed from: the rows of `model` belonging to the
+    profile at `profile`, bucketed by the month of `date` and summing `value`.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        profile: str,
+        date: str,
+        value: str,
+        condition: models.Q | None = None,
+    ):
+        self.model = model
+        self.profile = profile
+        self.date = date
+        self.value = value
+        self.condition = condition
+
+    def queryset(self, registry=apps) -> models.QuerySet:
+        queryset = registry.get_model(self.model).objects.filter(
+            **{f"{self.profile}__isnull": False, f"{self.date}__isnull": False}
+        )
+        if self.condition is not None:
+            queryset = queryset.filter(self.condition)
+        return queryset
+
+    def months(self, queryset: models.QuerySet) -> models.QuerySet:
+        """The total and count of each profile's months"""
+
+        return (
+            queryset.annotate(
+                rollup_profile=models.F(self.profile),
+                rollup_period=TruncMonth(self.date),
+            )
+            .values("rollup_profile", "rollup_period")
+            .annotate(
+                total=models.Sum(self.value),
+                count=models.Count("pk", distinct=True),
+            )
+            .order_by()
+        )
+
+
+ROLLUP_METRICS: dict[str, RollupMetric] = {
+    CLIENT_PROJECTS: RollupMetric(
+        "projects.Project",
+        "contract__client_id",
+        "created_at",
+        "contract__proposal__budget",
+    ),
+    CLIENT_ACCEPTED_PROJECTS: RollupMetric(
+        "projects.Project",
+        "contract__client_id",
+        "created_at",
+        "contract__proposal__budget",
+        models.Q(status=ProjectStatusChoices.ACCEPTED),
+    ),
+    CLIENT_PENDING_PROJECTS: RollupMetric(
+        "projects.Project",
+        "contract__client_id",
+        "created_at",
+        "contract__proposal__budget",
+        models.Q(
+            status__in=[ProjectStatusChoices.PENDING, ProjectStatusChoices.COMPLETED]
+        ),
+    ),
+    CLIENT_REVIEWS: RollupMetric(
+        "reviews.Review", "client__id", "created_at", "rating"
+    ),
+    TALENT_CONTRACTS: RollupMetric(
+        "contracts.Contract", "talent_id", "created_at", "proposal__budget"
+    ),
+    TALENT_COMPLETED_CONTRACTS: RollupMetric(
+        "contracts.Contract", "talent_id", "completed_at", "proposal__budget"
+    ),
+    TALENT_REVIEWS: RollupMetric(
+        "reviews.Review", "talent_reviews__id", "created_at", "rating"
+    ),
+}
+
+
+def rollup_period(date: datetime) -> tuple[int, int]:
+    date = timezone.localtime(date) if timezone.is_aware(date) else date
+    return date.year, date.month
+
+
+def previous_period(year: int, month: int) -> tuple[int, int]:
+    return (year, month - 1) if month > 1 else (year - 1, 12)
+
+
+class DashboardRollups:
+    """The rollup rows of a profile's dashboard, read with two queries"""
+
+    def __init__(
+        self,
+        profile_id,
+        metrics: list[str],
+        year: int,
+        month: int,
+        total_year: int | None = None,
+    ):
+        self.year = year
+        self.month = month
+
+        self.rows: dict[tuple[str, int, int], DashboardMonthlyRollup] = {
+            (row.metric, row.year, row.month): row
+            for row in DashboardMonthlyRollup.objects.window(
+                profile_id, metrics, year, month
+            )
+        }
+        self.totals = DashboardMonthlyRollup.objects.totals(
+            profile_id, metrics, total_year
+        )
+
+    def get(self, metric: str, year: int, month: int):
+        return self.rows.get((metric, year, month))
+
+    def this_month(self, metric: str):
+        return self.get(metric, self.year, self.month)
+
+    def last_month(self, metric: str):
+        return self.get(metric, *previous_period(self.year, self.month))
+
+    def total(self, metric: str) -> float:
+        return (self.totals.get(metric) or {}).get("total") or 0
+
+    def count(self, metric: str) -> int:
+        return (self.totals.get(metric) or {}).get("count") or 0
+
+    def recent(self, metric: str, limit: int = 6) -> list[DashboardMonthlyRollup]:
+        """The metric's latest months, within the window"""
+
+        rows = [row for (name, *_), row in self.rows.items() if name == metric]
+        rows.sort(key=lambda row: (row.year, row.month), reverse=True)
+        return rows[:limit]
+
+
+class DashboardRollupService:
+    """
+    Month-by-month totals behind the client and talent dashboards.
+
+    The months touched by a saved contract, project or review are recomputed
+    once the transaction commits, and `rebuild` recomputes everything (see the
+    `rebuild_dashboard_rollups` command).
+    """
+
+    @classmethod
+    def schedule(
+        cls,
+        metrics: list[str],
+        profile_id,
+        dates: Iterable[datetime | None] | None = None,
+    ) -> None:
+        """
+        Queues a refresh of the profile's metrics over the months of `dates`,
+        or over all its months when no dates are given.
+        """
+
+        if profile_id is None:
+            return
+
+        periods = None
+        if dates is not None:
+            periods = sorted({rollup_period(date) for date in dates if date})
+            if not periods:
+                return
+
+        transaction.on_commit(
+            lambda: TaskQueue.enqueue(cls.refresh, metrics, str(profile_id), periods)
+        )
+
+    @classmethod
+    def schedule_reviews(
+        cls, metric: str, profiles: str, instance, action: str, reverse: bool, pk_set
+    ) -> None:
+        """
+        Handles the `m2m_changed` signal of a profile's reviews, `profiles` is
+        the name of the profiles on a review (e.g. "client").
+        """
+
+        from reviews.models import Review
+
+        if action not in ("post_add", "post_remove", "pre_clear"):
+            return
+
+        if reverse:
+            # Reviews added to (or removed from) profiles
+            profile_ids = pk_set
+            if action == "pre_clear":
+                profile_ids = getattr(instance, profiles).values_list("pk", flat=True)
+            for profile_id in profile_ids:
+                cls.schedule([metric], profile_id, [instance.created_at])
+            return
+
+        dates = None
+        if action != "pre_clear":
+            dates = Review.objects.filter(pk__in=pk_set).values_list(
+                "created_at", flat=True
+            )
+        cls.schedule([metric], instance.pk, dates)
+
+    @classmethod
+    def refresh(
+        cls,
+        metrics: list[str],
+        profile_id: str,
+        periods: list[tuple[int, int]] | None = None,
+    ) -> None:
+        """Recomputes the profile's metrics over the given months (or all)"""
+
+        for metric in metrics:
+            source = ROLLUP_METRICS[metric]
+            queryset = source.queryset().filter(**{source.profile: profile_id})
+            existing = DashboardMonthlyRollup.objects.filter(
+                profile_id=profile_id, metric=metric
+            )
+
+            if periods is not None:
+                months = models.Q()
+                for year, month in periods:
+                    months |= models.Q(
+                        **{f"{source.date}__year": year, f"{source.date}__month": month}
+                    )
+                queryset = queryset.filter(months)
+                existing = existing.filter(
+                    models.Q(
+                        *[models.Q(year=year, month=month) for year, month in periods],
+                        _connector=models.Q.OR,
+                    )
+                )
+
+            with transaction.atomic():
+                existing.delete()
+                DashboardMonthlyRollup.objects.bulk_create(
+                    cls.build_rows(metric, source.months(queryset))
+                )
+
+    @classmethod
+    def rebuild(
+        cls, metrics: list[str] | None = None, batch_size: int = 1000, registry=apps
+    ) -> int:
+        """
+        Recomputes the metrics of every profile, returns the rows written.
+
+        Migrations pass their historical app `registry`.
+        """
+
+        rollup_model = registry.get_model("core", "DashboardMonthlyRollup")
+        written = 0
+        for metric in metrics or ROLLUP_METRICS:
+            source = ROLLUP_METRICS[metric]
+            with transaction.atomic():
+                rollup_model.objects.filter(metric=metric).delete()
+                rows = cls.build_rows(
+                    metric, source.months(source.queryset(registry)), rollup_model
+                )
+                written += len(
+                    rollup_model.objects.bulk_create(rows, batch_size=batch_size)
+                )
+        return written
+
+    @classmethod
+    def build_rows(
+        cls, metric: str, months, rollup_model=DashboardMonthlyRollup
+    ) -> list[DashboardMonthlyRollup]:
+        rows = []
+        for month in months:
+            year, month_index = rollup_period(month["rollup_period"])
+            rows.append(
+                rollup_model(
+                    profile_id=str(month["rollup_profile"]),
+                    metric=metric,
+                    year=year,
+                    month=month_index,
+                    total=month["total"] or 0,
+                    count=month["count"],
+                )
+            )
+        return rows
+
+    @classmethod
+    def read(
+        cls,
+        profile_id,
+        metrics: list[str],
+        year: int,
+        month: int,
+        total_year: int | None = None,
+    ) -> DashboardRollups:
+        return DashboardRollups(profile_id, metrics, year, month, total_year)
@@ -1,17 +1,34 @@
 import re
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from types import FunctionType
+from typing import Any
 
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
 from django.utils.html import strip_tags
 
-from core.processors.base import email_environment
-from core.services.after.main import AfterResponseService
 from core.services.logger import DokoolaLoggerService
+from core.services.tasks import TaskQueue
 from src.settings.email import EMAIL_HOST_PASSWORD, EMAIL_HOST_USER
 
+from .templates import render_email
+
+# Messages sent over a single SMTP connection
+EMAIL_BATCH_SIZE = 50
+
+# SMTP connections a batched send opens at the same time
+EMAIL_MAX_CONNECTIONS = 2
+
+
+def get_from_email(sender_name: str | None = None) -> str:
+    if sender_name:
+        return f"{sender_name} <{EMAIL_HOST_USER}>"
+    return f"{settings.APPLICATION_NAME} <{EMAIL_HOST_USER}>"
+
 
 def execute_send_mail(
     subject,
@@ -23,10 +40,7 @@ def execute_send_mail(
     callback: FunctionType | None = None,
 ):
 
-    if sender_name:
-        from_email = f"{sender_name} <{EMAIL_HOST_USER}>"
-    else:
-        from_email = f"{settings.APPLICATION_NAME} <{EMAIL_HOST_USER}>"
+    from_email = get_from_email(sender_name)
 
     if not (recipient_list and text):
         log_data = {
@@ -80,6 +94,97 @@ def execute_send_mail(
         return
 
 
+class EmailDeliveryError(Exception):
+    """Some batches of a delivery couldn't be sent, `delivered` holds the others"""
+
+    def __init__(self, delivered: list[dict[str, Any]], errors: list[Exception]):
+        super().__init__(f"{len(errors)} email batch(es) not sent: {errors[0]}")
+        self.delivered = delivered
+        self.errors = errors
+
+
+def send_email_batch(
+    messages: list[EmailMultiAlternatives], fail_silently: bool
+) -> int:
+    """Sends the messages over one SMTP connection, returns how many were sent"""
+
+    recipients = [email for message in messages for email in message.to]
+    try:
+        with get_connection(fail_silently=fail_silently) as connection:
+            sent = connection.send_messages(messages) or 0
+    except Exception as error:
+        log_data = {
+            "event": "email-batch-not-sent",
+            "timestamp": datetime.now(),
+            "recipient_list": recipients,
+            "error": error,
+        }
+        DokoolaLoggerService.critical(log_data, extra=log_data)
+        raise
+
+    log_data = {
+        "event": "email-batch-sent",
+        "timestamp": datetime.now(),
+        "emails": recipients,
+        "sent": sent,
+    }
+    DokoolaLoggerService.info(log_data, extra=log_data)
+    return sent
+
+
+def build_email_message(email: dict[str, Any]) -> EmailMultiAlternatives:
+    message = EmailMultiAlternatives(
+        subject=email["subject"],
+        body=email["text"],
+        from_email=get_from_email(email.get("sender_name")),
+        to=email["recipient_list"],
+    )
+    if email.get("html_message"):
+        message.attach_alternative(email["html_message"], "text/html")
+    return message
+
+
+def deliver_emails(
+    emails: Iterable[dict[str, Any]], fail_silently: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Sends prepared emails (see `EmailService.prepare`) in batches of
+    EMAIL_BATCH_SIZE, each batch over a single SMTP connection.
+
+    At most EMAIL_MAX_CONNECTIONS batches are sent at the same time, the
+    following messages are only built once a connection frees up.
+    Returns the emails sent. When a batch fails, the others are still sent,
+    then EmailDeliveryError is raised with the emails that were.
+    """
+
+    emails = (
+        email for email in emails if email.get("recipient_list") and email.get("text")
+    )
+
+    slots = threading.BoundedSemaphore(EMAIL_MAX_CONNECTIONS)
+    batches = []
+    with ThreadPoolExecutor(max_workers=EMAIL_MAX_CONNECTIONS) as executor:
+        while batch := list(islice(emails, EMAIL_BATCH_SIZE)):
+            # Waits for a free connection
+            slots.acquire()
+            messages = [build_email_message(email) for email in batch]
+            future = executor.submit(send_email_batch, messages, fail_silently)
+            future.add_done_callback(lambda _: slots.release())
+            batches.append((batch, future))
+
+    delivered, errors = [], []
+    for batch, future in batches:
+        try:
+            future.result()
+            delivered.extend(batch)
+        except Exception as error:
+            errors.append(error)
+
+    if errors:
+        raise EmailDeliveryError(delivered, errors)
+    return delivered
+
+
 class EmailService:
     def __init__(self, _fail_silently=False):
         self.fail_silently = _fail_silently
@@ -107,23 +212,84 @@ class EmailService:
             html_template_name: The name of the html template to render.
             html_template_context: The context to pass to the html template.
             execute_now: Whether to send the email immediately.
-                otherwise email is sent after the http-response is sent.
+                otherwise email is sent by the task queue.
         Returns:
             None
 
         """
 
-        html = None
+        prepared = self.prepare(
+            email,
+            subject,
+            text,
+            sender_name=sender_name,
+            html_template_name=html_template_name,
+            html_template_context=html_template_context,
+        )
 
-        # If a template is provided, render it
-        if html_template_name is not None:
+        # If the email is to be sent immediately, send it
+        if execute_now:
+            execute_send_mail(**prepared, fail_silently=self.fail_silently)
+        else:
+            # Otherwise hand it to the task queue
+            TaskQueue.enqueue(
+                execute_send_mail, **prepared, fail_silently=self.fail_silently
+            )
+
+    def send_many(self, emails: Iterable[dict[str, Any]], execute_now=False):
+        """
+        Sends many emails over a few pooled SMTP connections.
+
+        Args:
+            emails: The emails, each one a dict of the `send` arguments
+                (email, subject, text, sender_name, html_template_name...).
+            execute_now: Whether to send the emails immediately.
+                otherwise emails are sent by the task queue.
+                The emails that fail to send are retried by the task queue.
+        Returns:
+            None
+        """
+
+        prepared = [self.prepare(**email) for email in emails]
+        if not prepared:
+            return
+
+        if execute_now:
+            try:
+                deliver_emails(prepared, fail_silently=self.fail_silently)
+                return
+            except EmailDeliveryError as error:
+                # The emails that weren't sent are left to the task queue
+                delivered = {id(email) for email in error.delivered}
+                prepared = [email for email in prepared if id(email) not in delivered]
+
+        # A task per batch, so a failed batch is retried without the others
+        for start in range(0, len(prepared), EMAIL_BATCH_SIZE):
+            TaskQueue.enqueue(
+                deliver_emails,
+                prepared[start : start + EMAIL_BATCH_SIZE],
+                fail_silently=self.fail_silently,
+            )
+
+    def prepare(
+        self,
+        email,
+        subject,
+        text=None,
+        sender_name=None,
+        html_template_name=None,
+        html_template_context=None,
+    ) -> dict[str, Any]:
+        """Renders an email into the arguments of `execute_send_mail`"""
 
-            # Update the context with the email environment
-            context = html_template_context or {}
-            context.update(email_environment())
+        html = None
 
-            # Render the template
-            html = render_to_string(html_template_name, context=context)
+        # If a template is provided, render it and its text counterpart
+        if html_template_name is not None:
+            html, template_text = render_email(
+                html_template_name, html_template_context
+            )
+            text = text or template_text
 
         if not text:
             # Attempt to extract the content from the html element with id "__content"
@@ -133,25 +299,10 @@ class EmailService:
             else:
                 text = strip_tags(html or "").strip()
 
-        # A callback function that sends the email
-        def _callback(subject, text):
-            execute_send_mail(
-                subject,
-                text,
-                html_message=html,
-                sender_name=sender_name,
-                recipient_list=[email],
-                fail_silently=self.fail_silently,
-            )
-
-        # If the email is to be sent immediately, call the callback function
-        if execute_now:
-            _callback(subject, text)
-        else:
-            # Register the callback function to be called after the response is sent
-            # AfterResponseService.register(
-            #     callback,
-            #     subject,
-            #     text,
-            # )
-            _callback(subject, text)
+        return {
+            "subject": subject,
+            "text": text,
+            "html_message": html,
+            "sender_name": sender_name,
+            "recipient_list": [email],
+        }
@@ -0,0 +1,46 @@
+import re
+from functools import cache
+from typing import Any
+
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from core.processors.base import email_environment
+
+
+@cache
+def get_email_template(name: str):
+    """Loads and compiles an email template once per process"""
+    return get_template(name)
+
+
+@cache
+def get_text_template(html_template_name: str):
+    """The plain text template next to an html one (.txt), if there's one"""
+
+    name = re.sub(r"\.html?$", ".txt", html_template_name)
+    if name == html_template_name:
+        return None
+    try:
+        return get_template(name)
+    except TemplateDoesNotExist:
+        return None
+
+
+def render_email(
+    html_template_name: str, context: dict[str, Any] | None = None
+) -> tuple[str, str | None]:
+    """
+    Renders an email template with the application environment.
+    Returns the html and, when the template has a text counterpart, the text.
+    """
+
+    context = {**email_environment(), **(context or {})}
+    html = get_email_template(html_template_name).render(context)
+
+    text_template = get_text_template(html_template_name)
+    if text_template is None:
+        return html, None
+
+    text = re.sub(r"\n{3,}", "\n\n", text_template.render(context)).strip()
+    return html, text
@@ -0,0 +1,3 @@
+from .main import EventService
+
+__all__ = ["EventService"]
@@ -0,0 +1,201 @@
+import asyncio
+import json
+import secrets
+import threading
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.services.logger.main import DokoolaLoggerService
+from src.settings.cache import REDIS_URL
+
+# Seconds a stream ticket can be redeemed for
+EVENTS_TICKET_TIMEOUT = 30
+
+
+def user_channel(user_id) -> str:
+    return f"events:user:{user_id}"
+
+
+def ticket_key(ticket: str) -> str:
+    return f"events:ticket:{ticket}"
+
+
+class LocalSubscription:
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+
+    async def get(self, timeout: float) -> dict | None:
+        """Waits up to `timeout` seconds for the next event"""
+        try:
+            if timeout <= 0:
+                payload = self.queue.get_nowait()
+            else:
+                payload = await asyncio.wait_for(self.queue.get(), timeout)
+        except (asyncio.QueueEmpty, TimeoutError):
+            return None
+        return json.loads(payload)
+
+
+class LocalEventBroker:
+    """Delivers events to the subscribers connected to this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set] = defaultdict(set)
+
+    def publish(self, channel: str, payload: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+
+        for loop, queue in subscribers:
+            # Publishers run in sync code, outside of the subscriber's loop.
+            # RuntimeError: the subscriber's loop is already closed
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(queue.put_nowait, payload)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[LocalSubscription]:
+        queue: asyncio.Queue = asyncio.Queue()
+        entry = (asyncio.get_running_loop(), queue)
+
+        with self._lock:
+            self._subscribers[channel].add(entry)
+        try:
+            yield LocalSubscription(queue)
+        finally:
+            with self._lock:
+                self._subscribers[channel].discard(entry)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+
+class RedisSubscription:
+
+    def __init__(self, pubsub):
+        self.pubsub = pubsub
+
+    async def get(self, timeout: float) -> dict | None:
+        """Waits up to `timeout` seconds for the next event"""
+        message = await self.pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=timeout
+        )
+        if message is None:
+            return None
+        return json.loads(message["data"])
+
+
+class RedisEventBroker:
+    """
+    Delivers events through Redis pub/sub, to the subscribers of every worker.
+    While Redis can't be reached, events only reach the subscribers of this process.
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self.url = url
+        self.client = redis.Redis.from_url(url, socket_timeout=2)
+        self.fallback = LocalEventBroker()
+
+    def publish(self, channel: str, payload: str) -> None:
+        from redis.exceptions import RedisError
+
+        try:
+            self.client.publish(channel, payload)
+        except RedisError:
+            self.fallback.publish(channel, payload)
+            raise
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[RedisSubscription]:
+        from redis import asyncio as aioredis
+        from redis.exceptions import RedisError
+
+        client = aioredis.Redis.from_url(self.url, socket_connect_timeout=2)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+        except RedisError as e:
+            await pubsub.aclose()
+            await client.aclose()
+            DokoolaLoggerService.error(
+                {"event": "EVENT_SUBSCRIBE_FAILED", "error": str(e)}
+            )
+            pubsub = None
+
+        if pubsub is None:
+            async with self.fallback.subscribe(channel) as subscription:
+                yield subscription
+            return
+
+        try:
+            yield RedisSubscription(pubsub)
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+            await client.aclose()
+
+
+class _EventService:
+    """
+    Pushes real-time events to the connected users.
+
+    Events go through Redis pub/sub when Redis is configured, so they reach the
+    users connected to any worker, otherwise only through this process.
+    Events are hints to refresh, a user who isn't connected simply misses them.
+    """
+
+    def __init__(self):
+        self._broker: LocalEventBroker | RedisEventBroker | None = None
+
+    @property
+    def broker(self) -> LocalEventBroker | RedisEventBroker:
+        if self._broker is None:
+            if REDIS_URL:
+                self._broker = RedisEventBroker(REDIS_URL)
+            else:
+                self._broker = LocalEventBroker()
+        return self._broker
+
+    def publish(self, user_id, type: str, data: Any) -> None:
+        """Publishes an event to a user, never failing the caller"""
+
+        payload = json.dumps({"type": type, "data": data}, cls=DjangoJSONEncoder)
+        try:
+            self.broker.publish(user_channel(user_id), payload)
+        except Exception as e:
+            DokoolaLoggerService.error(
+                {"event": "EVENT_PUBLISH_FAILED", "type": type, "error": str(e)}
+            )
+
+    def subscribe(self, user_id):
+        """An async context manager yielding the user's event subscription"""
+        return self.broker.subscribe(user_channel(user_id))
+
+    def create_ticket(self, user_id) -> str:
+        """
+        A single use ticket opening the user's event stream for a few seconds.
+        EventSource can't set headers, the ticket keeps the access token out of URLs
+        """
+
+        ticket = secrets.token_urlsafe(32)
+        cache.set(ticket_key(ticket), user_id, EVENTS_TICKET_TIMEOUT)
+        return ticket
+
+    def redeem_ticket(self, ticket: str):
+        """Returns the id of the ticket's user, once"""
+
+        user_id = cache.get(ticket_key(ticket))
+        # Only the request deleting the ticket gets to use it
+        if user_id is None or not cache.delete(ticket_key(ticket)):
+            return None
+        return user_id
+
+
+EventService = _EventService()
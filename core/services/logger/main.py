@@ -1,17 +1,16 @@
 from typing import Any, Dict, Optional
 
-import after_response
-
-from core.services.after.main import AfterResponseService
+from core.services.tasks import TaskQueue
 from src.settings.logger import LOG_CONFIG
 from utilities.time import utc_datetime
 
 logger = LOG_CONFIG.logger
 
+
 class DokoolaLoggerService:
     """Enhanced logging class with structured logging support"""
 
-    lazy: "DokoolaLazyLoggerService" = None # type: ignore
+    lazy: "DokoolaLazyLoggerService" = None  # type: ignore
 
     @staticmethod
     def __enrich_extras(extras: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -54,14 +53,10 @@ class DokoolaLoggerService:
             log_method = getattr(logger, log_attr.lower())
 
             if _after_response:
-                AfterResponseService.schedule_after(
-                    log_method, message, enriched_extras
-                )
+                TaskQueue.run_in_background(log_method, message, extra=enriched_extras)
                 return
 
-            AfterResponseService.schedule_task(
-                lambda: log_method(message, extra=enriched_extras)
-            )
+            log_method(message, extra=enriched_extras)
 
     @classmethod
     def debug(cls, message: Any, extra: Optional[Dict[str, Any]] = None) -> None:
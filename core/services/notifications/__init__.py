@@ -0,0 +1,3 @@
+from .main import NotificationService
+
+__all__ = ["NotificationService"]
@@ -0,0 +1,110 @@
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.utils.html import strip_tags
+
+from core.services.badges import BadgeService
+from core.services.email.main import EmailDeliveryError, deliver_emails
+from core.services.email.templates import render_email
+from core.services.events import EventService
+from core.services.tasks import TaskQueue
+from core.services.tasks.main import TASK_RETRY_DELAY
+from notifications.models import Notification
+from notifications.serializer import NotificationSerializer
+
+NOTIFICATION_EMAIL_TEMPLATE = "emails/default.html"
+
+
+class NotificationService:
+    """
+    Creates notifications in batches and dispatches them to their recipients:
+    unread badges and real-time events once the transaction commits, and emails
+    (for the notifications not `is_emailed` yet) through the task queue.
+    """
+
+    @classmethod
+    def fan_out(cls, batch: Iterable[Notification]) -> list[Notification]:
+        """Inserts a batch of unsaved notifications at once and dispatches them"""
+
+        notifications = Notification.objects.bulk_create(list(batch))
+        cls.dispatch(notifications)
+        return notifications
+
+    @classmethod
+    def dispatch(cls, notifications: list[Notification]) -> None:
+        unseen = Counter(n.recipient_id for n in notifications if not n.is_seen)  # type: ignore
+        events = [
+            (n.recipient_id, NotificationSerializer(n).data)  # type: ignore
+            for n in notifications
+        ]
+        unsent = [n.pk for n in notifications if not n.is_emailed]
+
+        def deliver():
+            for recipient_id, count in unseen.items():
+                BadgeService.increment(recipient_id, "notifications", count)
+            for recipient_id, data in events:
+                EventService.publish(recipient_id, "notification", data)
+            if unsent:
+                TaskQueue.enqueue(cls.send_emails, unsent)
+
+        transaction.on_commit(deliver)
+
+    @classmethod
+    def send_emails(cls, notification_ids: list[int]) -> None:
+        """
+        Emails the given notifications over pooled SMTP connections,
+        rendering the template once per distinct content.
+        """
+
+        notifications = Notification.objects.filter(
+            pk__in=notification_ids, is_emailed=False
+        ).select_related("recipient")
+
+        recipients: dict[tuple[str, str], list[Notification]] = defaultdict(list)
+        for notification in notifications:
+            content = strip_tags(notification.content_text or "")
+            recipients[(notification.hint_text, content)].append(notification)
+
+        if not recipients:
+            return
+
+        def emails():
+            for (subject, content), group in recipients.items():
+                html, text = render_email(
+                    NOTIFICATION_EMAIL_TEMPLATE, {"content": content}
+                )
+                for notification in group:
+                    yield {
+                        "subject": subject,
+                        "text": text or content,
+                        "html_message": html,
+                        "recipient_list": [notification.recipient.email],
+                        "notification_id": notification.pk,
+                    }
+
+        def mark_emailed(delivered) -> set[int]:
+            ids = {email["notification_id"] for email in delivered}
+            Notification.objects.filter(pk__in=ids).update(is_emailed=True)
+            return ids
+
+        try:
+            delivered = deliver_emails(emails())
+        except EmailDeliveryError as error:
+            if not error.delivered:
+                # Nothing went out, the task queue retries the whole task
+                raise
+
+            # Raising would roll back the marks of the emails that went out,
+            # the others are retried by a task of their own instead
+            emailed = mark_emailed(error.delivered)
+            unsent = [
+                notification.pk
+                for group in recipients.values()
+                for notification in group
+                if notification.pk not in emailed
+            ]
+            TaskQueue.enqueue(cls.send_emails, unsent, delay=TASK_RETRY_DELAY)
+            return
+
+        mark_emailed(delivered)
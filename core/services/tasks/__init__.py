@@ -0,0 +1,3 @@
+from .main import TaskQueue, TaskWorker
+
+__all__ = ["TaskQueue", "TaskWorker"]
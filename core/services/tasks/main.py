@@ -0,0 +1,192 @@
+import json
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from importlib import import_module
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.utils import timezone
+
+# Seconds a failed task waits before its next attempt, doubled on each attempt
+TASK_RETRY_DELAY = 30
+
+
+def task_name(func: Callable) -> str:
+    """The importable path of a module level function, or of a class's method"""
+
+    qualname = getattr(func, "__qualname__", "")
+    if not qualname or "<" in qualname:
+        raise ValueError(
+            f"{func!r} can't be queued, tasks must be module level functions "
+            "or methods of module level classes"
+        )
+    return f"{func.__module__}:{qualname}"
+
+
+def resolve_task(name: str) -> Callable:
+    module, qualname = name.split(":", 1)
+    target: Any = import_module(module)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    return target
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=TASK_RETRY_DELAY * 2 ** max(attempts - 1, 0))
+
+
+class InlineTaskBackend:
+    """Runs the tasks right away, for development and tests"""
+
+    def enqueue(self, name, args, kwargs, max_attempts, run_at) -> None:
+        from core.services.logger import DokoolaLoggerService
+
+        try:
+            resolve_task(name)(*args, **kwargs)
+        except Exception as e:
+            DokoolaLoggerService.error(
+                {"event": "TASK_FAILED", "task": name, "error": str(e)}
+            )
+
+
+class DatabaseTaskBackend:
+    """
+    Stores the tasks in the database for the `run_tasks` worker. A task queued
+    inside a transaction only becomes visible when (and if) it commits.
+    """
+
+    def enqueue(self, name, args, kwargs, max_attempts, run_at) -> None:
+        from core.models import Task
+
+        Task.objects.create(
+            name=name,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            run_at=run_at,
+        )
+
+
+TASK_BACKENDS = {
+    "inline": InlineTaskBackend,
+    "database": DatabaseTaskBackend,
+}
+
+
+class _TaskQueue:
+    """
+    Runs work off the request.
+
+    `enqueue` queues a durable task, retried when it fails. Its arguments
+    must be JSON serializable, pass ids rather than model instances.
+    `run_in_background` hands best-effort work (e.g. logging) to a small
+    thread pool of the current process.
+    """
+
+    def __init__(self):
+        self._backend = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = TASK_BACKENDS[settings.TASK_QUEUE_BACKEND]()
+        return self._backend
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.TASK_BACKGROUND_THREADS,
+                thread_name_prefix="dokoola-background",
+            )
+        return self._executor
+
+    def enqueue(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        delay: int = 0,
+        max_attempts: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        name = task_name(func)
+        # Round-tripped so that a task gets the same arguments on every backend
+        args, kwargs = json.loads(json.dumps([args, kwargs], cls=DjangoJSONEncoder))
+        self.backend.enqueue(
+            name,
+            args,
+            kwargs,
+            max_attempts or settings.TASK_MAX_ATTEMPTS,
+            timezone.now() + timedelta(seconds=delay),
+        )
+
+    def run_in_background(
+        self, callback: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        self.executor.submit(callback, *args, **kwargs)
+
+
+class TaskWorker:
+    """Claims due tasks and runs them on `concurrency` threads"""
+
+    def __init__(self, concurrency: int = 4, lock_timeout: int = 300):
+        self.concurrency = concurrency
+        self.lock_timeout = lock_timeout
+
+    def run_once(self) -> int:
+        """Runs a batch of due tasks, returns how many were run"""
+
+        from core.models import Task
+
+        tasks = Task.objects.claim(self.concurrency, self.lock_timeout)
+        if len(tasks) <= 1:
+            for task in tasks:
+                self.run(task)
+            return len(tasks)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(self.run_in_thread, tasks))
+        return len(tasks)
+
+    def run_in_thread(self, task) -> None:
+        try:
+            self.run(task)
+        finally:
+            connections.close_all()
+
+    def run(self, task) -> None:
+        from core.models import Task, TaskStatusChoices
+
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                resolve_task(task.name)(*task.args, **task.kwargs)
+        except Exception:
+            now = timezone.now()
+            failed = task.attempts >= task.max_attempts
+            Task.objects.filter(pk=task.pk).update(
+                status=(
+                    TaskStatusChoices.FAILED if failed else TaskStatusChoices.PENDING
+                ),
+                run_at=now if failed else now + retry_delay(task.attempts),
+                finished_at=now if failed else None,
+                locked_at=None,
+                last_error=traceback.format_exc()[-5000:],
+            )
+            return
+
+        Task.objects.filter(pk=task.pk).update(
+            status=TaskStatusChoices.DONE,
+            finished_at=timezone.now(),
+            locked_at=None,
+            duration_ms=int((time.perf_counter() - started) * 1000),
+        )
+
+
+TaskQueue = _TaskQueue()
@@ -0,0 +1,97 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.services.badges import BadgeService
+from messaging.models import ThreadSummary
+from notifications.models import Notification
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+
+@pytest.fixture
+def users(db):
+    client = User.objects.create(username="client", email="client@mail.com")
+    talent = User.objects.create(
+        username="talent", email="talent@mail.com", is_talent=True
+    )
+    Talent.objects.create(user=talent)
+    return client, talent
+
+
+def badges(api_client, user):
+    api_client.force_authenticate(user=user)
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(reverse("badges"))
+    assert response.status_code == status.HTTP_200_OK
+    return response.data, len(queries)
+
+
+@pytest.mark.django_db
+def test_notification_badges_follow_create_and_seen(
+    api_client, users, django_capture_on_commit_callbacks
+):
+    client, _ = users
+    assert badges(api_client, client)[0] == {"notifications": 0, "messages": 0}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        notifications = [
+            Notification.objects.create(recipient=client, hint_text=str(i))
+            for i in range(3)
+        ]
+
+    data, queries = badges(api_client, client)
+    assert data["notifications"] == 3
+    assert queries == 0
+
+    api_client.put(
+        reverse("notification_mark_seen"),
+        {"ids": [notifications[0].pk, notifications[1].pk]},
+        format="json",
+    )
+    assert badges(api_client, client)[0]["notifications"] == 1
+
+
+@pytest.mark.django_db
+def test_message_badges_follow_send_and_read(
+    api_client, users, django_capture_on_commit_callbacks
+):
+    client, talent = users
+    assert badges(api_client, talent)[0]["messages"] == 0
+
+    api_client.force_authenticate(user=client)
+    with django_capture_on_commit_callbacks(execute=True):
+        for content in ("Hello", "Are you there?"):
+            api_client.post(
+                reverse("m_create"), {"recipient": talent.public_id, "content": content}
+            )
+
+    assert badges(api_client, talent)[0]["messages"] == 2
+
+    summary = ThreadSummary.objects.get(owner=talent)
+    summary.thread.unique_id = summary.unique_id
+    summary.thread.save()
+    api_client.get(reverse("m_list"), {"id": summary.unique_id})
+
+    assert badges(api_client, talent)[0]["messages"] == 0
+
+
+@pytest.mark.django_db
+def test_reconcile_corrects_drifted_counters(users):
+    client, _ = users
+    Notification.objects.create(recipient=client)
+    cache.set(f"badges:{client.pk}:notifications", 42)
+
+    BadgeService.reconcile([client.pk])
+
+    assert BadgeService.get(client.pk)["notifications"] == 1
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+from django.core.cache import cache
+
+from core.services.cache import DokoolaCacheService
+from core.services.cache.backends import RedisFallbackCache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_set_and_get_keep_native_values():
+    DokoolaCacheService.set("job", {"id": 1, "tags": ["python"]})
+
+    assert DokoolaCacheService.get("job") == {"id": 1, "tags": ["python"]}
+
+    DokoolaCacheService.delete("job")
+    assert DokoolaCacheService.get("job", default="missing") == "missing"
+
+
+def test_get_or_compute_computes_once():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [1, 2, 3]
+
+    first = DokoolaCacheService.get_or_compute("numbers", compute, timeout=60)
+    second = DokoolaCacheService.get_or_compute("numbers", compute, timeout=60)
+
+    assert first == second == [1, 2, 3]
+    assert len(calls) == 1
+
+
+def test_get_or_compute_refreshes_before_expiry(monkeypatch):
+    monkeypatch.setattr("core.services.cache.main.random.random", lambda: 0.5)
+    DokoolaCacheService.get_or_compute("stats", lambda: "old", timeout=60)
+    assert DokoolaCacheService.get_or_compute("stats", lambda: "new") == "old"
+
+    # A compute slower than the remaining lifetime is refreshed early
+    entry = cache.get("stats")
+    entry["delta"] = 3600
+    cache.set("stats", entry, 60)
+
+    assert DokoolaCacheService.get_or_compute("stats", lambda: "new") == "new"
+
+
+def test_get_or_compute_serves_stale_value_while_locked():
+    DokoolaCacheService.get_or_compute("stats", lambda: "old", timeout=60)
+    entry = cache.get("stats")
+    entry["expires"] = time.time() - 1
+    cache.set("stats", entry, 60)
+
+    # Another worker is recomputing the key
+    cache.add("stats:lock", 1)
+
+    assert DokoolaCacheService.get_or_compute("stats", lambda: "new") == "old"
+
+
+def test_get_or_compute_skips_values_that_are_not_cacheable():
+    def not_found():
+        return None
+
+    assert DokoolaCacheService.get_or_compute("job", not_found, cacheable=bool) is None
+    assert cache.get("job") is None
+    assert cache.get("job:lock") is None
+
+
+def test_redis_cache_falls_back_to_the_local_cache():
+    unreachable = RedisFallbackCache(
+        "redis://127.0.0.1:1/0",
+        {
+            "KEY_PREFIX": "test",
+            "OPTIONS": {"socket_connect_timeout": 0.1},
+            "FALLBACK": {"RETRY_AFTER": 60},
+        },
+    )
+
+    unreachable.set("job", {"id": 1})
+    assert unreachable.get("job") == {"id": 1}
+    assert unreachable.add("job:views", 1)
+    assert unreachable.incr("job:views") == 2
+
+    # Redis is tried again once the retry delay is over
+    unreachable._redis_retry_at = 0
+    assert unreachable.get("job") == {"id": 1}
+    assert unreachable._redis_retry_at > time.monotonic()
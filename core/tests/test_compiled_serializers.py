@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from rest_framework.utils.encoders import JSONEncoder
+
+from clients.models import Client
+from core.models import Category
+from jobs.models import Job
+from jobs.serializers import JobListSerializer
+from notifications.models import Notification
+from notifications.serializer import NotificationSerializer
+from users.models.user import User
+
+
+def assert_same_representation(serializer_class, instances, **context):
+    compiled = serializer_class(instances, many=True, context=context).data
+    drf = serializer_class(
+        instances, many=True, context={**context, "compiled": False}
+    ).data
+
+    assert compiled == drf
+    assert json.dumps(compiled, cls=JSONEncoder) == json.dumps(drf, cls=JSONEncoder)
+
+
+@pytest.fixture
+def users(db):
+    client_user = User.objects.create(
+        username="client", email="client@mail.com", first_name="Awa", avatar="a.png"
+    )
+    talent_user = User.objects.create(username="talent", email="talent@mail.com")
+    return client_user, talent_user
+
+
+@pytest.mark.django_db
+def test_job_list_serializer(users):
+    client = Client.objects.create(user=users[0], _company={"name": "Kora Ltd"})
+    category = Category.objects.create(name="Design", slug="design")
+    defaults = {
+        "description": "Job description " * 50,
+        "country": {"name": "Gambia", "code": "GM"},
+        "address": "Serrekunda",
+        "required_skills": ["figma"],
+        "pricing": {"budget": 150.5, "currency": "GMD"},
+        "client": client,
+    }
+    Job.objects.create(title="Logo", category=category, **defaults)
+    Job.objects.create(
+        title="Scraped",
+        is_third_party=True,
+        third_party_metadata={"description": "From the web"},
+        **defaults,
+    )
+
+    jobs = Job.objects.all().for_listing()
+    assert_same_representation(JobListSerializer, jobs)
+    assert_same_representation(JobListSerializer, jobs, mini=True)
+
+
+@pytest.mark.django_db
+def test_notification_serializer(users):
+    client_user, talent_user = users
+    Notification.objects.create(recipient=talent_user, hint_text="Welcome")
+    Notification.objects.create(
+        recipient=talent_user, sender=client_user, hint_text="New message"
+    )
+
+    notifications = Notification.objects.select_related("sender")
+    assert_same_representation(NotificationSerializer, notifications)
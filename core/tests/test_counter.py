@@ -0,0 +1,40 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Category
+from src.features.counter import count_objects
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_exact_counts_are_reused_for_the_same_query():
+    Category.objects.create(name="Design", slug="design")
+    queryset = Category.objects.filter(name__startswith="Des")
+
+    assert count_objects(queryset, estimate_threshold=None) == (1, True)
+
+    with CaptureQueriesContext(connection) as queries:
+        count = count_objects(queryset.order_by("-name"), estimate_threshold=None)
+    assert count == (1, True)
+    assert len(queries) == 0
+
+    assert count_objects(Category.objects.filter(name="Writing")) == (0, True)
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Estimates come from the planner"
+)
+def test_large_counts_are_estimated():
+    Category.objects.create(name="Design", slug="design")
+
+    count = count_objects(Category.objects.all(), estimate_threshold=0)
+
+    assert count.exact is False
+    assert count.value >= 0
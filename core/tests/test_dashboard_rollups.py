@@ -0,0 +1,117 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+
+from clients.models import Client
+from contracts.models import Contract, ContractProgressChoices
+from core.models import DashboardMonthlyRollup
+from core.services.dashboard import (
+    TALENT_COMPLETED_CONTRACTS,
+    TALENT_CONTRACTS,
+    TALENT_REVIEWS,
+    DashboardRollupService,
+)
+from jobs.models import Job
+from proposals.models import Proposal
+from reviews.models import Review
+from talents.models import Talent
+from users.models.user import User
+
+
+def rollups() -> set:
+    return set(
+        DashboardMonthlyRollup.objects.values_list(
+            "metric", "year", "month", "total", "count"
+        )
+    )
+
+
+@pytest.fixture
+def contract(db):
+    client = Client.objects.create(
+        user=User.objects.create(username="client", email="client@mail.com")
+    )
+    talent = Talent.objects.create(
+        user=User.objects.create(username="talent", email="talent@mail.com")
+    )
+    job = Job.objects.create(
+        title="Logo design",
+        description="Job description",
+        country={"name": "Gambia", "code": "GM"},
+        address="Serrekunda",
+        required_skills=[],
+        client=client,
+    )
+    proposal = Proposal.objects.create(
+        job=job, talent=talent, cover_letter="Hi", budget=250
+    )
+    return Contract.objects.create(
+        job=job, client=client, proposal=proposal, talent=talent
+    )
+
+
+@pytest.mark.django_db
+def test_rollups_follow_contracts_and_reviews(
+    contract, django_capture_on_commit_callbacks
+):
+    now = timezone.localtime()
+    talent = contract.talent
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Contract.objects.filter(pk=contract.pk).update(
+            completed_at=now, progress=ContractProgressChoices.COMPLETED
+        )
+        contract.refresh_from_db()
+        contract.save()
+        talent.reviews.add(Review.objects.create(author=contract.client.user))
+
+    assert rollups() == {
+        (TALENT_CONTRACTS, now.year, now.month, 250, 1),
+        (TALENT_COMPLETED_CONTRACTS, now.year, now.month, 250, 1),
+        (TALENT_REVIEWS, now.year, now.month, 5, 1),
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        talent.reviews.clear()
+        contract.delete()
+
+    assert rollups() == set()
+
+
+@pytest.mark.django_db
+def test_rebuild_recomputes_every_month(contract):
+    earlier = timezone.now() - timedelta(days=400)
+    Contract.objects.filter(pk=contract.pk).update(created_at=earlier)
+    DashboardMonthlyRollup.objects.all().delete()
+
+    assert DashboardRollupService.rebuild([TALENT_CONTRACTS]) == 1
+
+    earlier = timezone.localtime(earlier)
+    assert rollups() == {(TALENT_CONTRACTS, earlier.year, earlier.month, 250, 1)}
+
+    now = timezone.localtime()
+    dashboard = DashboardRollupService.read(
+        contract.talent_id, [TALENT_CONTRACTS], now.year, now.month
+    )
+    # Outside the 12 months window, yet part of the totals
+    assert dashboard.recent(TALENT_CONTRACTS) == []
+    assert dashboard.total(TALENT_CONTRACTS) == 250
+
+
+@pytest.mark.django_db
+def test_migration_backfills_with_the_historical_models(contract):
+    now = timezone.localtime()
+    Contract.objects.filter(pk=contract.pk).update(completed_at=now)
+    DashboardMonthlyRollup.objects.all().delete()
+    state = MigrationExecutor(connection).loader.project_state(
+        ("core", "0004_dashboardmonthlyrollup")
+    )
+
+    assert DashboardRollupService.rebuild(registry=state.apps) == 2
+    assert rollups() == {
+        (TALENT_CONTRACTS, now.year, now.month, 250, 1),
+        (TALENT_COMPLETED_CONTRACTS, now.year, now.month, 250, 1),
+    }
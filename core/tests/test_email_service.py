@@ -0,0 +1,121 @@
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from core.services.email import EmailService
+from core.services.email import main as email_main
+from core.services.email.templates import (
+    get_email_template,
+    get_text_template,
+    render_email,
+)
+
+
+def prepared_email(index: int) -> dict:
+    return {
+        "subject": "Job Proposal Withdrawn",
+        "text": f"Hello talent {index}",
+        "html_message": f"<p>Hello talent {index}</p>",
+        "recipient_list": [f"talent{index}@mail.com"],
+    }
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    opened = []
+
+    def get_connection(*args, **kwargs):
+        connection = mail.get_connection(*args, **kwargs)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(email_main, "get_connection", get_connection)
+    monkeypatch.setattr(email_main, "EMAIL_BATCH_SIZE", 2)
+    return opened
+
+
+def test_deliver_emails_reuses_a_connection_per_batch(connections, mailoutbox):
+    sent = email_main.deliver_emails(prepared_email(index) for index in range(5))
+
+    assert len(sent) == 5
+    assert len(connections) == 3
+    assert sorted(message.to[0] for message in mailoutbox) == [
+        f"talent{index}@mail.com" for index in range(5)
+    ]
+    assert mailoutbox[0].alternatives[0][1] == "text/html"
+
+
+def test_deliver_emails_skips_emails_without_recipient(connections, mailoutbox):
+    emails = [prepared_email(0), {**prepared_email(1), "recipient_list": []}]
+
+    assert email_main.deliver_emails(emails) == [prepared_email(0)]
+    assert [message.to for message in mailoutbox] == [["talent0@mail.com"]]
+
+
+def test_deliver_emails_reports_the_batches_that_failed(monkeypatch, mailoutbox):
+    monkeypatch.setattr(email_main, "EMAIL_BATCH_SIZE", 2)
+    send_messages = EmailBackend.send_messages
+
+    def fail_for_talent2(connection, messages):
+        if any(message.to == ["talent2@mail.com"] for message in messages):
+            raise ConnectionError("SMTP server unavailable")
+        return send_messages(connection, messages)
+
+    monkeypatch.setattr(EmailBackend, "send_messages", fail_for_talent2)
+
+    with pytest.raises(email_main.EmailDeliveryError) as error:
+        email_main.deliver_emails(prepared_email(index) for index in range(5))
+
+    delivered = [email["recipient_list"][0] for email in error.value.delivered]
+    assert delivered == ["talent0@mail.com", "talent1@mail.com", "talent4@mail.com"]
+    assert sorted(message.to[0] for message in mailoutbox) == delivered
+
+
+def test_send_many_renders_and_sends_every_email(connections, mailoutbox):
+    EmailService().send_many(
+        [
+            {
+                "email": f"talent{index}@mail.com",
+                "subject": "Welcome",
+                "html_template_name": "emails/default.html",
+                "html_template_context": {"content": "Welcome to Dokoola"},
+            }
+            for index in range(3)
+        ],
+        execute_now=True,
+    )
+
+    assert len(mailoutbox) == 3
+    assert len(connections) == 2
+    assert all("Welcome to Dokoola" in message.body for message in mailoutbox)
+
+
+def test_render_email_renders_the_text_template_unescaped():
+    html, text = render_email(
+        "emails/default.html", {"content": "Tom & Jerry's <b>job</b>"}
+    )
+
+    assert "Tom &amp; Jerry" in html
+    assert text.startswith("Tom & Jerry's <b>job</b>\n")
+    assert "\n\n\n" not in text
+
+
+def test_email_templates_are_compiled_once():
+    assert get_email_template("emails/default.html") is get_email_template(
+        "emails/default.html"
+    )
+    assert get_text_template("emails/default.html") is not None
+    assert get_text_template("emails/jobs/proposal_declined.html") is None
+
+
+def test_prepare_uses_the_text_template():
+    email = EmailService().prepare(
+        "talent@mail.com",
+        "Welcome",
+        html_template_name="emails/waitlist.html",
+        html_template_context={"name": "Jane"},
+    )
+
+    assert email["text"].startswith("Welcome to Dokoola!\n\nHey Jane,")
+    assert "<" not in email["text"]
+    assert "<p" in email["html_message"]
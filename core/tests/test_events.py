@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from redis.exceptions import RedisError
+from rest_framework.test import APIClient
+
+from core import views
+from core.services.events import EventService
+from core.services.events.main import (
+    LocalEventBroker,
+    RedisEventBroker,
+    user_channel,
+)
+from notifications.models import Notification
+from users.models.user import User
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create(
+        username="talent", email="talent@mail.com", is_active=True
+    )
+
+
+def test_local_broker_delivers_to_channel_subscribers():
+    broker = LocalEventBroker()
+
+    async def scenario():
+        async with broker.subscribe("a") as first, broker.subscribe("b") as second:
+            broker.publish("a", '{"type": "message", "data": 1}')
+            assert await first.get(1) == {"type": "message", "data": 1}
+            assert await second.get(0) is None
+        # Nothing is delivered once unsubscribed
+        assert broker._subscribers == {}
+
+    asyncio.run(scenario())
+
+
+def test_redis_broker_falls_back_to_this_process():
+    broker = RedisEventBroker("redis://127.0.0.1:1/0")
+
+    async def scenario():
+        async with broker.subscribe("a") as subscription:
+            with pytest.raises(RedisError):
+                broker.publish("a", '{"type": "message", "data": 1}')
+            assert await subscription.get(1) == {"type": "message", "data": 1}
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_long_poll_returns_published_events(user, monkeypatch):
+    monkeypatch.setattr(views, "EVENTS_POLL_TIMEOUT", 5)
+    monkeypatch.setattr(EventService, "_broker", LocalEventBroker())
+    ticket = EventService.create_ticket(user.pk)
+
+    def publish():
+        # Waits for the request to subscribe
+        while user_channel(user.pk) not in EventService.broker._subscribers:
+            time.sleep(0.01)
+        EventService.publish(user.pk, "message", {"content": "Hi"})
+
+    publisher = threading.Thread(target=publish)
+    publisher.start()
+    response = asyncio.run(
+        AsyncClient().get(reverse("events"), {"poll": 1, "ticket": ticket})
+    )
+    publisher.join()
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "events": [{"type": "message", "data": {"content": "Hi"}}]
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_pushes_new_notifications(user, monkeypatch):
+    monkeypatch.setattr(views, "EVENTS_HEARTBEAT", 0.1)
+    ticket = EventService.create_ticket(user.pk)
+
+    async def scenario():
+        response = await AsyncClient().get(reverse("events"), {"ticket": ticket})
+        assert response["Content-Type"] == "text/event-stream"
+
+        chunks = aiter(response.streaming_content)
+        assert await anext(chunks) == b"retry: 3000\n\n"
+
+        threading.Timer(
+            0.2,
+            Notification.objects.create,
+            kwargs={"recipient": user, "hint_text": "New proposal"},
+        ).start()
+
+        while (chunk := await anext(chunks)) == b": keep-alive\n\n":
+            continue
+        await chunks.aclose()
+        return chunk.decode()
+
+    event = asyncio.run(scenario())
+    assert event.startswith("event: notification\ndata: ")
+    assert '"hint_text": "New proposal"' in event
+
+
+@pytest.mark.django_db(transaction=True)
+def test_events_require_authentication():
+    response = asyncio.run(
+        AsyncClient().get(reverse("events"), {"poll": 1, "ticket": "invalid"})
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_stream_tickets_are_issued_to_users_and_used_once(user):
+    api_client = APIClient()
+    assert api_client.post(reverse("events_ticket")).status_code == 401
+
+    api_client.force_authenticate(user=user)
+    response = api_client.post(reverse("events_ticket"))
+    assert response.status_code == 201
+
+    ticket = response.data["ticket"]
+    assert EventService.redeem_ticket(ticket) == user.pk
+    assert EventService.redeem_ticket(ticket) is None
+
+
+@pytest.mark.django_db
+def test_events_are_not_served_over_wsgi(user):
+    ticket = EventService.create_ticket(user.pk)
+
+    response = Client().get(reverse("events"), {"poll": 1, "ticket": ticket})
+    assert response.status_code == 503
@@ -0,0 +1,125 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.services.badges import BadgeService
+from core.services.email import main as email_main
+from core.services.notifications import NotificationService
+from core.services.notifications import main as notifications_main
+from core.services.tasks import TaskQueue
+from notifications.models import Notification
+from users.models.user import User
+
+
+@pytest.fixture
+def users(db):
+    cache.clear()
+    client = User.objects.create(username="client", email="client@mail.com")
+    talent = User.objects.create(username="talent", email="talent@mail.com")
+    return client, talent
+
+
+@pytest.mark.django_db
+def test_fan_out_inserts_the_batch_at_once(users, django_capture_on_commit_callbacks):
+    client, talent = users
+    BadgeService.reconcile([client.pk, talent.pk])
+
+    batch = [
+        Notification(recipient=talent, hint_text="Project Completed"),
+        Notification(recipient=talent, hint_text="Project Awaiting Review"),
+        Notification(recipient=client, sender=talent, hint_text="Project Completed"),
+    ]
+    with (
+        django_capture_on_commit_callbacks(execute=True),
+        CaptureQueriesContext(connection) as queries,
+    ):
+        notifications = NotificationService.fan_out(batch)
+
+    inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 1
+    assert all(notification.pk for notification in notifications)
+
+    assert BadgeService.get(talent.pk)["notifications"] == 2
+    assert BadgeService.get(client.pk)["notifications"] == 1
+
+
+@pytest.mark.django_db
+def test_send_emails_groups_recipients_of_the_same_content(users, mailoutbox):
+    client, talent = users
+    notifications = Notification.objects.bulk_create(
+        [
+            Notification(
+                recipient=user,
+                hint_text="Welcome",
+                content_text="<strong>Welcome</strong> to Dokoola",
+                is_emailed=False,
+            )
+            for user in (client, talent)
+        ]
+        + [Notification(recipient=talent, hint_text="Emailed already")]
+    )
+
+    NotificationService.send_emails([n.pk for n in notifications])
+
+    assert sorted(mail.to[0] for mail in mailoutbox) == [
+        "client@mail.com",
+        "talent@mail.com",
+    ]
+    assert all(mail.subject == "Welcome" for mail in mailoutbox)
+    assert all(mail.body.startswith("Welcome to Dokoola\n") for mail in mailoutbox)
+    assert all("<strong>" not in mail.body for mail in mailoutbox)
+    assert not Notification.objects.filter(is_emailed=False).exists()
+
+    # Emails are only sent once
+    NotificationService.send_emails([n.pk for n in notifications])
+    assert len(mailoutbox) == 2
+
+
+@pytest.mark.django_db
+def test_send_emails_leaves_failed_notifications_unsent(users, monkeypatch):
+    def unavailable(*args, **kwargs):
+        raise ConnectionError("SMTP server unavailable")
+
+    monkeypatch.setattr(email_main, "get_connection", unavailable)
+    notification = Notification.objects.create(
+        recipient=users[1], hint_text="Welcome", is_emailed=False
+    )
+
+    with pytest.raises(email_main.EmailDeliveryError):
+        NotificationService.send_emails([notification.pk])
+
+    notification.refresh_from_db()
+    assert notification.is_emailed is False
+
+
+@pytest.mark.django_db
+def test_send_emails_retries_only_the_failed_notifications(users, monkeypatch):
+    client, talent = users
+    delivered, failed = Notification.objects.bulk_create(
+        [
+            Notification(recipient=user, hint_text="Welcome", is_emailed=False)
+            for user in (client, talent)
+        ]
+    )
+
+    def partly_fails(emails):
+        emails = list(emails)
+        raise email_main.EmailDeliveryError(
+            [e for e in emails if e["notification_id"] == delivered.pk],
+            [ConnectionError("SMTP server unavailable")],
+        )
+
+    enqueued = []
+    monkeypatch.setattr(notifications_main, "deliver_emails", partly_fails)
+    monkeypatch.setattr(
+        TaskQueue, "enqueue", lambda func, *args, **kwargs: enqueued.append(args)
+    )
+
+    NotificationService.send_emails([delivered.pk, failed.pk])
+
+    delivered.refresh_from_db()
+    failed.refresh_from_db()
+    assert delivered.is_emailed is True
+    assert failed.is_emailed is False
+    assert enqueued == [([failed.pk],)]
@@ -0,0 +1,117 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from notifications.models import Notification
+from src.features.paginator import DokoolaPaginator, EstimatedCountPaginator
+from users.models.user import User
+
+
+class SmallPaginator(DokoolaPaginator):
+    page_size = 2
+
+
+class SmallEstimatedCountPaginator(EstimatedCountPaginator):
+    page_size = 2
+
+
+def paginate(params: dict, ordering=("-created_at",), paginator_class=SmallPaginator):
+    request = Request(APIRequestFactory().get("/notifications/", params))
+    paginator = paginator_class()
+    queryset = Notification.objects.order_by(*ordering)
+    rows = paginator.paginate_queryset(queryset, request)
+    return rows, paginator.get_paginated_response([row.pk for row in rows]).data
+
+
+def cursor_of(link: str) -> str:
+    return parse_qs(urlparse(link).query)["cursor"][0]
+
+
+@pytest.fixture
+def notifications(db):
+    cache.clear()
+    user = User.objects.create(username="user", email="user@mail.com")
+    # Created in one go, so several of them share a timestamp
+    return Notification.objects.bulk_create(
+        [Notification(recipient=user, hint_text=str(i)) for i in range(5)]
+    )
+
+
+@pytest.mark.django_db
+def test_cursor_pages_walk_every_object_once(notifications):
+    expected = list(Notification.objects.order_by("-created_at", "-pk"))
+
+    seen = []
+    rows, data = paginate({"cursor": ""})
+    seen += rows
+    while data["links"]["next"]:
+        rows, data = paginate({"cursor": cursor_of(data["links"]["next"])})
+        seen += rows
+
+    assert seen == expected
+    assert data["objects_count"] is None
+
+    # Walks back from the last page
+    rows, data = paginate({"cursor": cursor_of(data["links"]["prev"])})
+    assert rows == expected[2:4]
+
+
+@pytest.mark.django_db
+def test_cursor_pages_skip_the_count_unless_asked(notifications):
+    with CaptureQueriesContext(connection) as queries:
+        paginate({"cursor": ""})
+    assert not any("COUNT(" in query["sql"] for query in queries)
+
+    _, data = paginate({"cursor": "", "with_count": "1"})
+    assert data["objects_count"] == 5
+    assert data["pages_count"] == 3
+
+
+@pytest.mark.django_db
+def test_page_numbers_are_kept_by_default(notifications):
+    _, data = paginate({"page": 2})
+
+    assert data["page_index"] == 2
+    assert data["objects_count"] == 5
+    assert data["objects_count_exact"] is True
+
+
+@pytest.mark.django_db
+def test_listings_not_sorted_by_a_timestamp_stay_on_page_numbers(notifications):
+    rows, data = paginate({"cursor": ""}, ordering=("-hint_text", "-created_at"))
+
+    assert [row.hint_text for row in rows] == ["4", "3"]
+    assert data["page_index"] == 1
+    assert data["objects_count"] == 5
+
+
+@pytest.mark.django_db
+def test_a_stale_count_does_not_hide_pages(notifications):
+    def estimated(params):
+        return paginate(params, paginator_class=SmallEstimatedCountPaginator)
+
+    assert estimated({"page": 1})[1]["objects_count"] == 5
+    Notification.objects.bulk_create(
+        [Notification(recipient=notifications[0].recipient, hint_text="new")] * 3
+    )
+
+    # The count is cached, the pages past it are still served
+    rows, data = estimated({"page": 3})
+    assert data["objects_count"] == 5
+    assert data["links"]["next"] is not None
+
+    rows, data = estimated({"page": 4})
+    assert len(rows) == 2
+    assert data["links"]["next"] is None
+
+    with pytest.raises(NotFound):
+        estimated({"page": 5})
+
+    # Listings that aren't expensive count exactly
+    assert paginate({"page": 4})[1]["objects_count"] == 8
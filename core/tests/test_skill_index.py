@@ -0,0 +1,113 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from core.models import Category, Skill
+from jobs.models import Job, JobSkill, JobStatusChoices
+from talents.models import Talent, TalentSkill
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def client_profile(db):
+    user = User.objects.create(
+        username="client", email="client@mail.com", is_active=True, is_client=True
+    )
+    return Client.objects.create(user=user)
+
+
+@pytest.fixture
+def category(db):
+    return Category.objects.create(name="Development", slug="development")
+
+
+def create_talent(username, skills):
+    user = User.objects.create(
+        username=username, email=f"{username}@mail.com", is_active=True
+    )
+    return Talent.objects.create(user=user, skills=skills)
+
+
+def create_job(client, category, title, required_skills):
+    return Job.objects.create(
+        title=title,
+        description="Job description",
+        country={"name": "Gambia"},
+        required_skills=required_skills,
+        published=True,
+        status=JobStatusChoices.PUBLISHED,
+        client=client,
+        category=category,
+    )
+
+
+def skill_slugs(through, **filters):
+    return set(through.objects.filter(**filters).values_list("skill__slug", flat=True))
+
+
+@pytest.mark.django_db
+def test_skills_are_normalized_and_shared():
+    talent = create_talent("talent", " Python ,django  REST,python, ")
+
+    assert skill_slugs(TalentSkill, talent=talent) == {"python", "django rest"}
+    assert Skill.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_skills_follow_job_and_talent_updates(client_profile, category):
+    job = create_job(client_profile, category, "Backend", ["Python", "SQL"])
+    talent = create_talent("talent", "Python, Go")
+
+    job.required_skills = ["SQL", "Docker"]
+    job.save()
+    talent.skills = "Rust"
+    talent.save()
+
+    assert skill_slugs(JobSkill, job=job) == {"sql", "docker"}
+    assert skill_slugs(TalentSkill, talent=talent) == {"rust"}
+
+
+@pytest.mark.django_db
+def test_job_search_filters_by_indexed_skills(api_client, client_profile, category):
+    create_job(client_profile, category, "Backend", ["Python", "SQL"])
+    create_job(client_profile, category, "Frontend", ["JavaScript"])
+
+    response = api_client.get(reverse("job_searching"), {"skills": "sql, go"})
+
+    assert response.status_code == 200
+    assert [job["title"] for job in response.data["payload"]] == ["Backend"]
+
+
+@pytest.mark.django_db
+def test_talent_search_matches_skill_substrings(api_client):
+    create_talent("pythonista", "Python, Django")
+    create_talent("frontend", "JavaScript")
+    create_talent("designer", "Figma")
+
+    response = api_client.get(reverse("talent_route_noparam"), {"query": "pyth"})
+    assert response.status_code == 200
+    assert len(response.data["payload"]) == 1
+
+    response = api_client.get(reverse("talent_route_noparam"), {"query": "Script"})
+    assert response.status_code == 200
+    assert len(response.data["payload"]) == 1
+
+
+@pytest.mark.django_db
+def test_rebuild_command_backfills_skills(client_profile, category):
+    job = create_job(client_profile, category, "Backend", ["Python"])
+    talent = create_talent("talent", "Go")
+    JobSkill.objects.all().delete()
+    TalentSkill.objects.all().delete()
+
+    call_command("rebuild_skill_index")
+
+    assert skill_slugs(JobSkill, job=job) == {"python"}
+    assert skill_slugs(TalentSkill, talent=talent) == {"go"}
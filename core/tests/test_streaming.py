@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+import pytest
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.test import APIClient, APIRequestFactory
+
+from clients.models import Client
+from core.admin.actions import export_as_json
+from jobs.models import Job
+from notifications.models import Notification
+from notifications.serializer import NotificationSerializer
+from proposals.models import Attachment, Proposal
+from src.features.streaming import StreamingJSONResponse, stream_json
+from talents.models import Talent
+from users.models.user import User
+
+
+def read_json(response) -> list:
+    return json.loads(b"".join(response.streaming_content))
+
+
+async def aread_json(response) -> list:
+    return json.loads(b"".join([chunk async for chunk in response.streaming_content]))
+
+
+@pytest.fixture
+def proposals(db):
+    client_user = User.objects.create(
+        username="client", email="client@mail.com", is_active=True, is_client=True
+    )
+    client = Client.objects.create(user=client_user)
+    other_client = Client.objects.create(
+        user=User.objects.create(username="other", email="other@mail.com")
+    )
+
+    job_fields = {
+        "description": "Job description",
+        "country": {"name": "Gambia", "code": "GM"},
+        "required_skills": [],
+    }
+    job = Job.objects.create(title="Logo", client=client, **job_fields)
+    other_job = Job.objects.create(title="Site", client=other_client, **job_fields)
+
+    for index in range(5):
+        user = User.objects.create(
+            username=f"talent{index}", email=f"t{index}@mail.com"
+        )
+        talent = Talent.objects.create(user=user)
+        proposal = Proposal.objects.create(
+            job=job if index < 4 else other_job, talent=talent, cover_letter="Hi"
+        )
+        proposal.attachments.add(
+            Attachment.objects.create(name="cv.pdf", file_url="https://cdn/cv.pdf")
+        )
+    return client_user
+
+
+@pytest.mark.django_db
+def test_stream_json_matches_the_serializer_output():
+    user = User.objects.create(username="user", email="user@mail.com")
+    Notification.objects.bulk_create(
+        [Notification(recipient=user, hint_text=f"Hint {i}") for i in range(5)]
+    )
+    queryset = Notification.objects.order_by("pk")
+
+    chunks = list(stream_json(queryset, NotificationSerializer, chunk_size=2))
+
+    # The brackets, then one piece per chunk of rows
+    assert len(chunks) == 5
+    expected = NotificationSerializer(queryset, many=True).data
+    assert json.loads(b"".join(chunks)) == json.loads(json.dumps(expected))
+    assert b"".join(stream_json([], NotificationSerializer)) == b"[]"
+
+
+def test_asgi_stream_reads_the_rows_chunk_by_chunk():
+    class RowSerializer(serializers.Serializer):
+        value = serializers.IntegerField()
+
+    read = []
+
+    def rows():
+        for value in range(5):
+            read.append(value)
+            yield {"value": value}
+
+    response = StreamingJSONResponse(
+        rows(), RowSerializer, chunk_size=2, asynchronous=True
+    )
+
+    async def scenario():
+        chunks = aiter(response.streaming_content)
+        assert await anext(chunks) == b"["
+        assert await anext(chunks) == b'{"value":0},{"value":1}'
+        # Only the rows of the chunk sent so far were read
+        assert read == [0, 1]
+        return b"".join([b"[", b'{"value":0},{"value":1}'] + [c async for c in chunks])
+
+    assert response.is_async
+    assert json.loads(asyncio.run(scenario())) == [{"value": v} for v in range(5)]
+
+
+@pytest.mark.django_db
+def test_proposals_of_a_client_are_streamed(proposals):
+    api_client = APIClient()
+    api_client.force_authenticate(user=proposals)
+    url = reverse("proposals_list")
+    public_id = proposals.client_profile.public_id
+
+    response = api_client.get(url, {"u": public_id})
+    assert response.data["objects_count"] == 4
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url, {"u": public_id, "stream": 1})
+        rows = read_json(response)
+
+    assert response.streaming
+    assert len(rows) == 4
+    assert all(row["attachments"][0]["name"] == "cv.pdf" for row in rows)
+    # The profile, the proposals and their attachments, not a query per row
+    assert len(queries) == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_proposals_are_streamed_asynchronously_over_asgi(proposals):
+    public_id = proposals.client_profile.public_id
+
+    async def scenario():
+        client = AsyncClient()
+        await client.aforce_login(proposals)
+        response = await client.get(
+            reverse("proposals_list"), {"u": public_id, "stream": 1}
+        )
+        assert response.is_async
+        return await aread_json(response)
+
+    rows = asyncio.run(scenario())
+    assert len(rows) == 4
+    assert all(row["attachments"][0]["name"] == "cv.pdf" for row in rows)
+
+
+@pytest.mark.django_db
+def test_admin_export_streams_the_selected_rows(proposals):
+    request = APIRequestFactory().post("/admin/")
+    response = export_as_json(site._registry[Proposal], request, Proposal.objects.all())
+
+    assert isinstance(response, StreamingJSONResponse)
+    assert response["Content-Disposition"] == 'attachment; filename="proposals.json"'
+    rows = read_json(response)
+    assert len(rows) == 5
+    assert all(len(row["attachments"]) == 1 for row in rows)
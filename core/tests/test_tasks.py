@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from core.models import Task, TaskStatusChoices
+from core.services.tasks import TaskQueue, TaskWorker
+from core.services.tasks.main import DatabaseTaskBackend
+
+RECORDED = []
+
+
+def record(value, label=""):
+    RECORDED.append((value, label))
+
+
+def explode():
+    raise RuntimeError("SMTP server unavailable")
+
+
+@pytest.fixture
+def database_queue(db, monkeypatch):
+    RECORDED.clear()
+    monkeypatch.setattr(TaskQueue, "_backend", DatabaseTaskBackend())
+    return TaskQueue
+
+
+@pytest.mark.django_db
+def test_queued_tasks_are_run_by_the_worker(database_queue):
+    database_queue.enqueue(record, 1, label="first")
+    database_queue.enqueue(record, 2)
+
+    assert RECORDED == []
+    assert TaskWorker(concurrency=1).run_once() == 1
+    assert TaskWorker(concurrency=1).run_once() == 1
+    assert TaskWorker(concurrency=1).run_once() == 0
+
+    assert RECORDED == [(1, "first"), (2, "")]
+    assert Task.objects.filter(status=TaskStatusChoices.DONE).count() == 2
+    assert Task.objects.metrics()["core.tests.test_tasks:record"]["DONE"] == 2
+
+
+@pytest.mark.django_db
+def test_failing_tasks_are_retried_then_failed(database_queue):
+    database_queue.enqueue(explode, max_attempts=2)
+    worker = TaskWorker()
+
+    worker.run_once()
+    task = Task.objects.get()
+    assert (task.status, task.attempts) == (TaskStatusChoices.PENDING, 1)
+    assert task.run_at > timezone.now()
+    assert "SMTP server unavailable" in task.last_error
+
+    # Not due yet
+    assert worker.run_once() == 0
+
+    Task.objects.update(run_at=timezone.now())
+    worker.run_once()
+    task.refresh_from_db()
+    assert (task.status, task.attempts) == (TaskStatusChoices.FAILED, 2)
+
+
+@pytest.mark.django_db
+def test_tasks_of_a_dead_worker_are_run_again(database_queue):
+    database_queue.enqueue(record, 3)
+    Task.objects.update(
+        status=TaskStatusChoices.RUNNING,
+        locked_at=timezone.now() - timedelta(minutes=10),
+    )
+
+    assert TaskWorker(lock_timeout=60).run_once() == 1
+    assert RECORDED == [(3, "")]
+
+
+def test_only_importable_functions_can_be_queued():
+    with pytest.raises(ValueError):
+        TaskQueue.enqueue(lambda: None)
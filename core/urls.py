@@ -20,6 +20,12 @@ urlpatterns = [
         name="categories",
     ),
     path("api/waitlist/", api_views.WaitlistAPIView.as_view(), name="waitlist_api"),
+    path("api/events/", views.events, name="events"),
+    path(
+        "api/events/ticket/",
+        api_views.EventTicketAPIView.as_view(),
+        name="events_ticket",
+    ),
     #
     path("", views.index, name="index"),
 ]
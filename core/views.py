@@ -1,10 +1,24 @@
+import asyncio
+import json
 import os
 
+from asgiref.sync import sync_to_async
 from django.contrib import messages
-from django.http import HttpRequest, HttpResponseRedirect, JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import (
+    HttpRequest,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import redirect, render
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
 
 from core.models import Waitlist
+from core.services.events import EventService
+from users.models.user import User
 
 frontend_url = os.environ.get("FRONTEND_URL")
 
@@ -37,6 +51,92 @@ def health(request: HttpRequest):
         return JsonResponse({"status": "ERROR", "message": str(e)}, status=400)
 
 
+# Seconds between two keep-alive comments of an event stream
+EVENTS_HEARTBEAT = 15
+
+# Seconds before an event stream is closed, the client reconnects right away
+EVENTS_STREAM_LIFETIME = 60 * 5
+
+# Seconds a long-poll request waits for an event
+EVENTS_POLL_TIMEOUT = 25
+
+
+async def get_events_user(request: HttpRequest):
+    """
+    Authenticates an events request with a stream ticket given in the `ticket`
+    param (EventSource can't set headers), an access token given in the
+    Authorization header, or the session
+    """
+
+    ticket = request.GET.get("ticket")
+    if ticket:
+        user_id = await sync_to_async(EventService.redeem_ticket)(ticket)
+        if user_id is None:
+            return None
+        return await User.objects.filter(pk=user_id, is_active=True).afirst()
+
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    raw_token = authentication.get_raw_token(header) if header else None
+
+    if raw_token:
+        try:
+            token = authentication.get_validated_token(raw_token)
+            return await sync_to_async(authentication.get_user)(token)
+        except (InvalidToken, AuthenticationFailed):
+            return None
+
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+def format_event(event: dict) -> str:
+    data = json.dumps(event["data"], cls=DjangoJSONEncoder)
+    return f"event: {event['type']}\ndata: {data}\n\n"
+
+
+async def events(request: HttpRequest):
+    """
+    Pushes the new messages and notifications of the user as Server-Sent Events.
+    With `?poll=1`, the request is answered as soon as an event comes in,
+    or with no events after EVENTS_POLL_TIMEOUT seconds.
+    Only served over ASGI, a WSGI worker would be held for the whole request.
+    """
+
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"message": "Events are only served over ASGI"}, status=503)
+
+    user = await get_events_user(request)
+    if user is None:
+        return JsonResponse({"message": "Authentication required"}, status=401)
+
+    if request.GET.get("poll") in ("1", "true"):
+        async with EventService.subscribe(user.pk) as subscription:
+            received = []
+            event = await subscription.get(EVENTS_POLL_TIMEOUT)
+            while event is not None:
+                received.append(event)
+                event = await subscription.get(0)
+        return JsonResponse({"events": received})
+
+    async def stream():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + EVENTS_STREAM_LIFETIME
+
+        async with EventService.subscribe(user.pk) as subscription:
+            yield "retry: 3000\n\n"
+            while loop.time() < deadline:
+                event = await subscription.get(EVENTS_HEARTBEAT)
+                yield ": keep-alive\n\n" if event is None else format_event(event)
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    # The stream outlives the request, there's nothing meaningful to log
+    response.ignore_logs = True
+    return response
+
+
 def status(request: HttpRequest):
     return JsonResponse(
         {"status": "OK", "message": "Backend Web-server up and running"}
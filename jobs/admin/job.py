@@ -1,6 +1,7 @@
 from django.contrib import admin
 from unfold.admin import ModelAdmin
 
+from core.admin.actions import export_as_json
 from jobs import models
 
 
@@ -15,7 +16,7 @@ class JobModelAdmin(ModelAdmin):
     ]
 
     sortable_by = ["application_deadline", "status", "is_third_party"]
-    actions = ["invalidate_jobs"]
+    actions = ["invalidate_jobs", export_as_json]
     search_fields = ["title", "description"]
 
     def invalidate_jobs(self, request, queryset):
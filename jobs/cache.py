@@ -0,0 +1,26 @@
+from core.services.cache import DokoolaCacheService
+
+# Bumped whenever any job changes, invalidates the job listings
+JOBS_VERSION_KEY = "jobs:version"
+
+
+def job_version_key(public_id: str) -> str:
+    """The version counter of a single job's cached responses"""
+    return f"jobs:version:{public_id}"
+
+
+def invalidate_job_responses(*public_ids: str) -> None:
+    """Invalidates the cached job listings and the given jobs' own responses"""
+
+    DokoolaCacheService.bump_version(JOBS_VERSION_KEY)
+    for public_id in public_ids:
+        if public_id:
+            DokoolaCacheService.bump_version(job_version_key(public_id))
+
+
+def invalidate_job_detail(*public_ids: str) -> None:
+    """Invalidates the given jobs' own responses, leaving the listings cached"""
+
+    for public_id in public_ids:
+        if public_id:
+            DokoolaCacheService.bump_version(job_version_key(public_id))
@@ -0,0 +1,69 @@
+import time
+from typing import Any
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from jobs.views.search import JobsSearchAPIView
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the job search query with and without a blanket DISTINCT, "
+        "printing both query plans and their timings"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "params",
+            nargs="*",
+            help="Search params as key=value, e.g. category=design location=banjul",
+        )
+        parser.add_argument(
+            "--runs",
+            default=20,
+            type=int,
+            help="The number of times each query is run",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE instead of EXPLAIN (PostgreSQL only)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        params = dict(param.split("=", 1) for param in options["params"])
+
+        request = Request(APIRequestFactory().get("/api/jobs/search/", params))
+        request.user = AnonymousUser()
+
+        view = JobsSearchAPIView()
+        view.request = request
+        queryset = view.get_queryset(None)
+
+        explain = {}
+        if options["analyze"] and connection.vendor == "postgresql":
+            explain = {"analyze": True}
+
+        variants = {
+            "DISTINCT": queryset.distinct(),
+            "deduplicated": queryset,
+        }
+        for name, variant in variants.items():
+            page = variant[:15]
+
+            started = time.perf_counter()
+            for _ in range(options["runs"]):
+                list(page)
+                variant.count()
+            elapsed = (time.perf_counter() - started) / options["runs"] * 1000
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{name}"))
+            self.stdout.write(page.explain(**explain))
+            self.stdout.write(
+                self.style.SUCCESS(f"{elapsed:.2f} ms per page fetch and count")
+            )
@@ -0,0 +1,43 @@
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+
+from jobs.models import Job, JobSearchIndex
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the full-text search documents of every job"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            default=500,
+            type=int,
+            help="The number of jobs indexed per batch",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        if not JobSearchIndex.objects.is_supported():
+            self.stdout.write(
+                self.style.WARNING("Job search index is not supported on this database")
+            )
+            return
+
+        batch_size = options["batch_size"]
+        queryset = Job.objects.select_related("category").order_by("pk")
+
+        batch = []
+        indexed = 0
+        for job in queryset.iterator(chunk_size=batch_size):
+            batch.append(job)
+            if len(batch) >= batch_size:
+                JobSearchIndex.objects.index_jobs(batch)
+                indexed += len(batch)
+                batch = []
+
+        if batch:
+            JobSearchIndex.objects.index_jobs(batch)
+            indexed += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Indexed {indexed} jobs"))
@@ -0,0 +1,41 @@
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+
+from jobs.models import JobRelevanceScore
+
+
+class Command(BaseCommand):
+    help = (
+        "Refreshes the precomputed talent/job relevance scores. "
+        "Only the talents and jobs updated since the last refresh are re-scored "
+        "unless --full is given."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recompute every score from scratch",
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=500,
+            type=int,
+            help="The number of talents scored per batch",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        since = None
+        if not options["full"]:
+            since = JobRelevanceScore.objects.last_computed_at()
+
+        written = JobRelevanceScore.objects.refresh(
+            since=since, batch_size=options["batch_size"]
+        )
+
+        mode = f"since {since}" if since else "from scratch"
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Refreshed {written} relevance scores {mode}")
+        )
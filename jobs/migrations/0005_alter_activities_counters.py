@@ -0,0 +1,48 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0004_delete_pricing_alter_activities_bits_count_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="activities",
+            name="bits_count",
+            field=models.IntegerField(db_default=0, default=0),
+        ),
+        migrations.AlterField(
+            model_name="activities",
+            name="hired_count",
+            field=models.IntegerField(db_default=0, default=0),
+        ),
+        migrations.AlterField(
+            model_name="activities",
+            name="interview_count",
+            field=models.IntegerField(db_default=0, default=0),
+        ),
+        migrations.AlterField(
+            model_name="activities",
+            name="invite_count",
+            field=models.IntegerField(db_default=0, default=0),
+        ),
+        migrations.AlterField(
+            model_name="activities",
+            name="proposal_count",
+            field=models.IntegerField(db_default=0, default=0),
+        ),
+        migrations.AlterField(
+            model_name="activities",
+            name="public_id",
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+        migrations.AlterField(
+            model_name="activities",
+            name="unanswered_invites",
+            field=models.IntegerField(db_default=0, default=0),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:26
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+SQLITE_FTS_TABLE = "jobs_jobsearchindex_fts"
+
+
+def create_search_structures(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_jobsearchindex_vector_gin "
+            "ON jobs_jobsearchindex USING GIN (search_vector)"
+        )
+
+    elif vendor == "sqlite":
+        # External content FTS5 table, kept in sync through triggers
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+            "title, document, content='jobs_jobsearchindex', content_rowid='id', "
+            "tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai "
+            "AFTER INSERT ON jobs_jobsearchindex BEGIN "
+            f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, document) "
+            "VALUES (new.id, new.title, new.document); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad "
+            "AFTER DELETE ON jobs_jobsearchindex BEGIN "
+            f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, document) "
+            "VALUES ('delete', old.id, old.title, old.document); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au "
+            "AFTER UPDATE ON jobs_jobsearchindex BEGIN "
+            f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, document) "
+            "VALUES ('delete', old.id, old.title, old.document); "
+            f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, document) "
+            "VALUES (new.id, new.title, new.document); END"
+        )
+
+
+def drop_search_structures(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS jobs_jobsearchindex_vector_gin")
+
+    elif vendor == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0005_alter_activities_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSearchIndex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(blank=True, default="", max_length=200)),
+                ("document", models.TextField(blank=True, default="")),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        blank=True, null=True
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_index",
+                        to="jobs.job",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(create_search_structures, drop_search_structures),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_skill"),
+        ("jobs", "0006_job_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSkill",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_skills",
+                        to="jobs.job",
+                    ),
+                ),
+                (
+                    "skill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_skills",
+                        to="core.skill",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="skill_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="jobs",
+                through="jobs.JobSkill",
+                to="core.skill",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobskill",
+            index=models.Index(
+                fields=["skill", "job"], name="jobs_jobski_skill_i_1a433c_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="jobskill",
+            constraint=models.UniqueConstraint(
+                fields=("job", "skill"), name="unique_job_skill"
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:33
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0007_skill_index"),
+        ("talents", "0004_skill_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobRelevanceScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField(default=0)),
+                ("skill_overlap", models.IntegerField(default=0)),
+                (
+                    "computed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="relevance_scores",
+                        to="jobs.job",
+                    ),
+                ),
+                (
+                    "talent",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="relevance_scores",
+                        to="talents.talent",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["talent", "-score"],
+                        name="jobs_jobrel_talent__f836ed_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="jobrelevancescore",
+            constraint=models.UniqueConstraint(
+                fields=("talent", "job"), name="unique_talent_job_relevance"
+            ),
+        ),
+    ]
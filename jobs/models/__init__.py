@@ -1,4 +1,14 @@
 from .activities import Activities
 from .job import Job, JobStatusChoices
+from .relevance import JobRelevanceScore
+from .search_index import JobSearchIndex
+from .skill import JobSkill
 
-__all__ = ["Job", "Activities", "JobStatusChoices"]
+__all__ = [
+    "Job",
+    "Activities",
+    "JobStatusChoices",
+    "JobSearchIndex",
+    "JobSkill",
+    "JobRelevanceScore",
+]
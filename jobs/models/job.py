@@ -2,6 +2,7 @@ import random
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from clients.models import Client
@@ -34,13 +35,44 @@ class JobTypeChoices(models.TextChoices):
     OTHER = "other"
 
 
-class JobManager(models.manager.BaseManager):
+class JobQuerySet(models.QuerySet):
 
     def valid_only(self):
-        return super().filter(is_valid=True)
+        return self.filter(is_valid=True)
 
-    def filter(self, *args, **kwargs):
-        return super().filter(*args, **kwargs).distinct()
+    def exclude_applied(self, talent):
+        """Excludes the jobs the talent has sent a proposal to"""
+        from proposals.models import Proposal
+
+        proposals = Proposal.objects.filter(talent=talent, job=OuterRef("pk"))
+        return self.exclude(Exists(proposals))
+
+    def joins_many(self) -> bool:
+        """Whether the query joins a to-many relation, which can repeat a job"""
+        for join in self.query.alias_map.values():
+            field = getattr(join, "join_field", None)
+            if field is not None and (field.one_to_many or field.many_to_many):
+                return True
+        return False
+
+    def deduplicated(self):
+        """
+        Applies DISTINCT only when a to-many join can actually repeat a job.
+        A DISTINCT over the wide (JSON) job rows is costly and rules out
+        some index only plans, to-one joins and EXISTS filters don't need it.
+        """
+        return self.distinct() if self.joins_many() else self
+
+    def for_listing(self):
+        """
+        Loads the relations read by JobListSerializer (the client, its user and
+        the category) in the page's query, instead of one query per job.
+        """
+        return self.select_related("category", "client__user")
+
+
+class JobManager(models.Manager.from_queryset(JobQuerySet)):
+    pass
 
 
 class Job(models.Model):
@@ -61,6 +93,9 @@ class Job(models.Model):
     required_skills = models.JSONField(
         encoder=DjangoJSONEncoder, blank=True, null=True, default=dict
     )
+    skill_tags = models.ManyToManyField(
+        "core.Skill", through="JobSkill", related_name="jobs", blank=True
+    )
 
     country = models.JSONField(encoder=DjangoJSONEncoder)
     address = models.CharField(max_length=200, blank=True, null=True)
@@ -116,6 +151,8 @@ class Job(models.Model):
 
     applicant_ids = models.JSONField(null=True, default=list, blank=True)
 
+    objects = JobManager()
+
     def __str__(self):
         return self.title[:50]
 
@@ -168,14 +205,17 @@ class Job(models.Model):
             .exclude(status=ProposalStatusChoices.ACCEPTED)
         )
 
+        emails = []
         for other_proposal in other_proposals:
+            other_proposal.job = self
             other_proposal.status = ProposalStatusChoices.WITHDRAWN
-            other_proposal.notify_talent(
-                ProposalStatusChoices.WITHDRAWN, is_after_response=is_after_response
-            )
+            emails.append(other_proposal.talent_email(ProposalStatusChoices.WITHDRAWN))
 
         Proposal.objects.bulk_update(other_proposals, ["status"])
 
+        # Sent over a few SMTP connections rather than one per proposal
+        EmailService().send_many(emails, execute_now=is_after_response)
+
     def notify_client(self, job_status, proposal=None, new_proposal=None):
         """
         Notify the client about the job status through email
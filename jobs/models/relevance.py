@@ -0,0 +1,253 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from django.db import models, transaction
+from django.db.models import F, OuterRef, Q, Subquery
+from django.utils import timezone
+
+# The share of each signal in a relevance score
+RELEVANCE_WEIGHTS = {
+    "skills": 0.5,
+    "category": 0.15,
+    "location": 0.15,
+    "recency": 0.1,
+    "competition": 0.1,
+}
+
+# A job loses half of its recency weight after this many days
+RECENCY_HALF_LIFE_DAYS = 14
+
+# A job loses half of its competition weight after this many proposals
+COMPETITION_HALF_POINT = 10
+
+
+def relevance_score(
+    skill_overlap: float,
+    category_match: bool,
+    location_match: bool,
+    age_days: float,
+    proposal_count: int,
+) -> float:
+    """Combines the relevance signals of a (talent, job) pair into a 0-100 score"""
+
+    recency = 1 / (1 + max(age_days, 0) / RECENCY_HALF_LIFE_DAYS)
+    competition = 1 / (1 + max(proposal_count, 0) / COMPETITION_HALF_POINT)
+
+    score = (
+        RELEVANCE_WEIGHTS["skills"] * skill_overlap
+        + RELEVANCE_WEIGHTS["category"] * float(category_match)
+        + RELEVANCE_WEIGHTS["location"] * float(location_match)
+        + RELEVANCE_WEIGHTS["recency"] * recency
+        + RELEVANCE_WEIGHTS["competition"] * competition
+    )
+    return round(score * 100, 4)
+
+
+class JobRelevanceScoreManager(models.Manager):
+
+    def rank(self, queryset: models.QuerySet, talent) -> models.QuerySet:
+        """Annotates a Job queryset with the talent's `relevance_score`"""
+        scores = self.filter(talent=talent, job=OuterRef("pk")).values("score")
+        return queryset.annotate(relevance_score=Subquery(scores[:1]))
+
+    def active_jobs(self) -> models.QuerySet:
+        from .job import Job, JobStatusChoices
+
+        return Job.objects.filter(
+            is_valid=True, published=True, status=JobStatusChoices.PUBLISHED
+        )
+
+    def refresh(self, since: datetime | None = None, batch_size: int = 500) -> int:
+        """
+        Recomputes the scores of the talents and jobs updated after `since`,
+        or every score when `since` is None. Returns the number of scores written.
+
+        The old scores are replaced in one transaction, readers keep them until
+        the new ones are committed and a failed refresh leaves them in place.
+        """
+
+        with transaction.atomic():
+            return self._refresh(since, batch_size)
+
+    def _refresh(self, since: datetime | None, batch_size: int) -> int:
+        from talents.models import Talent, TalentSkill
+
+        from .job import Job
+        from .skill import JobSkill
+
+        computed_at = timezone.now()
+        active_jobs = self.active_jobs()
+
+        if since is None:
+            self.all().delete()
+            talent_ids = list(Talent.objects.values_list("pk", flat=True))
+            return self._compute(talent_ids, active_jobs, computed_at, batch_size)
+
+        talent_ids = list(
+            Talent.objects.filter(updated_at__gt=since).values_list("pk", flat=True)
+        )
+        job_ids = list(
+            Job.objects.filter(updated_at__gt=since).values_list("pk", flat=True)
+        )
+
+        self.filter(Q(talent_id__in=talent_ids) | Q(job_id__in=job_ids)).delete()
+
+        written = self._compute(talent_ids, active_jobs, computed_at, batch_size)
+
+        # The other talents are only re-scored against the updated jobs
+        changed_jobs = active_jobs.filter(pk__in=job_ids)
+        other_talent_ids = list(
+            TalentSkill.objects.filter(
+                skill__in=JobSkill.objects.filter(job__in=changed_jobs).values("skill")
+            )
+            .exclude(talent_id__in=talent_ids)
+            .values_list("talent_id", flat=True)
+            .distinct()
+        )
+        written += self._compute(
+            other_talent_ids, changed_jobs, computed_at, batch_size
+        )
+        return written
+
+    def last_computed_at(self) -> datetime | None:
+        return self.aggregate(last=models.Max("computed_at"))["last"]
+
+    def _compute(
+        self,
+        talent_ids: list[Any],
+        jobs: models.QuerySet,
+        computed_at: datetime,
+        batch_size: int,
+    ) -> int:
+        from .skill import JobSkill
+
+        if not talent_ids:
+            return 0
+
+        job_info = {
+            job["pk"]: job
+            for job in jobs.values(
+                "pk",
+                "address",
+                "country",
+                "category_id",
+                "created_at",
+                proposal_count=F("activity__proposal_count"),
+            )
+        }
+        if not job_info:
+            return 0
+
+        job_skills: dict[Any, set] = defaultdict(set)
+        skill_jobs: dict[Any, set] = defaultdict(set)
+        for job_id, skill_id in JobSkill.objects.filter(
+            job_id__in=job_info.keys()
+        ).values_list("job_id", "skill_id"):
+            job_skills[job_id].add(skill_id)
+            skill_jobs[skill_id].add(job_id)
+
+        written = 0
+        for start in range(0, len(talent_ids), batch_size):
+            batch = talent_ids[start : start + batch_size]
+            scores = list(
+                self._score_batch(batch, job_info, job_skills, skill_jobs, computed_at)
+            )
+            self.bulk_create(scores, batch_size=batch_size)
+            written += len(scores)
+        return written
+
+    def _score_batch(
+        self, talent_ids, job_info, job_skills, skill_jobs, computed_at
+    ) -> Iterable["JobRelevanceScore"]:
+        from proposals.models import Proposal
+        from talents.models import Talent, TalentSkill
+
+        talent_skills: dict[Any, set] = defaultdict(set)
+        for talent_id, skill_id in TalentSkill.objects.filter(
+            talent_id__in=talent_ids
+        ).values_list("talent_id", "skill_id"):
+            talent_skills[talent_id].add(skill_id)
+
+        talent_categories: dict[Any, set] = defaultdict(set)
+        for talent_id, category_id in Proposal.objects.filter(
+            talent_id__in=talent_ids, job__category__isnull=False
+        ).values_list("talent_id", "job__category_id"):
+            talent_categories[talent_id].add(category_id)
+
+        locations = {
+            talent_id: (str(country or "").lower(), str(city or "").lower())
+            for talent_id, country, city in Talent.objects.filter(
+                pk__in=talent_ids
+            ).values_list("pk", "user__country", "user__city")
+        }
+
+        for talent_id in talent_ids:
+            skills = talent_skills.get(talent_id)
+            if not skills:
+                continue
+
+            candidates = set()
+            for skill_id in skills:
+                candidates |= skill_jobs.get(skill_id, set())
+
+            country, city = locations.get(talent_id, ("", ""))
+
+            for job_id in candidates:
+                job = job_info[job_id]
+                required = job_skills[job_id]
+                overlap = len(required & skills)
+
+                job_country = job["country"] if isinstance(job["country"], dict) else {}
+                job_country_name = str(job_country.get("name") or "").lower()
+                address = str(job["address"] or "").lower()
+
+                score = relevance_score(
+                    skill_overlap=overlap / len(required),
+                    category_match=job["category_id"] in talent_categories[talent_id],
+                    location_match=bool(
+                        (country and country == job_country_name)
+                        or (city and city in address)
+                    ),
+                    age_days=(computed_at - job["created_at"]).total_seconds() / 86400,
+                    proposal_count=job["proposal_count"] or 0,
+                )
+                yield self.model(
+                    talent_id=talent_id,
+                    job_id=job_id,
+                    score=score,
+                    skill_overlap=overlap,
+                    computed_at=computed_at,
+                )
+
+
+class JobRelevanceScore(models.Model):
+    """
+    A precomputed relevance of a job for a talent, refreshed in batches
+    by the `refresh_job_relevance` command.
+    """
+
+    talent = models.ForeignKey(
+        "talents.Talent", on_delete=models.CASCADE, related_name="relevance_scores"
+    )
+    job = models.ForeignKey(
+        "Job", on_delete=models.CASCADE, related_name="relevance_scores"
+    )
+
+    score = models.FloatField(default=0)
+    skill_overlap = models.IntegerField(default=0)
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    objects = JobRelevanceScoreManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["talent", "job"], name="unique_talent_job_relevance"
+            )
+        ]
+        indexes = [models.Index(fields=["talent", "-score"])]
+
+    def __str__(self):
+        return f"{self.talent_id} - {self.job_id}: {self.score}"
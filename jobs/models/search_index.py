@@ -0,0 +1,163 @@
+import re
+from collections.abc import Iterable
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db import connection, models
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+SEARCH_CONFIG = "english"
+SQLITE_FTS_TABLE = "jobs_jobsearchindex_fts"
+
+# Bounds the number of terms a single search can expand into
+MAX_SEARCH_TERMS = 8
+
+
+def search_terms(query: str) -> list[str]:
+    """Splits a raw user query into safe, lower-cased search terms"""
+    return re.findall(r"\w+", (query or "").lower())[:MAX_SEARCH_TERMS]
+
+
+def build_document(job) -> tuple[str, str]:
+    """
+    Returns the (title, document) pair indexed for a job.
+    The document holds every other searchable attribute of the job.
+    """
+
+    skills = job.required_skills or []
+    if isinstance(skills, dict):
+        skills = skills.values()
+    elif isinstance(skills, str):
+        skills = [skills]
+
+    country = job.country if isinstance(job.country, dict) else {}
+    metadata = job.third_party_metadata or {}
+    category = job.category
+
+    parts = [
+        strip_tags(job.description or ""),
+        " ".join(str(skill) for skill in skills if skill),
+        job.address or "",
+        str(country.get("name") or ""),
+        category.name if category else "",
+        category.slug if category else "",
+        str(metadata.get("company_name") or ""),
+        strip_tags(str(metadata.get("short_description") or "")),
+    ]
+
+    document = " ".join(part.strip() for part in parts if part and part.strip())
+    return job.title or "", document
+
+
+class JobSearchIndexManager(models.Manager):
+
+    def is_supported(self) -> bool:
+        return connection.vendor in ("postgresql", "sqlite")
+
+    def index_jobs(self, jobs: Iterable) -> None:
+        """Creates or refreshes the search documents of the given jobs"""
+
+        jobs = list(jobs)
+        if not jobs:
+            return
+
+        job_ids = [job.pk for job in jobs]
+        existing = {
+            entry.job_id: entry for entry in self.filter(job_id__in=job_ids)  # type: ignore
+        }
+
+        created, updated = [], []
+        for job in jobs:
+            title, document = build_document(job)
+            entry = existing.get(job.pk)
+            if entry is None:
+                created.append(
+                    self.model(job_id=job.pk, title=title, document=document)
+                )
+            elif entry.title != title or entry.document != document:
+                entry.title = title
+                entry.document = document
+                entry.updated_at = timezone.now()
+                updated.append(entry)
+
+        if created:
+            self.bulk_create(created)
+        if updated:
+            self.bulk_update(updated, ["title", "document", "updated_at"])
+
+        if connection.vendor == "postgresql" and (created or updated):
+            self.filter(job_id__in=job_ids).update(
+                search_vector=(
+                    SearchVector("title", weight="A", config=SEARCH_CONFIG)
+                    + SearchVector("document", weight="B", config=SEARCH_CONFIG)
+                )
+            )
+
+    def search(self, queryset: models.QuerySet, query: str) -> models.QuerySet:
+        """
+        Narrows a Job queryset down to the jobs matching the query,
+        annotated with a `search_rank` (higher is better).
+        """
+
+        terms = search_terms(query)
+        if not terms:
+            return queryset
+
+        if connection.vendor == "postgresql":
+            search_query = SearchQuery(
+                " & ".join(f"{term}:*" for term in terms),
+                search_type="raw",
+                config=SEARCH_CONFIG,
+            )
+            return queryset.filter(search_index__search_vector=search_query).annotate(
+                search_rank=SearchRank(
+                    models.F("search_index__search_vector"), search_query
+                )
+            )
+
+        # SQLite, callers check is_supported() first
+        match = " ".join(f'"{term}"*' for term in terms)
+        matches = (
+            f"SELECT i.job_id FROM {SQLITE_FTS_TABLE} "
+            f"JOIN jobs_jobsearchindex i ON i.id = {SQLITE_FTS_TABLE}.rowid "
+            f"WHERE {SQLITE_FTS_TABLE} MATCH %s"
+        )
+        # bm25() is negative, the more negative the better the match
+        rank = (
+            f"SELECT -bm25({SQLITE_FTS_TABLE}, 10.0, 1.0) FROM {SQLITE_FTS_TABLE} "
+            f"JOIN jobs_jobsearchindex i ON i.id = {SQLITE_FTS_TABLE}.rowid "
+            f"WHERE {SQLITE_FTS_TABLE} MATCH %s AND i.job_id = jobs_job.id"
+        )
+        return queryset.filter(pk__in=RawSQL(matches, [match])).annotate(
+            search_rank=RawSQL(rank, [match], output_field=models.FloatField())
+        )
+
+
+class JobSearchIndex(models.Model):
+    """
+    A denormalized full-text document per job.
+    Backed by a GIN indexed tsvector on PostgreSQL and an FTS5 table on SQLite.
+    """
+
+    job = models.OneToOneField(
+        "Job", on_delete=models.CASCADE, related_name="search_index"
+    )
+
+    title = models.CharField(max_length=200, default="", blank=True)
+    document = models.TextField(default="", blank=True)
+
+    # Only populated on PostgreSQL
+    search_vector = SearchVectorField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = JobSearchIndexManager()
+
+    def __str__(self):
+        return self.title[:50]
@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class JobSkill(models.Model):
+    """Indexes the normalized skills of Job.required_skills"""
+
+    job = models.ForeignKey("Job", on_delete=models.CASCADE, related_name="job_skills")
+    skill = models.ForeignKey(
+        "core.Skill", on_delete=models.CASCADE, related_name="job_skills"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["job", "skill"], name="unique_job_skill")
+        ]
+        indexes = [models.Index(fields=["skill", "job"])]
@@ -2,11 +2,12 @@ from rest_framework import serializers
 
 from clients.models import Client
 from core.models import Category
+from core.serializers import CompiledSerializerMixin
 from jobs.models import Activities, Job
 from proposals.models import Proposal
 
 
-class JobClientSerializer(serializers.ModelSerializer):
+class JobClientSerializer(CompiledSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Client
         fields = ["public_id", "name", "logo"]
@@ -22,9 +23,7 @@ class JobClientSerializer(serializers.ModelSerializer):
         data["company"] = {}
         is_detail_view = "detail" in self.context
 
-        data["rating"] = instance.average_rating(
-            recalculate=is_detail_view, db_commit=True
-        )
+        data["rating"] = instance.average_rating()
 
         if not is_detail_view:
             company = instance._company
@@ -70,13 +69,13 @@ class JobActivitiesSerializer(serializers.ModelSerializer):
         ]
 
 
-class JobCategorySerializer(serializers.ModelSerializer):
+class JobCategorySerializer(CompiledSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["name", "slug"]
 
 
-class JobListSerializer(serializers.ModelSerializer):
+class JobListSerializer(CompiledSerializerMixin, serializers.ModelSerializer):
 
     class Meta:
         model = Job
@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from jobs.cache import invalidate_job_responses
+from jobs.models import Activities, Job
+from proposals.models import Proposal
+
+
+@receiver(post_delete, sender=Job)
+def invalidate_deleted_job_cache(sender, instance: Job, **kwargs):
+    invalidate_job_responses(instance.public_id)
+
+
+@receiver(post_delete, sender=Activities)
+def invalidate_deleted_activity_job_cache(sender, instance: Activities, **kwargs):
+    public_id = Job.objects.filter(pk=instance.job_id).values_list(  # type: ignore
+        "public_id", flat=True
+    )
+    invalidate_job_responses(*public_id)
+
+
+@receiver(post_delete, sender=Proposal)
+def invalidate_deleted_proposal_job_cache(sender, instance: Proposal, **kwargs):
+    public_id = Job.objects.filter(pk=instance.job_id).values_list(  # type: ignore
+        "public_id", flat=True
+    )
+    invalidate_job_responses(*public_id)
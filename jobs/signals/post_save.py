@@ -1,4 +1,47 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from jobs.models import Activities, Job
+from core.models import Skill
+from jobs.cache import invalidate_job_detail, invalidate_job_responses
+from jobs.models import Activities, Job, JobSearchIndex, JobSkill
+from jobs.serializers.retrieve import JobActivitiesSerializer
+from proposals.models import Proposal
+
+
+@receiver(post_save, sender=Job)
+def update_job_search_index(sender, instance: Job, **kwargs):
+    """Keeps the job's full-text search document in sync"""
+    if JobSearchIndex.objects.is_supported():
+        JobSearchIndex.objects.index_jobs([instance])
+
+
+@receiver(post_save, sender=Job)
+def update_job_skills(sender, instance: Job, **kwargs):
+    """Keeps the job's normalized skills in sync with its required_skills"""
+    Skill.objects.sync(JobSkill, "job", {instance.pk: instance.required_skills})
+
+
+@receiver(post_save, sender=Job)
+def invalidate_job_cache(sender, instance: Job, **kwargs):
+    invalidate_job_responses(instance.public_id)
+
+
+@receiver(post_save, sender=Activities)
+def invalidate_activity_job_cache(
+    sender, instance: Activities, update_fields=None, **kwargs
+):
+    """Only the job's detail shows its activity, the listings are left cached"""
+
+    shown_fields = JobActivitiesSerializer.Meta.fields
+    if update_fields and not set(update_fields) & set(shown_fields):
+        return
+
+    public_id = Job.objects.filter(pk=instance.job_id).values_list(  # type: ignore
+        "public_id", flat=True
+    )
+    invalidate_job_detail(*public_id)
+
+
+@receiver(post_save, sender=Proposal)
+def invalidate_proposal_job_cache(sender, instance: Proposal, **kwargs):
+    invalidate_job_responses(instance.job.public_id)
@@ -0,0 +1,12 @@
+from jobs.cache import invalidate_job_detail
+from utilities.time import utc_datetime
+
+from .models import Activities
+
+
+def update_client_last_visit(activity_id: int) -> None:
+    activities = Activities.objects.filter(pk=activity_id)
+    activities.update(client_last_visit=utc_datetime(add_minutes=2))
+
+    # The visit is shown on the job's detail only
+    invalidate_job_detail(*activities.values_list("job__public_id", flat=True))
@@ -0,0 +1,78 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from clients.models import Client
+from jobs.models import Job, JobStatusChoices
+from jobs.views.search import JobsSearchAPIView
+from proposals.models import Proposal
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+
+def test_to_one_joins_are_not_deduplicated():
+    queryset = Job.objects.filter(
+        category__slug="design", client__user__pk=1
+    ).deduplicated()
+
+    assert not queryset.query.distinct
+
+
+def test_to_many_joins_are_deduplicated():
+    queryset = Job.objects.filter(skill_tags__slug="python").deduplicated()
+
+    assert queryset.query.distinct
+
+
+@pytest.mark.django_db
+def test_search_query_has_no_distinct():
+    params = {"category": "design", "location": "banjul", "skills": "python"}
+    request = Request(APIRequestFactory().get(reverse("job_searching"), params))
+
+    view = JobsSearchAPIView()
+    view.request = request
+    queryset = view.get_queryset(None)
+
+    assert "DISTINCT" not in str(queryset.query)
+
+
+@pytest.mark.django_db
+def test_listings_exclude_the_jobs_a_talent_applied_to(api_client):
+    client_user = User.objects.create(
+        username="client", email="client@mail.com", is_active=True, is_client=True
+    )
+    client = Client.objects.create(user=client_user)
+    talent_user = User.objects.create(
+        username="talent", email="talent@mail.com", is_active=True, is_talent=True
+    )
+    talent = Talent.objects.create(user=talent_user)
+
+    jobs = {}
+    for title in ("Applied", "Open"):
+        jobs[title] = Job.objects.create(
+            title=title,
+            description="Job description",
+            country={"name": "Gambia", "code": "GM"},
+            address="Serrekunda",
+            required_skills=[],
+            published=True,
+            status=JobStatusChoices.PUBLISHED,
+            client=client,
+        )
+    Proposal.objects.create(job=jobs["Applied"], talent=talent, cover_letter="Hi")
+
+    api_client.force_authenticate(user=talent_user)
+    for url in (reverse("job_list"), reverse("job_searching")):
+        response = api_client.get(url)
+        titles = [job["title"] for job in response.data["payload"]]
+        assert titles == ["Open"]
+
+    assert "EXISTS" in str(Job.objects.exclude_applied(talent).query)
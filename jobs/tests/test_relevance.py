@@ -0,0 +1,126 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from core.models import Category
+from jobs.models import Job, JobRelevanceScore, JobStatusChoices
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def setup_data(db):
+    user = User.objects.create(
+        username="client",
+        email="client@mail.com",
+        is_active=True,
+        is_client=True,
+    )
+    client = Client.objects.create(user=user)
+    category = Category.objects.create(name="Web Development", slug="web-development")
+    return client, category
+
+
+@pytest.fixture
+def talent(db):
+    user = User.objects.create(
+        username="talent",
+        email="talent@mail.com",
+        is_active=True,
+        is_talent=True,
+        country="Gambia",
+    )
+    return Talent.objects.create(user=user, skills="Python, Django")
+
+
+def create_job(client, category, **kwargs):
+    data = {
+        "title": "Job",
+        "description": "Job description",
+        "country": {"name": "Gambia", "code": "GM"},
+        "address": "Serrekunda",
+        "required_skills": [],
+        "published": True,
+        "status": JobStatusChoices.PUBLISHED,
+        "client": client,
+        "category": category,
+    }
+    data.update(kwargs)
+    return Job.objects.create(**data)
+
+
+@pytest.mark.django_db
+def test_refresh_scores_skill_matches(setup_data, talent):
+    client, category = setup_data
+    full_match = create_job(client, category, required_skills=["Python", "Django"])
+    half_match = create_job(client, category, required_skills=["Python", "Flutter"])
+    create_job(client, category, required_skills=["Figma"])
+
+    written = JobRelevanceScore.objects.refresh()
+
+    assert written == 2
+    scores = {
+        score.job_id: score for score in JobRelevanceScore.objects.filter(talent=talent)
+    }
+    assert set(scores) == {full_match.pk, half_match.pk}
+    assert scores[full_match.pk].skill_overlap == 2
+    assert scores[full_match.pk].score > scores[half_match.pk].score
+
+
+@pytest.mark.django_db
+def test_incremental_refresh_only_rescores_changed_rows(setup_data, talent):
+    client, category = setup_data
+    job = create_job(client, category, required_skills=["Python"])
+    other = create_job(client, category, required_skills=["Django"])
+
+    JobRelevanceScore.objects.refresh()
+    since = JobRelevanceScore.objects.last_computed_at()
+    untouched = JobRelevanceScore.objects.get(job=other)
+
+    job.required_skills = ["Python", "Django"]
+    job.save()
+    JobRelevanceScore.objects.refresh(since=since)
+
+    assert JobRelevanceScore.objects.get(job=job).skill_overlap == 2
+    assert JobRelevanceScore.objects.get(job=other).computed_at == untouched.computed_at
+
+
+@pytest.mark.django_db
+def test_failed_refresh_keeps_the_previous_scores(setup_data, talent, monkeypatch):
+    client, category = setup_data
+    create_job(client, category, required_skills=["Python"])
+    JobRelevanceScore.objects.refresh()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("Database went away")
+
+    monkeypatch.setattr(JobRelevanceScore.objects.__class__, "_score_batch", fail)
+    with pytest.raises(RuntimeError):
+        JobRelevanceScore.objects.refresh()
+
+    assert JobRelevanceScore.objects.filter(talent=talent).count() == 1
+
+
+@pytest.mark.django_db
+def test_search_orders_by_precomputed_relevance(api_client, setup_data, talent):
+    client, category = setup_data
+    create_job(client, category, title="Unrelated", required_skills=["Figma"])
+    create_job(client, category, title="Partial", required_skills=["Python", "Go"])
+    create_job(client, category, title="Match", required_skills=["Python", "Django"])
+
+    call_command("refresh_job_relevance")
+
+    api_client.force_authenticate(user=talent.user)
+    response = api_client.get(reverse("job_searching"), {"order": "relevance"})
+
+    assert response.status_code == status.HTTP_200_OK
+    titles = [job["title"] for job in response.data["payload"]]
+    assert titles == ["Match", "Partial", "Unrelated"]
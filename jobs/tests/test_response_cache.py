@@ -0,0 +1,162 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from core.models import Category
+from jobs.models import Activities, Job, JobStatusChoices
+from jobs.views.get import JobListAPIView
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+
+@pytest.fixture
+def job(db):
+    user = User.objects.create(
+        username="client",
+        email="client@mail.com",
+        is_active=True,
+        is_client=True,
+    )
+    client = Client.objects.create(user=user)
+    category = Category.objects.create(name="Web Development", slug="web-development")
+    job = Job.objects.create(
+        title="Django Developer",
+        description="Job description",
+        country={"name": "Gambia", "code": "GM"},
+        address="Serrekunda",
+        required_skills=[],
+        published=True,
+        status=JobStatusChoices.PUBLISHED,
+        client=client,
+        category=category,
+    )
+    Activities.objects.create(job=job)
+    return job
+
+
+@pytest.fixture
+def talent_user(db):
+    user = User.objects.create(
+        username="talent",
+        email="talent@mail.com",
+        is_active=True,
+        is_talent=True,
+    )
+    Talent.objects.create(user=user)
+    return user
+
+
+def fetch(api_client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    return response, len(queries)
+
+
+@pytest.mark.django_db
+def test_guest_job_list_is_served_from_cache(api_client, job):
+    url = reverse("job_list")
+
+    first, first_queries = fetch(api_client, url)
+    second, second_queries = fetch(api_client, url)
+
+    assert first_queries > 0
+    assert second_queries == 0
+    assert second.data == first.data
+
+
+@pytest.mark.django_db
+def test_job_changes_invalidate_the_cached_responses(api_client, job, talent_user):
+    api_client.force_authenticate(user=talent_user)
+    list_url = reverse("job_list")
+    detail_url = reverse("job_detail", args=[job.public_id])
+    fetch(api_client, list_url)
+    fetch(api_client, detail_url)
+
+    job.title = "Flutter Developer"
+    job.save()
+
+    response, _ = fetch(api_client, list_url)
+    assert response.data["payload"][0]["title"] == "Flutter Developer"
+
+    response, _ = fetch(api_client, detail_url)
+    assert response.data["title"] == "Flutter Developer"
+
+
+@pytest.mark.django_db
+def test_activity_changes_invalidate_the_job_detail(api_client, job, talent_user):
+    api_client.force_authenticate(user=talent_user)
+    detail_url = reverse("job_detail", args=[job.public_id])
+    fetch(api_client, detail_url)
+
+    activity = job.activity
+    activity.proposal_count = 5
+    activity.save()
+
+    _, queries = fetch(api_client, detail_url)
+    assert queries > 0
+
+
+@pytest.mark.django_db
+def test_client_visits_only_invalidate_the_job_detail(api_client, job, talent_user):
+    list_url = reverse("job_list")
+    detail_url = reverse("job_detail", args=[job.public_id])
+    api_client.force_authenticate(user=talent_user)
+    fetch(api_client, list_url)
+    fetch(api_client, detail_url)
+
+    # The client opening their job records the visit
+    api_client.force_authenticate(user=job.client.user)
+    fetch(api_client, detail_url)
+
+    api_client.force_authenticate(user=talent_user)
+    _, queries = fetch(api_client, list_url)
+    assert queries == 0
+
+    response, queries = fetch(api_client, detail_url)
+    assert queries > 0
+    assert response.data["activities"]["client_last_visit"] is not None
+
+
+@pytest.mark.django_db
+def test_concurrent_misses_wait_for_the_response_being_built(
+    api_client, job, monkeypatch
+):
+    monkeypatch.setattr(
+        JobListAPIView, "get_response_cache_key", lambda self, request: "jobs"
+    )
+    # Another worker is building the response
+    cache.add("jobs:lock", 1)
+    built = {"value": {"payload": []}, "delta": 0.1, "expires": time.time() + 60}
+    threading.Timer(0.1, cache.set, args=("jobs", built, 60)).start()
+
+    response, queries = fetch(api_client, reverse("job_list"))
+
+    assert queries == 0
+    assert response.data == {"payload": []}
+
+
+@pytest.mark.django_db
+def test_failed_responses_are_not_cached(api_client, job, talent_user):
+    api_client.force_authenticate(user=talent_user)
+    url = reverse("job_detail", args=["missing"])
+
+    for _ in range(2):
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert len(queries) > 0
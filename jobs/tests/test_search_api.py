@@ -0,0 +1,138 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from core.models import Category
+from jobs.models import Job, JobStatusChoices
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+
+@pytest.fixture
+def setup_data(db):
+    user = User.objects.create(
+        username="client",
+        email="client@mail.com",
+        is_active=True,
+        is_client=True,
+    )
+    client = Client.objects.create(user=user)
+    design = Category.objects.create(name="Graphic Design", slug="graphic-design")
+    writing = Category.objects.create(name="Writing", slug="writing")
+    return client, design, writing
+
+
+def create_job(client, category, **kwargs):
+    data = {
+        "title": "Job",
+        "description": "Job description",
+        "country": {"name": "Gambia", "code": "GM"},
+        "address": "Serrekunda",
+        "published": True,
+        "status": JobStatusChoices.PUBLISHED,
+        "client": client,
+        "category": category,
+    }
+    data.update(kwargs)
+    return Job.objects.create(**data)
+
+
+def job_queries(context):
+    # Planner estimates (EXPLAIN) of the count don't execute the query
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if 'FROM "jobs_job"' in query["sql"] and not query["sql"].startswith("EXPLAIN")
+    ]
+
+
+@pytest.mark.django_db
+def test_search_runs_one_count_and_one_page_fetch(api_client, setup_data):
+    client, design, writing = setup_data
+    create_job(client, design, title="Logo designer", address="Banjul")
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(
+            reverse("job_searching"),
+            {
+                "category": "design",
+                "location": "banjul",
+                "duration": "2 weeks",
+                "order": "relevance",
+            },
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["objects_count"] == 1
+    assert len(job_queries(context)) == 2
+
+
+@pytest.mark.django_db
+def test_search_ranks_fallback_matches_after_exact_matches(api_client, setup_data):
+    client, design, writing = setup_data
+    create_job(client, writing, title="Copywriter", address="Bakau")
+    create_job(client, design, title="Designer", address="Brikama")
+    create_job(client, writing, title="Design blog writer", address="Banjul")
+
+    response = api_client.get(reverse("job_searching"), {"category": "design"})
+
+    assert response.status_code == status.HTTP_200_OK
+    titles = [job["title"] for job in response.data["payload"]]
+    # The category match comes first, then the job only mentioning it
+    assert titles == ["Designer", "Design blog writer"]
+
+
+@pytest.mark.django_db
+def test_search_applies_filters_for_guests(api_client, setup_data):
+    client, design, writing = setup_data
+    create_job(client, design, title="Designer", job_type="full-time")
+    create_job(client, design, title="Part-time designer", job_type="part-time")
+    create_job(client, design, title="Draft designer", published=False)
+
+    response = api_client.get(reverse("job_searching"), {"type": "part-time"})
+
+    assert response.status_code == status.HTTP_200_OK
+    titles = [job["title"] for job in response.data["payload"]]
+    assert titles == ["Part-time designer"]
+
+
+@pytest.mark.django_db
+def test_listing_queries_dont_grow_with_the_page(api_client, setup_data):
+    def create_jobs(count: int):
+        for index in range(Job.objects.count(), Job.objects.count() + count):
+            user = User.objects.create(
+                username=f"client{index}", email=f"client{index}@mail.com"
+            )
+            category = Category.objects.create(
+                name=f"Category {index}", slug=f"category-{index}"
+            )
+            create_job(Client.objects.create(user=user), category, title=f"Job {index}")
+
+    def count_queries(url: str) -> int:
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(
+            [q for q in context.captured_queries if not q["sql"].startswith("EXPLAIN")]
+        )
+
+    create_jobs(2)
+    queries = {
+        url: count_queries(url)
+        for url in (reverse("job_list"), reverse("job_searching"))
+    }
+
+    create_jobs(6)
+    for url, count in queries.items():
+        assert count_queries(url) == count
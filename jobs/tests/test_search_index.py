@@ -0,0 +1,133 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from core.models import Category
+from jobs.models import Job, JobSearchIndex, JobStatusChoices
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def setup_data(db):
+    user = User.objects.create(
+        username="client",
+        email="client@mail.com",
+        first_name="Test",
+        last_name="Client",
+        is_active=True,
+        is_client=True,
+    )
+    client = Client.objects.create(user=user)
+    category = Category.objects.create(name="Web Development", slug="web-development")
+    return client, category
+
+
+@pytest.fixture
+def talent_user(db):
+    user = User.objects.create(
+        username="talent",
+        email="talent@mail.com",
+        is_active=True,
+        is_talent=True,
+    )
+    Talent.objects.create(user=user, skills="Python, Django")
+    return user
+
+
+def create_job(client, category, **kwargs):
+    data = {
+        "title": "Job",
+        "description": "Job description",
+        "country": {"name": "Gambia", "code": "GM"},
+        "address": "Serrekunda",
+        "required_skills": [],
+        "published": True,
+        "status": JobStatusChoices.PUBLISHED,
+        "client": client,
+        "category": category,
+    }
+    data.update(kwargs)
+    return Job.objects.create(**data)
+
+
+@pytest.mark.django_db
+def test_index_is_maintained_on_save(setup_data):
+    client, category = setup_data
+    job = create_job(client, category, title="Django Developer")
+
+    entry = JobSearchIndex.objects.get(job=job)
+    assert entry.title == "Django Developer"
+    assert "Web Development" in entry.document
+
+    job.title = "Flutter Engineer"
+    job.save()
+
+    entry.refresh_from_db()
+    assert entry.title == "Flutter Engineer"
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_matches_first(setup_data):
+    client, category = setup_data
+    description_match = create_job(
+        client, category, title="Backend Engineer", description="We use python daily"
+    )
+    title_match = create_job(client, category, title="Senior Python Developer")
+    create_job(client, category, title="Graphic Designer", description="Figma")
+
+    queryset = JobSearchIndex.objects.search(Job.objects.all(), "python")
+    results = list(queryset.order_by("-search_rank"))
+
+    assert results == [title_match, description_match]
+
+
+@pytest.mark.django_db
+def test_search_matches_prefixes_and_all_terms(setup_data):
+    client, category = setup_data
+    job = create_job(
+        client, category, title="Python Developer", required_skills=["Django"]
+    )
+    create_job(client, category, title="Python Tutor")
+
+    queryset = JobSearchIndex.objects.search(Job.objects.all(), "pyth djan")
+    assert list(queryset) == [job]
+
+    # Search operators are never passed through to the index
+    queryset = JobSearchIndex.objects.search(Job.objects.all(), '"python" ^ (*')
+    assert queryset.count() == 2
+
+
+@pytest.mark.django_db
+def test_search_api_returns_ranked_results(api_client, setup_data, talent_user):
+    client, category = setup_data
+    create_job(client, category, title="Accountant", description="python reports")
+    create_job(client, category, title="Python Developer")
+
+    api_client.force_authenticate(user=talent_user)
+    response = api_client.get(reverse("job_searching"), {"query": "python"})
+
+    assert response.status_code == status.HTTP_200_OK
+    titles = [job["title"] for job in response.data["payload"]]
+    assert titles == ["Python Developer", "Accountant"]
+
+
+@pytest.mark.django_db
+def test_rebuild_command_backfills_index(setup_data):
+    client, category = setup_data
+    job = create_job(client, category, title="Data Analyst")
+    JobSearchIndex.objects.all().delete()
+
+    call_command("rebuild_job_search_index")
+
+    assert JobSearchIndex.objects.filter(job=job).exists()
+    queryset = JobSearchIndex.objects.search(Job.objects.all(), "analyst")
+    assert list(queryset) == [job]
@@ -5,7 +5,10 @@ from django.shortcuts import get_object_or_404
 from rest_framework.generics import GenericAPIView, ListAPIView, RetrieveAPIView
 from rest_framework.response import Response
 
-from core.services.after.main import AfterResponseService
+from core.services.cache import CachedResponseMixin
+from core.services.tasks import TaskQueue
+from jobs import tasks
+from jobs.cache import JOBS_VERSION_KEY, job_version_key
 from jobs.models import Activities, Job
 from jobs.models.job import JobStatusChoices
 from jobs.serializers import (
@@ -14,7 +17,7 @@ from jobs.serializers import (
     JobRetrieveSerializer,
 )
 from jobs.serializers.retrieve import JobRelatedSerializer
-from src.features.paginator import DokoolaPaginator
+from src.features.paginator import DokoolaPaginator, EstimatedCountPaginator
 from users.models.user import User
 from utilities.time import utc_datetime, utc_timestamp
 
@@ -44,13 +47,17 @@ def client_job_query(user_id):
     )
 
 
-class JobListAPIView(ListAPIView):
+class JobListAPIView(CachedResponseMixin, ListAPIView):
     permission_classes = []
     serializer_class = JobListSerializer
+    pagination_class = EstimatedCountPaginator
+
+    def get_cache_versions(self):
+        return [JOBS_VERSION_KEY]
 
     def exclude_proposed_jobs(self, queryset, profile, profile_type):
         if profile and profile_type == "Talent":
-            return queryset.exclude(public_id__in=profile.applications_ids)
+            return queryset.exclude_applied(profile)
         return queryset
 
     def get_queryset(self, user: User):
@@ -69,7 +76,7 @@ class JobListAPIView(ListAPIView):
         queryset = self.exclude_proposed_jobs(queryset, profile, profile_type).order_by(
             "application_deadline", "-created_at", "published"
         )
-        return queryset.select_related("category", "client__user", "client__company")
+        return queryset.for_listing()
 
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset(request.user)
@@ -79,8 +86,12 @@ class JobListAPIView(ListAPIView):
         return self.get_paginated_response(serializer.data)
 
 
-class JobRelatedAPIView(ListAPIView):
+class JobRelatedAPIView(CachedResponseMixin, ListAPIView):
     serializer_class = JobRelatedSerializer
+    cache_per_user = False
+
+    def get_cache_versions(self):
+        return [JOBS_VERSION_KEY]
 
     def get_queryset(self, public_id=None):
         instance = get_object_or_404(Job, public_id=public_id)
@@ -160,7 +171,7 @@ class MyJobListAPIView(ListAPIView):
     def get_queryset(self):
         user_id = self.request.user.pk
         queryset = Job.objects.filter(client__user__pk=user_id).order_by("-updated_at")
-        return queryset
+        return queryset.for_listing()
 
     def list(self, request, *args, **kwargs):
 
@@ -187,13 +198,15 @@ class MyJobListAPIView(ListAPIView):
             )
 
 
-class JobRetrieveAPIView(RetrieveAPIView):
+class JobRetrieveAPIView(CachedResponseMixin, RetrieveAPIView):
     serializer_class = JobRetrieveSerializer
 
-    def update_last_client_visit_time(self, activity: Activities):
-        client_last_visit = utc_datetime(add_minutes=2)
-        activity.client_last_visit = client_last_visit
-        activity.save()
+    def get_cache_versions(self):
+        return [job_version_key(self.kwargs["public_id"])]
+
+    def should_cache(self, request):
+        # A client's visit to their own job is tracked on every request
+        return not getattr(request.user, "is_client", False)
 
     def get_queryset(self, public_id: str):
         user_id = self.request.user.pk
@@ -208,9 +221,7 @@ class JobRetrieveAPIView(RetrieveAPIView):
             serializer = self.get_serializer(instance=instance)
 
             if instance.client.user.pk == request.user.pk:
-                AfterResponseService.schedule_after(
-                    self.update_last_client_visit_time, instance.activity
-                )
+                TaskQueue.enqueue(tasks.update_client_last_visit, instance.activity.pk)
 
             return Response(serializer.data, status=200)
 
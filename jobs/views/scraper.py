@@ -3,9 +3,12 @@ from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 
 from clients.models import Client
-from core.models import Category
+from core.models import Category, Skill
+from jobs.cache import invalidate_job_responses
 from jobs.models.activities import Activities
 from jobs.models.job import Job, JobStatusChoices
+from jobs.models.search_index import JobSearchIndex
+from jobs.models.skill import JobSkill
 from utilities.generator import primary_key_generator, public_id_generator
 
 
@@ -93,6 +96,14 @@ class JobScrapperAPIView(ListAPIView):
             with transaction.atomic():
                 jobs = Job.objects.bulk_create(filtered_jobs)
                 Activities.objects.bulk_create(activities)
+
+                # bulk_create skips post_save, so index the new jobs here
+                if JobSearchIndex.objects.is_supported():
+                    JobSearchIndex.objects.index_jobs(jobs)
+                Skill.objects.sync(
+                    JobSkill, "job", {job.pk: job.required_skills for job in jobs}
+                )
+                invalidate_job_responses()
                 return Response(
                     {"message": "Jobs created successfully", "count": len(jobs)},
                     status=200,
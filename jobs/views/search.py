@@ -1,16 +1,18 @@
 import math
-from random import shuffle
+import operator
 import re
-from datetime import datetime
+from functools import reduce
+from random import shuffle
 
-from django.db.models import Q
+from django.db.models import Case, Exists, F, IntegerField, OuterRef, Q, Value, When
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 
-from jobs.models import Job
+from core.models import Skill
+from jobs.models import Job, JobRelevanceScore, JobSearchIndex, JobSkill
 from jobs.models.job import JobStatusChoices, JobTypeChoices
 from jobs.serializers import JobListSerializer
-from talents.models import Talent
+from src.features.paginator import EstimatedCountPaginator
 from users.models.user import User
 
 
@@ -36,27 +38,91 @@ client_job_query = lambda user_id: Q(
 )
 
 
-def user_query(user: User|None, queryset):
-    profile, profile_type = user.profile if user else (None, "")
-    if user and user.is_authenticated:
-        queryset = queryset.filter(guest_job_query & Q(published=True) | client_job_query(user.pk))
+def user_query(user: User | None, queryset):
+    is_authenticated = bool(user and user.is_authenticated)
+    profile, profile_type = user.profile if is_authenticated else (None, "")  # type: ignore
+    if is_authenticated:
+        queryset = queryset.filter(
+            guest_job_query & Q(published=True) | client_job_query(user.pk)  # type: ignore
+        )
     else:
-        queryset = Job.objects.filter(
+        queryset = queryset.filter(
             guest_job_query,
             published=True,
         )
 
     if profile and profile_type == "Talent":
-        queryset = queryset.exclude(public_id__in=profile.applications_ids)
+        queryset = queryset.exclude_applied(profile)
 
     return queryset
 
 
+class JobSearchPlan:
+    """
+    Collects the filters of a job search and compiles them into a single query.
+
+    Fallbacks are expressed as tiers instead of `.exists()` probes, a job that
+    only matches a looser tier is ranked (`match_tier`) after the jobs matching
+    a stricter one.
+    """
+
+    def __init__(self):
+        self.filters: list[Q] = []
+        self.cascades: list[list[Q]] = []
+        self.boosts: list[Q] = []
+
+    def filter(self, condition: Q):
+        """A condition every result must satisfy"""
+        self.filters.append(condition)
+
+    def cascade(self, *tiers: Q):
+        """A condition with fallbacks, ordered from the strictest to the loosest"""
+        self.cascades.append(list(tiers))
+
+    def boost(self, condition: Q):
+        """An optional condition, results satisfying it are ranked first"""
+        self.boosts.append(condition)
+
+    def apply(self, queryset):
+        for condition in self.filters:
+            queryset = queryset.filter(condition)
+
+        tier_expressions = []
+
+        for tiers in self.cascades:
+            queryset = queryset.filter(reduce(operator.or_, tiers))
+            if len(tiers) > 1:
+                tier_expressions.append(
+                    Case(
+                        *[When(tier, then=Value(i)) for i, tier in enumerate(tiers)],
+                        default=Value(len(tiers)),
+                        output_field=IntegerField(),
+                    )
+                )
+
+        for condition in self.boosts:
+            tier_expressions.append(
+                Case(
+                    When(condition, then=Value(0)),
+                    default=Value(1),
+                    output_field=IntegerField(),
+                )
+            )
+
+        if tier_expressions:
+            queryset = queryset.annotate(
+                match_tier=reduce(operator.add, tier_expressions)
+            )
+
+        return queryset
+
+
 class JobsSearchAPIView(ListAPIView):
     permission_classes = []
     serializer_class = JobListSerializer
+    pagination_class = EstimatedCountPaginator
 
-    def get_queryset(self, user:User|None):
+    def get_queryset(self, user: User | None):
         search_params = self.request.query_params  # type: ignore
 
         query = search_params.get("query")
@@ -68,7 +134,7 @@ class JobsSearchAPIView(ListAPIView):
         order_by = search_params.get("order", "-created_at")
         job_type = search_params.get("type")
 
-        self.queryset = Job.objects.filter()
+        self.plan = JobSearchPlan()
 
         if duration:
             self.filter_by_duration(duration)
@@ -80,34 +146,35 @@ class JobsSearchAPIView(ListAPIView):
             self.filter_by_skills(skills)
         if job_type:
             self.filter_by_job_type(job_type)
+
+        queryset = user_query(user, Job.objects.filter())
+
         if query:
-            self.filter_by_query(query)
-        if order_by:
-            if order_by == "relevance":
-                self.get_relevance()
-            elif order_by == "newest":
-                self.queryset = self.queryset.order_by("created_at")
-            elif order_by == "oldest":
-                self.queryset = self.queryset.order_by("-created_at")
-        else:
-            self.queryset = self.queryset.order_by("-created_at")
-
-        queryset = user_query(user, self.queryset)
-
-        if not queryset and category:
-            queryset = Job.objects.filter(
-                Q(title__icontains=category) |
-                Q(description__icontains=category) |
-                Q(required_skills__icontains=category) |
-                Q(third_party_metadata___short_description__icontains=category)
-            )
-            queryset = user_query(user, queryset)
+            queryset = self.filter_by_query(queryset, query)
+
+        queryset = self.plan.apply(queryset)
 
-        # if not queryset:
-        #     queryset = user_query(user, Job.objects.filter()).order_by("public_id")[:10]
-        #     shuffle(list(queryset))
+        if order_by == "relevance":
+            queryset = self.get_relevance(queryset)
 
-        return queryset.distinct()
+        ordering = list(Job._meta.ordering)
+        if "search_rank" in queryset.query.annotations and order_by not in (
+            "newest",
+            "oldest",
+        ):
+            # Full-text matches are ranked by how well they match the query
+            ordering = ["-search_rank", "-created_at"]
+        elif "relevance_score" in queryset.query.annotations:
+            ordering = [F("relevance_score").desc(nulls_last=True), "-created_at"]
+        elif order_by == "newest":
+            ordering = ["created_at"]
+        elif order_by == "oldest":
+            ordering = ["-created_at"]
+
+        if "match_tier" in queryset.query.annotations:
+            ordering.insert(0, "match_tier")
+
+        return queryset.order_by(*ordering).deduplicated().for_listing()
 
     def list(self, request, *args, **kwargs):
         try:
@@ -142,15 +209,22 @@ class JobsSearchAPIView(ListAPIView):
             value = _job_type.lower()
         if not value:
             return
-        
-        self.queryset = self.queryset.filter(job_type__icontains=value)
+
+        self.plan.filter(Q(job_type__icontains=value))
 
     def filter_by_skills(self, skills: str):
-        skills_filters = Q(required_skills__icontains=skills)
-        self.queryset = self.queryset.filter(skills_filters)
+        keys = Skill.objects.keys(skills)
+        if not keys:
+            return
+
+        job_skills = JobSkill.objects.filter(job=OuterRef("pk"), skill__slug__in=keys)
+        self.plan.filter(Q(Exists(job_skills)))
 
     # Filters queryset by query
-    def filter_by_query(self, query: str):
+    def filter_by_query(self, queryset, query: str):
+        if JobSearchIndex.objects.is_supported():
+            return JobSearchIndex.objects.search(queryset, query)
+
         query_filters = (
             Q(title__icontains=query)
             | Q(description__icontains=query)
@@ -160,76 +234,67 @@ class JobsSearchAPIView(ListAPIView):
             | Q(category__name__icontains=query)
             | Q(category__slug__icontains=query)
         )
-        self.queryset = self.queryset.filter(query_filters)
+        return queryset.filter(query_filters)
 
     # Filters queryset by address
     def filter_by_address(self, location: str):
         location = location.lower()
 
-        qs = self.queryset.filter(Q(address__icontains=location) | Q(country__name__icontains=location))
-
-        if not qs.exists():
-            first_3 = location[:3]
-            the_rest = location[3:]
+        first_3 = location[:3]
+        the_rest = location[3:]
 
-            sub_query_filters = Q(address__icontains=first_3)
-            if the_rest:
-                sub_query_filters |= Q(address__icontains=the_rest)
+        fallback_filters = Q(address__icontains=first_3)
+        if the_rest:
+            fallback_filters |= Q(address__icontains=the_rest)
 
-            qs = self.queryset.filter(sub_query_filters)
-        self.queryset = qs
+        self.plan.cascade(
+            Q(address__icontains=location) | Q(country__name__icontains=location),
+            fallback_filters,
+        )
 
     # Filters queryset by category
     def filter_by_category(self, category: str):
         category_filters = Q(category__slug__icontains=category) | Q(
             category__name__icontains=category
         )
-        qs = self.queryset.filter(category_filters)
 
-        if not qs.exists():
-            first_4 = category[:4]
-            second_4 = category[4:8]
-            third_4 = category[8:12]
-            fourth_4 = category[12:16]
+        first_4 = category[:4]
+        second_4 = category[4:8]
+        third_4 = category[8:12]
+        fourth_4 = category[12:16]
 
-            sub_query_filters = Q(category__slug=first_4) | Q(category__name=first_4)
+        fragment_filters = Q(category__slug=first_4) | Q(category__name=first_4)
 
-            for i in [second_4, third_4, fourth_4]:
-                if not i:
-                    continue
-                sub_query_filters |= Q(category__slug__icontains=i) | Q(
-                    category__name__icontains=i
-                )
-            qs = self.queryset.filter(sub_query_filters)
-        self.queryset = qs
-
-    # Filters queryset by most relevance
-    def get_relevance(self):
-
-        profile, profile_name = self.request.user.profile  # type: ignore
-        talent: Talent | None = None
-
-        if profile_name.lower() == "talent":
-            talent = profile
-
-        if talent:
-            skills = talent.skills.split(",")
-            filters = (
-                Q(bits_count__gt=0)
-                | Q(created_at__year=datetime.now().year)
-                | Q(required_skills__in=skills)
-                | Q(required_skills__iendswith=talent.skills)
-                | Q(required_skills__istartswith=talent.skills)
-                | Q(required_skills__icontains=talent.skills)
+        for i in [second_4, third_4, fourth_4]:
+            if not i:
+                continue
+            fragment_filters |= Q(category__slug__icontains=i) | Q(
+                category__name__icontains=i
             )
 
-            qs = self.queryset.filter(filters)
-            if qs.exists():
-                self.queryset = qs
+        # Jobs that only mention the category in their content
+        content_filters = (
+            Q(title__icontains=category)
+            | Q(description__icontains=category)
+            | Q(required_skills__icontains=category)
+            | Q(third_party_metadata___short_description__icontains=category)
+        )
+
+        self.plan.cascade(category_filters, fragment_filters, content_filters)
+
+    # Ranks the most relevant jobs first
+    def get_relevance(self, queryset):
+        user = self.request.user
+        if not user.is_authenticated:
+            return queryset
+
+        profile, profile_name = user.profile  # type: ignore
+        if profile_name.lower() != "talent":
+            return queryset
+
+        # Scores are precomputed by the `refresh_job_relevance` command
+        return JobRelevanceScore.objects.rank(queryset, profile)
 
-    # Filters queryset by duration
+    # Ranks the jobs matching the duration first
     def filter_by_duration(self, duration: str):
-        qs = self.queryset.filter(application_duration__icontains=duration.strip())
-        if qs.exists():
-            # Apply the filters only if there is at least one result
-            self.queryset = qs
+        self.plan.boost(Q(estimated_duration__icontains=duration.strip()))
@@ -2,12 +2,18 @@ from django.utils.html import strip_tags
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 
+from core.services.cache import CachedResponseMixin
+from jobs.cache import JOBS_VERSION_KEY
 from jobs.models import Job
 from jobs.models.job import JobStatusChoices
 
 
-class JobsSitemapAPIView(ListAPIView):
+class JobsSitemapAPIView(CachedResponseMixin, ListAPIView):
     permission_classes = []
+    cache_per_user = False
+
+    def get_cache_versions(self):
+        return [JOBS_VERSION_KEY]
 
     def list(self, *args, **kwargs):
         try:
@@ -16,7 +22,7 @@ class JobsSitemapAPIView(ListAPIView):
                 status=JobStatusChoices.PUBLISHED,
             ).order_by("-is_third_party", "-created_at", "pricing__budget").values("public_id", "updated_at")[:10]
 
-            return Response(queryset, status=200)
+            return Response(list(queryset), status=200)
         
         except Exception as e:
             return Response({"message": "Internal Server Error"}, status=500)
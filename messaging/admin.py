@@ -1,9 +1,10 @@
 from django.contrib import admin
 
-from .models import Message, Thread
+from .models import Message, Thread, ThreadSummary
 
 # Register your models here.
 
 
 admin.site.register(Thread)
 admin.site.register(Message)
+admin.site.register(ThreadSummary)
@@ -0,0 +1,29 @@
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
+
+from messaging.models import Thread, ThreadSummary
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the inbox summaries of every thread from its messages"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            default=500,
+            type=int,
+            help="The number of threads summarized per batch",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        batch_size = options["batch_size"]
+        thread_ids = list(Thread.objects.order_by("pk").values_list("pk", flat=True))
+
+        summarized = 0
+        for start in range(0, len(thread_ids), batch_size):
+            batch = thread_ids[start : start + batch_size]
+            summarized += ThreadSummary.objects.rebuild(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Summarized {summarized} threads"))
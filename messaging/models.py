@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 
 from users.models import User
 
@@ -30,6 +30,30 @@ class Message(models.Model):
 
     class Meta:
         get_latest_by = "created_at"
+        # Threads are read in (created_at, id) order
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="message_created_idx")
+        ]
+
+
+class ThreadManager(models.Manager):
+
+    def with_last_message(self):
+        """Annotates each thread with the fields of its latest message"""
+
+        messages = Message.objects.filter(thread=models.OuterRef("pk")).order_by(
+            "-created_at", "-id"
+        )
+
+        def last(field: str):
+            return models.Subquery(messages.values(field)[:1])
+
+        return self.select_related("recipient").annotate(
+            last_message_id=last("id"),
+            last_message_content=last("content"),
+            last_message_created_at=last("created_at"),
+            last_message_sender_id=last("sender__public_id"),
+        )
 
 
 class Thread(models.Model):
@@ -46,8 +70,138 @@ class Thread(models.Model):
 
     unique_id = models.CharField(max_length=100, default="")
 
+    objects = ThreadManager()
+
     def __str__(self) -> str:
         return self.owner.__str__()
 
     class Meta:
         get_latest_by = "created_at"
+
+
+# The number of characters of the last message kept in a thread summary
+PREVIEW_LENGTH = 200
+
+
+class ThreadSummaryManager(models.Manager):
+
+    def record_message(self, message: Message, *threads: Thread) -> None:
+        """
+        Points the summaries of the given threads to a new message.
+        The unread count only grows in the threads owned by the message recipient.
+        """
+
+        values = {
+            "last_message": message,
+            "last_message_preview": message.content[:PREVIEW_LENGTH],
+            "last_sender_public_id": message.sender.public_id,
+            "last_activity_at": message.created_at,
+        }
+        for thread in threads:
+            unread = int(thread.owner_id == message.recipient_id)  # type: ignore
+            changes = {
+                **values,
+                "unique_id": thread.unique_id,
+                "unread_count": models.F("unread_count") + unread,
+            }
+
+            with transaction.atomic():
+                if self.filter(thread=thread).update(**changes):
+                    continue
+
+                # The thread's first message. When another first message creates
+                # the summary in the meantime, this one is applied as an update
+                _, created = self.get_or_create(
+                    thread=thread,
+                    defaults={
+                        **values,
+                        "owner_id": thread.owner_id,  # type: ignore
+                        "recipient_id": thread.recipient_id,  # type: ignore
+                        "unique_id": thread.unique_id,
+                        "unread_count": unread,
+                    },
+                )
+                if not created:
+                    self.filter(thread=thread).update(**changes)
+
+    def mark_read(self, thread: Thread) -> int:
+        """Resets the unread count of the thread, returns the previous count"""
+
+        summary = self.filter(thread=thread)
+        while True:
+            unread = summary.values_list("unread_count", flat=True).first()
+            if not unread:
+                return 0
+
+            # Only swaps the count it read, so concurrent opens of the thread
+            # don't both report (and un-badge) the same unread messages
+            if summary.filter(unread_count=unread).update(unread_count=0):
+                return unread
+
+    def rebuild(self, thread_ids: list[int]) -> int:
+        """Recomputes the summaries of the given threads from their messages"""
+
+        threads = list(Thread.objects.with_last_message().filter(pk__in=thread_ids))
+        self.filter(thread__in=threads).delete()
+
+        unread = dict(
+            Message.objects.filter(
+                thread__in=threads,
+                recipient=models.F("thread__owner"),
+                is_read=False,
+            )
+            .values("thread")
+            .annotate(count=models.Count("id"))
+            .values_list("thread", "count")
+        )
+
+        summaries = [
+            self.model(
+                thread=thread,
+                owner_id=thread.owner_id,  # type: ignore
+                recipient_id=thread.recipient_id,  # type: ignore
+                unique_id=thread.unique_id,
+                last_message_id=thread.last_message_id,  # type: ignore
+                last_message_preview=thread.last_message_content[:PREVIEW_LENGTH],  # type: ignore
+                last_sender_public_id=thread.last_message_sender_id,  # type: ignore
+                last_activity_at=thread.last_message_created_at,  # type: ignore
+                unread_count=unread.get(thread.pk, 0),
+            )
+            for thread in threads
+            if thread.last_message_id is not None  # type: ignore
+        ]
+        self.bulk_create(summaries)
+        return len(summaries)
+
+
+class ThreadSummary(models.Model):
+    """
+    The inbox entry of a thread, kept up to date as messages are sent,
+    so the inbox is listed without joining the threads to their messages.
+    """
+
+    thread = models.OneToOneField(
+        Thread, on_delete=models.CASCADE, related_name="summary"
+    )
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="thread_summaries"
+    )
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    unique_id = models.CharField(max_length=100, default="")
+
+    last_message = models.ForeignKey(
+        Message, on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    last_message_preview = models.CharField(max_length=PREVIEW_LENGTH, default="")
+    last_sender_public_id = models.CharField(max_length=100, default="")
+    last_activity_at = models.DateTimeField()
+
+    unread_count = models.PositiveIntegerField(default=0)
+
+    objects = ThreadSummaryManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["owner", "-last_activity_at"])]
+
+    def __str__(self) -> str:
+        return f"{self.owner_id} - {self.unique_id}"  # type: ignore
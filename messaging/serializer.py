@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import Message, Thread
+from .models import Message, Thread, ThreadSummary
 
 
 class MessagingCreateSerializer(serializers.ModelSerializer):
@@ -36,6 +36,21 @@ class ThreadListSerializer(serializers.ModelSerializer):
         }
 
     def get_messaging(self, instance: Thread):
+        # Annotated by `Thread.objects.with_last_message()`
+        if hasattr(instance, "last_message_id"):
+            if instance.last_message_id is None:  # type: ignore
+                return [{}]
+            return [
+                {
+                    "id": instance.last_message_id,  # type: ignore
+                    "content": instance.last_message_content,  # type: ignore
+                    "created_at": serializers.DateTimeField().to_representation(
+                        instance.last_message_created_at  # type: ignore
+                    ),
+                    "sender_id": instance.last_message_sender_id,  # type: ignore
+                }
+            ]
+
         last_message: Message = instance.messaging.latest("created_at")
 
         if not last_message:
@@ -47,3 +62,34 @@ class ThreadListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Thread
         fields = ["id", "unique_id", "recipient", "messaging"]
+
+
+class ThreadSummarySerializer(serializers.ModelSerializer):
+    """Lists an inbox entry in the shape of `ThreadListSerializer`"""
+
+    id = serializers.IntegerField(source="thread_id")
+    recipient = serializers.SerializerMethodField()
+    messaging = serializers.SerializerMethodField()
+
+    def get_recipient(self, instance: ThreadSummary):
+        return {
+            "name": instance.recipient.name,
+            "avatar": instance.recipient.avatar,
+            "public_id": instance.recipient.public_id,
+        }
+
+    def get_messaging(self, instance: ThreadSummary):
+        return [
+            {
+                "id": instance.last_message_id,  # type: ignore
+                "content": instance.last_message_preview,
+                "created_at": serializers.DateTimeField().to_representation(
+                    instance.last_activity_at
+                ),
+                "sender_id": instance.last_sender_public_id,
+            }
+        ]
+
+    class Meta:
+        model = ThreadSummary
+        fields = ["id", "unique_id", "unread_count", "recipient", "messaging"]
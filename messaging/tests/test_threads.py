@@ -0,0 +1,174 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from messaging.models import Message, Thread, ThreadSummary
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+
+@pytest.fixture
+def owner(db):
+    return User.objects.create(username="owner", email="owner@mail.com")
+
+
+def create_thread(owner, name: str, *contents: str):
+    recipient = User.objects.create(
+        username=name, email=f"{name}@mail.com", first_name=name.title()
+    )
+    thread = Thread.objects.create(owner=owner, recipient=recipient, unique_id=name)
+    for content in contents:
+        message = Message.objects.create(
+            sender=recipient, recipient=owner, content=content
+        )
+        thread.messaging.add(message)
+    ThreadSummary.objects.rebuild([thread.pk])
+    return thread
+
+
+@pytest.mark.django_db
+def test_thread_list_reads_the_summaries(api_client, owner):
+    for index in range(5):
+        create_thread(owner, f"user{index}", "Hello", f"Last message {index}")
+    create_thread(owner, "silent")
+
+    api_client.force_authenticate(user=owner)
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(reverse("threads_list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    threads = {thread["unique_id"]: thread for thread in response.data["payload"]}
+    assert set(threads) == {f"user{index}" for index in range(5)}
+
+    last_message = threads["user3"]["messaging"][0]
+    assert last_message["content"] == "Last message 3"
+    assert last_message["sender_id"] == User.objects.get(username="user3").public_id
+    assert threads["user3"]["recipient"]["name"] == "User3"
+    assert threads["user3"]["unread_count"] == 2
+
+    sql = [query["sql"] for query in queries if not query["sql"].startswith("EXPLAIN")]
+    assert not any('"messaging_thread_messaging"' in query for query in sql)
+
+
+@pytest.mark.django_db
+def test_thread_annotation_finds_the_last_message(owner):
+    create_thread(owner, "user", "Hello", "Last message")
+
+    thread = Thread.objects.with_last_message().get(owner=owner)
+
+    assert thread.last_message_content == "Last message"
+
+
+@pytest.mark.django_db
+def test_sending_a_message_updates_both_summaries(api_client, owner):
+    recipient = User.objects.create(
+        username="talent", email="talent@mail.com", is_talent=True
+    )
+    Talent.objects.create(user=recipient)
+
+    api_client.force_authenticate(user=owner)
+    for content in ("Hello", "Are you there?"):
+        response = api_client.post(
+            reverse("m_create"),
+            {"recipient": recipient.public_id, "content": content},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    sent = ThreadSummary.objects.get(owner=owner)
+    received = ThreadSummary.objects.get(owner=recipient)
+    assert sent.last_message_preview == received.last_message_preview
+    assert received.last_message_preview == "Are you there?"
+    assert (sent.unread_count, received.unread_count) == (0, 2)
+
+    # Opening the thread marks it as read, the thread's unique_id is saved
+    # after the response, which the test client doesn't run
+    Thread.objects.filter(owner=recipient).update(unique_id=received.unique_id)
+    api_client.force_authenticate(user=recipient)
+    response = api_client.get(reverse("m_list"), {"id": received.unique_id})
+    assert response.status_code == status.HTTP_200_OK
+    received.refresh_from_db()
+    assert received.unread_count == 0
+
+
+@pytest.mark.django_db
+def test_concurrent_first_messages_share_the_summary(owner, monkeypatch):
+    thread = create_thread(owner, "user", "Hello")
+    message = Message.objects.create(
+        sender=thread.recipient, recipient=owner, content="Are you there?"
+    )
+
+    # Another request creates the summary between this one's update and insert
+    update = QuerySet.update
+    missed = []
+
+    def miss_the_first_update(self, **kwargs):
+        if self.model is ThreadSummary and not missed:
+            missed.append(kwargs)
+            return 0
+        return update(self, **kwargs)
+
+    monkeypatch.setattr(QuerySet, "update", miss_the_first_update)
+    ThreadSummary.objects.record_message(message, thread)
+
+    summary = ThreadSummary.objects.get(thread=thread)
+    assert summary.last_message_preview == "Are you there?"
+    assert summary.unread_count == 2
+
+
+@pytest.mark.django_db
+def test_concurrent_opens_report_the_unread_count_once(owner, monkeypatch):
+    thread = create_thread(owner, "user", "Hello", "Are you there?")
+
+    # Another request opens the thread after this one read the unread count
+    update = QuerySet.update
+    opened = []
+
+    def open_elsewhere_first(self, **kwargs):
+        if self.model is ThreadSummary and not opened:
+            opened.append(True)
+            opened.append(ThreadSummary.objects.mark_read(thread))
+        return update(self, **kwargs)
+
+    monkeypatch.setattr(QuerySet, "update", open_elsewhere_first)
+
+    assert ThreadSummary.objects.mark_read(thread) == 0
+    assert opened[1] == 2
+    assert ThreadSummary.objects.get(thread=thread).unread_count == 0
+
+
+@pytest.mark.django_db
+def test_thread_messages_after_and_before_a_message(api_client, owner):
+    contents = [f"Message {index}" for index in range(20)]
+    thread = create_thread(owner, "user", *contents)
+    ids = list(
+        thread.messaging.order_by("created_at", "pk").values_list("pk", flat=True)
+    )
+
+    api_client.force_authenticate(user=owner)
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(
+            reverse("m_list"), {"id": "user", "after_id": ids[16]}
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [m["content"] for m in response.data["payload"]] == contents[17:]
+    assert response.data["has_more"] is False
+    assert not any("COUNT(" in query["sql"] for query in queries)
+
+    response = api_client.get(reverse("m_list"), {"id": "user", "before_id": ids[18]})
+    assert [m["content"] for m in response.data["payload"]] == contents[3:18]
+    assert response.data["has_more"] is True
+
+    response = api_client.get(reverse("m_list"), {"id": "user", "after_id": "x"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -5,16 +5,18 @@ from rest_framework.generics import CreateAPIView, DestroyAPIView, ListAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from core.services.after.main import AfterResponseService
+from core.services.badges import BadgeService
+from core.services.events import EventService
 from users.models import User
 from utilities.generator import get_serializer_error_message
 from utilities.time import utc_datetime
 
-from .models import Message, Thread
+from .models import Message, Thread, ThreadSummary
 from .serializer import (
     MessagingCreateSerializer,
     MessagingListSerializer,
     ThreadListSerializer,
+    ThreadSummarySerializer,
 )
 
 
@@ -22,7 +24,7 @@ from .serializer import (
 @permission_classes([IsAuthenticated])
 def latest_thread(request):
     user = request.user
-    thread = Thread.objects.filter(owner=user).latest()
+    thread = Thread.objects.with_last_message().filter(owner=user).latest()
 
     serializer = ThreadListSerializer(thread, many=False, context={"request": request})
 
@@ -35,6 +37,8 @@ class ThreadDeleteAPIView(DestroyAPIView):
         deleted = False
 
         if thread:
+            unread = ThreadSummary.objects.mark_read(thread)
+            BadgeService.decrement(thread.owner_id, "messages", unread)  # type: ignore
             thread.delete()
             deleted = True
 
@@ -55,14 +59,15 @@ class ThreadDeleteAPIView(DestroyAPIView):
 
 
 class ThreadListAPIView(ListAPIView):
-    serializer_class = ThreadListSerializer
+    serializer_class = ThreadSummarySerializer
+    cursor_ordering = ("-last_activity_at", "-pk")
 
     def get_queryset(self):
         user = self.request.user
         queryset = (
-            Thread.objects.filter(owner=user, messaging__gt=0)
-            .order_by("-updated_at")
-            .distinct()
+            ThreadSummary.objects.filter(owner=user)
+            .select_related("recipient")
+            .order_by("-last_activity_at")
         )
         return queryset
 
@@ -82,7 +87,7 @@ class ThreadSearchAPIView(ListAPIView):
         query = search_params.get("q")
 
         if query:
-            queryset = Thread.objects.filter(
+            queryset = Thread.objects.with_last_message().filter(
                 Q(recipient__public_id__icontains=query)
                 | Q(recipient__first_name__icontains=query)
                 | Q(recipient__last_name__icontains=query),
@@ -101,7 +106,14 @@ class ThreadSearchAPIView(ListAPIView):
 
 
 class ThreadMessagesAPIView(ListAPIView):
+    """
+    The messages of a thread, oldest first.
+    `?after_id=` and `?before_id=` return the messages sent after or before
+    a message of the thread, at most a page of them and without counting the thread.
+    """
+
     serializer_class = MessagingListSerializer
+    ordering = ("created_at", "pk")
 
     def get_queryset(self, query_params):
         user = self.request.user
@@ -113,10 +125,12 @@ class ThreadMessagesAPIView(ListAPIView):
         thread = Thread.objects.filter(owner=user, unique_id=thread_unique_id).first()
 
         if thread:
+            unread = ThreadSummary.objects.mark_read(thread)
+            BadgeService.decrement(user.pk, "messages", unread)
             queryset = (
                 thread.messaging.filter()
                 .select_related("sender")
-                .order_by("created_at")
+                .order_by(*self.ordering)
             )
             return queryset
         return
@@ -124,14 +138,52 @@ class ThreadMessagesAPIView(ListAPIView):
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset(request.query_params)
 
-        if not queryset:
+        if queryset is None:
             return Response(status=403)
 
+        after_id = request.query_params.get("after_id")
+        before_id = request.query_params.get("before_id")
+        if after_id or before_id:
+            return self.list_around(queryset, after_id or before_id, bool(before_id))
+
         page = self.paginate_queryset(queryset)
 
         serializer = self.get_serializer(page, many=True, context={"request": request})
         return self.get_paginated_response(serializer.data)  # type:ignore
 
+    def list_around(self, queryset, message_id: str, before: bool):
+        """Lists the messages sent after, or `before`, the given message"""
+
+        position = None
+        if message_id.isdigit():
+            position = queryset.filter(pk=message_id).values_list(*self.ordering)
+            position = position.first()
+
+        if position is None:
+            return Response({"message": "This request is invalid"}, status=400)
+
+        paginator = self.paginator
+        page_size = paginator.get_page_size(self.request) or paginator.page_size
+
+        queryset = queryset.filter(
+            paginator.keyset_filter(self.ordering, position, reverse=before)
+        )
+        if before:
+            queryset = queryset.reverse()
+
+        messages = list(queryset[: page_size + 1])
+        has_more = len(messages) > page_size
+        messages = messages[:page_size]
+        if before:
+            messages.reverse()
+
+        serializer = self.get_serializer(
+            messages, many=True, context={"request": self.request}
+        )
+        return Response(
+            {"page_size": page_size, "has_more": has_more, "payload": serializer.data}
+        )
+
 
 class MessagingCreateAPIView(CreateAPIView):
     def create(self, request, *args, **kwargs):
@@ -200,10 +252,24 @@ class MessagingCreateAPIView(CreateAPIView):
 
                 sender_thread.messaging.add(new_message)
                 recipient_thread.messaging.add(new_message)
+                ThreadSummary.objects.record_message(
+                    new_message, sender_thread, recipient_thread
+                )
+                transaction.on_commit(
+                    lambda: BadgeService.increment(recipient.pk, "messages")
+                )
 
                 serializer = MessagingListSerializer(new_message)
                 response = {"chat": serializer.data}
 
+                event = {
+                    "unique_id": recipient_thread.unique_id,
+                    "chat": serializer.data,
+                }
+                transaction.on_commit(
+                    lambda: EventService.publish(recipient.pk, "message", event)
+                )
+
                 if created:
                     t_serializer = ThreadListSerializer(
                         sender_thread, context={"request": request}
@@ -228,7 +294,7 @@ class MessagingCreateAPIView(CreateAPIView):
                     elif save_sender_thread:
                         sender_thread.save()
 
-                AfterResponseService.schedule_after(update_threads_info)
+                update_threads_info()
 
                 return Response(response, status=201)
 
@@ -1,11 +1,12 @@
 from rest_framework import serializers
 
+from core.serializers import CompiledSerializerMixin
 from users.serializer import UserSerializer
 
 from .models import Notification
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(CompiledSerializerMixin, serializers.ModelSerializer):
     sender = serializers.SerializerMethodField()
 
     def get_sender(self, instance: Notification):
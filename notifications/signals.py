@@ -4,35 +4,21 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils.html import strip_tags
 
-from core.services.email.main import EmailService
+from core.services.notifications import NotificationService
 from proposals.models import Proposal, ProposalStatusChoices
 
 from .models import Notification
 
 
 @receiver(post_save, sender=Notification)
-def send_email_notification(sender, instance: Notification, created, **kwargs):
+def dispatch_notification(sender, instance: Notification, created, **kwargs):
     """
     - Check to see if a new notification is created
-    - If it is, and it is not already emailed, send an email to the recipient
+    - If it is, count it in the recipient's badges, push it to the recipient
+      and queue its email if it is not already emailed
     """
-    if created and not instance.is_emailed:
-        subject = instance.hint_text
-        email = instance.recipient.email
-        text = strip_tags(instance.content_text or "")
-        html_template_name = "emails/default.html"
-        html_template_context = {"content": text}
-
-        EmailService().send(
-            email,
-            subject,
-            text,
-            html_template_name=html_template_name,
-            html_template_context=html_template_context,
-        )
-
-        instance.is_emailed = True
-        instance.save()
+    if created:
+        NotificationService.dispatch([instance])
 
 
 @receiver(post_save, sender=Proposal)
@@ -5,6 +5,8 @@ from rest_framework.generics import (
 )
 from rest_framework.response import Response
 
+from core.services.badges import BadgeService
+
 from .models import Notification
 from .serializer import NotificationSerializer
 
@@ -38,9 +40,10 @@ class NotificationSeenAPIView(UpdateAPIView):
         user = request.user
         notification_ids = request.data.get("ids", [])
 
-        Notification.objects.select_related().filter(
-            recipient=user, id__in=notification_ids
+        seen = Notification.objects.filter(
+            recipient=user, id__in=notification_ids, is_seen=False
         ).update(is_seen=True)
+        BadgeService.decrement(user.pk, "notifications", seen)
 
         return Response({}, status=200)
 
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from contracts.models import Contract
+from core.services.dashboard import CLIENT_PROJECT_METRICS, DashboardRollupService
+from projects.models import Project
+
+
+@receiver(post_delete, sender=Project)
+def update_client_dashboard(sender, instance: Project, **kwargs):
+    client_id = (
+        Contract.objects.filter(pk=instance.contract_id)
+        .values_list("client_id", flat=True)
+        .first()
+    )
+    DashboardRollupService.schedule(
+        CLIENT_PROJECT_METRICS, client_id, [instance.created_at]
+    )
@@ -6,6 +6,7 @@ from contracts.models import (
     ContractProgressChoices,
     ContractStatusChoices,
 )
+from core.services.dashboard import CLIENT_PROJECT_METRICS, DashboardRollupService
 from notifications.models import Notification
 from projects.models import Project, ProjectStatusChoices
 
@@ -134,3 +135,12 @@ def on_project_status_changed(sender, instance: Project, created, **kwargs):
         )
 
     # TODO: Notify users through email
+
+
+@receiver(post_save, sender=Project)
+def update_client_dashboard(sender, instance: Project, **kwargs):
+    """Refreshes the client's dashboard month of the project"""
+
+    DashboardRollupService.schedule(
+        CLIENT_PROJECT_METRICS, instance.contract.client_id, [instance.created_at]
+    )
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from unfold.admin import ModelAdmin
 
+from core.admin.actions import export_as_json
+
 from .models import Proposal
 
 
@@ -12,3 +14,4 @@ class ActivityModelAdmin(ModelAdmin):
         "talent",
         "duration",
     ]
+    actions = [export_as_json]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0008_job_relevance_score"),
+        ("proposals", "0002_initial"),
+        ("talents", "0005_remove_talent_applications_ids"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="proposal",
+            index=models.Index(
+                fields=["talent", "job"], name="proposal_talent_job_idx"
+            ),
+        ),
+    ]
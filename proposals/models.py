@@ -52,12 +52,18 @@ class Proposal(models.Model):
     status = models.CharField(
         max_length=200,
         choices=ProposalStatusChoices.choices,
-        default=ProposalStatusChoices.PENDING
+        default=ProposalStatusChoices.PENDING,
     )
 
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Backs the "already applied" anti-join of the job listings
+            models.Index(fields=["talent", "job"], name="proposal_talent_job_idx"),
+        ]
+
     @classmethod
     def _active_statuses(cls):
         return [
@@ -65,15 +71,14 @@ class Proposal(models.Model):
             ProposalStatusChoices.PENDING,
             ProposalStatusChoices.ACCEPTED,
         ]
-    
+
     @property
     def short_cover_letter(self):
-        value = re.sub(r'<[^>]*>', '', self.cover_letter)[:200]
+        value = re.sub(r"<[^>]*>", "", self.cover_letter)[:200]
         if len(self.cover_letter) > 200:
             value += "..."
         return value
 
-
     def _terminate(self, reason=None, commit_save=True):
         self.status = ProposalStatusChoices.TERMINATED
         self.client_comment = reason
@@ -84,6 +89,18 @@ class Proposal(models.Model):
         Notify the talent about the proposal status
         """
 
+        email_service = EmailService()
+
+        email_service.send(
+            **self.talent_email(status),
+            execute_now=is_after_response == True,
+        )
+
+    def talent_email(self, status: ProposalStatusChoices) -> dict:
+        """
+        The email notifying the talent about the proposal status
+        """
+
         subject = ""
         sender_name = "Dokoola Team"
         html_template_name = ""
@@ -105,16 +122,13 @@ class Proposal(models.Model):
             subject = "Job Proposal Withdrawn"
             html_template_name = "emails/jobs/proposal_withdrawn.html"
 
-        email_service = EmailService()
-
-        email_service.send(
-            self.talent.user.email,
-            subject,
-            sender_name=sender_name,
-            html_template_name=html_template_name,
-            html_template_context=html_template_context,
-            execute_now=is_after_response == True,
-        )
+        return {
+            "email": self.talent.user.email,
+            "subject": subject,
+            "sender_name": sender_name,
+            "html_template_name": html_template_name,
+            "html_template_context": html_template_context,
+        }
 
     def save(self, *args, **kwargs):
         if self._state.adding:
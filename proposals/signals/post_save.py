@@ -1,10 +1,13 @@
+from django.db.models import F
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from core.services.tasks import TaskQueue
 from jobs.models.activities import Activities
 from jobs.models.job import Job, JobStatusChoices
 from talents.models.talent import Talent
 
+from .. import tasks
 from ..models import Proposal
 
 
@@ -27,19 +30,16 @@ def update_job_details(sender, instance: Proposal, created, **kwargs):
             metadata=metdata_data, applicant_ids=list(set(applicant_ids))
         )
 
-        # Update the talent's details
-        talent_applicants_id = set(instance.talent.applications_ids or [])
-        talent_applicants_id.add(instance.job.public_id)
-
+        # Charge the talent the proposal's bits
         if not instance.job.is_third_party:
-            bits = instance.talent.bits - instance.bits_amount
-            Talent.objects.filter(id=instance.talent.pk).update(
-                bits=bits, applications_ids=talent_applicants_id
-            )
-        else:
             Talent.objects.filter(id=instance.talent.pk).update(
-                applications_ids=list(talent_applicants_id)
+                bits=F("bits") - instance.bits_amount
             )
 
         # Notify the client
-        instance.job.notify_client(JobStatusChoices.PUBLISHED, new_proposal=instance)
+        TaskQueue.enqueue(
+            tasks.notify_client,
+            instance.job.pk,
+            JobStatusChoices.PUBLISHED,
+            new_proposal_id=instance.pk,
+        )
@@ -0,0 +1,34 @@
+from jobs.models.job import Job
+
+from .models import Proposal
+
+
+def notify_talent(proposal_id: int, status: str) -> None:
+    """Emails the talent of a proposal about its new status"""
+
+    proposal = Proposal.objects.select_related("job__client__user", "talent__user").get(
+        pk=proposal_id
+    )
+    proposal.notify_talent(status)  # type: ignore
+
+
+def notify_client(
+    job_id: int,
+    job_status: str,
+    proposal_id: int | None = None,
+    new_proposal_id: int | None = None,
+) -> None:
+    """Emails the client of a job about its new status or a new proposal"""
+
+    job = Job.objects.select_related("client__user").get(pk=job_id)
+    proposals = Proposal.objects.select_related("talent__user")
+    proposal = proposals.get(pk=proposal_id) if proposal_id else None
+    new_proposal = proposals.get(pk=new_proposal_id) if new_proposal_id else None
+    job.notify_client(job_status, proposal=proposal, new_proposal=new_proposal)
+
+
+def withdraw_other_proposals(job_id: int, job_status: str) -> None:
+    """Updates the job status and withdraws its pending proposals"""
+
+    job = Job.objects.get(pk=job_id)
+    job.update_status_and_withdraw_proposals(job_status=job_status)
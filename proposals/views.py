@@ -12,15 +12,17 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from core.constants import DokoolaConstants
-from core.services.after.main import AfterResponseService
 from core.services.logger import DokoolaLoggerService
+from core.services.tasks import TaskQueue
 from jobs.models import Job
 from jobs.models.activities import Activities
 from jobs.models.job import JobStatusChoices
+from src.features.streaming import StreamingListMixin
 from talents.models import Talent  # Updated import
 from users.models import User
 from utilities.generator import get_serializer_error_message
 
+from . import tasks
 from .models import Attachment, Proposal, ProposalStatusChoices
 from .serializers import (
     ProposalCreateSerializer,
@@ -32,7 +34,7 @@ from .serializers import (
 )
 
 
-class ProposalListApiView(ListAPIView):
+class ProposalListApiView(StreamingListMixin, ListAPIView):
     serializer_class = ProposalListSerializer
 
     def get_queryset(self):
@@ -42,38 +44,31 @@ class ProposalListApiView(ListAPIView):
                 user_public_id
             )
 
-            print("===================================================================")
-            print(profile, profile_type)
-            print("===================================================================")
             if profile:
 
                 # Check if the user is a client or a talent
                 if profile_type.lower() == "client":
                     # Gets all proposals for jobs that the client has posted
                     queryset = (
-                        Proposal.objects.select_related(
-                            "job__client__user", "talent__user"
-                        )
+                        Proposal.objects.filter(job__client=profile)
+                        .select_related("job__client__user", "talent__user")
                         .prefetch_related("attachments")
                         .order_by("-updated_at")
                     )
 
                 # Gets all proposals for jobs that the talent has applied to
                 elif profile_type.lower() == "talent":
-                    queryset = Proposal.objects.filter(talent=profile).order_by(
-                        "-updated_at"
+                    queryset = (
+                        Proposal.objects.filter(talent=profile)
+                        .select_related("job__client__user", "talent__user")
+                        .prefetch_related("attachments")
+                        .order_by("-updated_at")
                     )
                 else:
-                    queryset = []
+                    queryset = Proposal.objects.none()
 
                 return queryset
-        return []
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(page, many=True, context={"request": request})
-        return self.get_paginated_response(serializer.data)
+        return Proposal.objects.none()
 
 
 class ProposalRetrieveApiView(RetrieveAPIView):
@@ -208,17 +203,21 @@ class ProposalUpdateAPIView(GenericAPIView):
                         proposal.status = ProposalStatusChoices.ACCEPTED
                         proposal.save()
 
-                        AfterResponseService.schedule_task(
-                            proposal.notify_talent, ProposalStatusChoices.ACCEPTED
+                        TaskQueue.enqueue(
+                            tasks.notify_talent,
+                            proposal.pk,
+                            ProposalStatusChoices.ACCEPTED,
                         )
-                        AfterResponseService.schedule_task(
-                            proposal.job.notify_client,
+                        TaskQueue.enqueue(
+                            tasks.notify_client,
+                            proposal.job.pk,
                             JobStatusChoices.IN_PROGRESS,
-                            proposal,
+                            proposal_id=proposal.pk,
                         )
-                        AfterResponseService.schedule_task(
-                            proposal.job.update_status_and_withdraw_proposals,
-                            job_status=JobStatusChoices.IN_PROGRESS,
+                        TaskQueue.enqueue(
+                            tasks.withdraw_other_proposals,
+                            proposal.job.pk,
+                            JobStatusChoices.IN_PROGRESS,
                         )
 
                     elif _status == ProposalStatusChoices.DECLINED:
@@ -233,8 +232,10 @@ class ProposalUpdateAPIView(GenericAPIView):
 
                         proposal.status = ProposalStatusChoices.DECLINED
                         proposal.save()
-                        AfterResponseService.schedule_task(
-                            proposal.notify_talent, ProposalStatusChoices.DECLINED
+                        TaskQueue.enqueue(
+                            tasks.notify_talent,
+                            proposal.pk,
+                            ProposalStatusChoices.DECLINED,
                         )
 
                     elif _status == ProposalStatusChoices.TERMINATED:
@@ -249,8 +250,10 @@ class ProposalUpdateAPIView(GenericAPIView):
 
                         proposal.status = ProposalStatusChoices.TERMINATED
                         proposal.save()
-                        AfterResponseService.schedule_task(
-                            proposal.notify_talent, ProposalStatusChoices.TERMINATED
+                        TaskQueue.enqueue(
+                            tasks.notify_talent,
+                            proposal.pk,
+                            ProposalStatusChoices.TERMINATED,
                         )
 
                     else:
@@ -1,5 +1,6 @@
 from django.db import models
 
+
 class Review(models.Model):
     author = models.ForeignKey(
         "users.User", related_name="user_reviews", on_delete=models.CASCADE
@@ -13,3 +14,42 @@ class Review(models.Model):
 
     def __str__(self):
         return f"[{self.rating}] - {self.text[:25]}"
+
+
+class RatedProfileMixin:
+    """
+    Keeps a profile's rating as the sum and count of its reviews' ratings,
+    moved by the paths writing reviews so that reading it never aggregates.
+    The model defines the `rating_sum`, `reviews_count` and `rating` fields.
+    """
+
+    DEFAULT_RATING = 3.5
+
+    def average_rating(self) -> float:
+        if not self.reviews_count:  # type: ignore
+            return self.DEFAULT_RATING
+        return self.rating_sum / self.reviews_count  # type: ignore
+
+    def update_rating(self, rating: float, count: int = 1) -> None:
+        """
+        Adds `rating` over `count` reviews to the profile's rating, negative
+        values remove reviews (e.g. `update_rating(-review.rating, -1)`)
+        """
+
+        reviews_count = models.F("reviews_count") + count
+        type(self).objects.filter(pk=self.pk).update(  # type: ignore
+            rating_sum=models.F("rating_sum") + rating,
+            reviews_count=reviews_count,
+            rating=models.Case(
+                # No reviews left, back to the field's default
+                models.When(
+                    reviews_count__lte=-count,
+                    then=self._meta.get_field("rating").default,  # type: ignore
+                ),
+                default=(models.F("rating_sum") + rating) / reviews_count,
+                output_field=models.FloatField(),
+            ),
+        )
+        self.refresh_from_db(  # type: ignore
+            fields=["rating_sum", "reviews_count", "rating"]
+        )
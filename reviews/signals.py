@@ -0,0 +1,26 @@
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from core.services.dashboard import (
+    CLIENT_REVIEWS,
+    TALENT_REVIEWS,
+    DashboardRollupService,
+)
+from reviews.models import Review
+
+
+@receiver(post_save, sender=Review)
+@receiver(pre_delete, sender=Review)
+def update_reviewed_profiles_dashboard(sender, instance: Review, **kwargs):
+    """Refreshes the dashboards of the profiles an edited/deleted review is on"""
+
+    if kwargs.get("created"):
+        # Counted once it's added to a profile
+        return
+
+    for metric, profiles in (
+        (CLIENT_REVIEWS, instance.client),  # type: ignore
+        (TALENT_REVIEWS, instance.talent_reviews),  # type: ignore
+    ):
+        for profile_id in profiles.values_list("pk", flat=True):
+            DashboardRollupService.schedule([metric], profile_id, [instance.created_at])
@@ -0,0 +1,68 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from jobs.serializers.retrieve import JobClientSerializer
+from reviews.models import Review
+from talents.models import Talent
+from users.models.user import User
+
+
+@pytest.fixture
+def author(db):
+    return User.objects.create(
+        username="author", email="author@mail.com", is_active=True
+    )
+
+
+@pytest.fixture
+def api_client(author):
+    api_client = APIClient()
+    api_client.force_authenticate(user=author)
+    return api_client
+
+
+@pytest.mark.django_db
+def test_reviews_move_the_talent_rating(api_client):
+    talent = Talent.objects.create(
+        user=User.objects.create(username="talent", email="talent@mail.com")
+    )
+    url = f"/api/reviews/{talent.public_id}/"
+
+    for rating in (5, 4):
+        response = api_client.post(url, {"rating": rating, "text": "Great"})
+        assert response.status_code == 201
+
+    talent.refresh_from_db()
+    assert (talent.rating_sum, talent.reviews_count, talent.rating) == (9, 2, 4.5)
+
+    review = talent.reviews.get(rating=4)
+    response = api_client.put(url, {"public_id": review.pk, "rating": 2})
+    assert response.status_code == 200
+    talent.refresh_from_db()
+    assert (talent.reviews_count, talent.average_rating()) == (2, 3.5)
+
+    for review in Review.objects.all():
+        api_client.delete(f"{url}?rid={review.pk}")
+    talent.refresh_from_db()
+    assert (talent.reviews_count, talent.rating) == (0, 3.5)
+    assert talent.average_rating() == Talent.DEFAULT_RATING
+
+
+@pytest.mark.django_db
+def test_client_rating_is_read_without_queries(author):
+    client = Client.objects.create(
+        user=User.objects.create(username="client", email="client@mail.com")
+    )
+    review = Review.objects.create(author=author, rating=4)
+    client.reviews.add(review)
+    client.update_rating(review.rating)
+
+    serializer = JobClientSerializer(client, context={"detail": True})
+    with CaptureQueriesContext(connection) as queries:
+        rating = serializer.to_representation(client)["rating"]
+
+    assert rating == 4
+    assert not [q for q in queries if "review" in q["sql"] or "UPDATE" in q["sql"]]
@@ -10,7 +10,7 @@ from talents.models import Talent
 from users.models import User
 from utilities.generator import get_serializer_error_message
 
-from .models import Review
+from .models import RatedProfileMixin, Review
 from .serializer import ReviewReadSerializer, ReviewWriteSerializer
 
 
@@ -70,6 +70,8 @@ class ReviewsGenericAPIView(GenericAPIView):
                 if serializer.is_valid():
                     review = serializer.save(author=request.user)
                     profile.reviews.add(review)
+                    if isinstance(profile, RatedProfileMixin):
+                        profile.update_rating(review.rating)
                     _serializer = self.get_serializer(review)
                     return Response(_serializer.data, status=201)
 
@@ -98,11 +100,12 @@ class ReviewsGenericAPIView(GenericAPIView):
                     return Response({"message": "Profile does not exists"}, status=404)
 
                 review = profile.reviews.get(id=review_public_id)
-                serializer = ReviewWriteSerializer.merge_serialize(
-                    instance, request.data
-                )
+                previous_rating = review.rating
+                serializer = ReviewWriteSerializer.merge_serialize(review, request.data)
                 if serializer.is_valid():
                     _review = serializer.save()
+                    if isinstance(profile, RatedProfileMixin):
+                        profile.update_rating(_review.rating - previous_rating, 0)
                     _serializer = self.get_serializer(_review)
                     return Response(_serializer.data, status=200)
 
@@ -130,6 +133,8 @@ class ReviewsGenericAPIView(GenericAPIView):
 
                 review = profile.reviews.get(id=review_public_id)
                 review.delete()
+                if isinstance(profile, RatedProfileMixin):
+                    profile.update_rating(-review.rating, -1)
 
                 return Response({"message": "Review Deleted Successfully"}, status=204)
 
@@ -2,6 +2,8 @@
 ASGI config for src project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The event stream at /api/events/ is only streamed when served through it,
+e.g. `uvicorn src.asgi:application`.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
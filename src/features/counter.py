@@ -0,0 +1,129 @@
+import json
+from hashlib import md5
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+# How long an exact count is reused for the same query
+COUNT_CACHE_TIMEOUT = 60
+
+# Above this many planner estimated rows the estimate is returned as is
+COUNT_ESTIMATE_THRESHOLD = 10_000
+
+
+class ObjectsCount(NamedTuple):
+    value: int
+    exact: bool
+
+
+def count_objects(
+    object_list,
+    timeout: int = COUNT_CACHE_TIMEOUT,
+    estimate_threshold: int | None = COUNT_ESTIMATE_THRESHOLD,
+) -> ObjectsCount:
+    """
+    Counts a queryset, reusing the count of an identical query for `timeout`
+    seconds. On PostgreSQL, queries the planner expects to return more than
+    `estimate_threshold` rows are not counted but estimated.
+    """
+
+    if not isinstance(object_list, QuerySet):
+        return ObjectsCount(len(object_list), True)
+
+    # The ordering never changes the count
+    queryset = object_list.order_by()
+    sql, params = queryset.query.sql_with_params()
+    digest = md5(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+    key = f"count:{queryset.model._meta.label_lower}:{digest}"
+
+    count = cache.get(key)
+    if count is not None:
+        return ObjectsCount(*count)
+
+    count = None
+    if estimate_threshold is not None:
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate >= estimate_threshold:
+            count = ObjectsCount(estimate, False)
+
+    if count is None:
+        count = ObjectsCount(queryset.count(), True)
+
+    cache.set(key, tuple(count), timeout)
+    return count
+
+
+def estimate_count(queryset: QuerySet) -> int | None:
+    """Returns the planner's row estimate of a query, on PostgreSQL only"""
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class LookaheadPage(Page):
+    """A page that knows whether a next one exists without the paginator's count"""
+
+    def __init__(self, object_list, number, paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+
+class CountingPaginator(Paginator):
+    """
+    A Django paginator counting its objects through `count_objects`.
+
+    That count may be stale or estimated, so it's only displayed. Pages are
+    validated by reading one row past the page instead, which also tells
+    whether there is a next page.
+    """
+
+    count_timeout = COUNT_CACHE_TIMEOUT
+    count_estimate_threshold = COUNT_ESTIMATE_THRESHOLD
+
+    @cached_property
+    def objects_count(self) -> ObjectsCount:
+        return count_objects(
+            self.object_list, self.count_timeout, self.count_estimate_threshold
+        )
+
+    @cached_property
+    def count(self) -> int:
+        return self.objects_count.value
+
+    def validate_number(self, number) -> int:
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"]) from None
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number) -> LookaheadPage:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages["no_results"])
+        return LookaheadPage(
+            rows[: self.per_page], number, self, len(rows) > self.per_page
+        )
@@ -1,19 +1,56 @@
+import base64
+import json
 import math
+from functools import reduce
+from operator import or_
 
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from src.features.counter import CountingPaginator, ObjectsCount, count_objects
+
+# The timestamp fields a listing can be paginated on with cursors
+CURSOR_FIELDS = ("created_at", "updated_at")
 
 
 class DokoolaPaginator(pagination.PageNumberPagination):
+    """
+    Page number pagination, with a keyset (cursor) mode for timestamp sorted lists.
+
+    The cursor mode is used when the view sets `pagination_mode = "cursor"` or the
+    request has a `?cursor=` param. It pages on (timestamp, id) instead of an
+    OFFSET, and only counts the objects when asked to with `?with_count=1`.
+    Listings sorted on anything but a timestamp (search ranks, deadlines...)
+    stay on page numbers, unless the view sets a `cursor_ordering`.
+    """
+
     page_size = 15
 
+    cursor_query_param = "cursor"
+    count_query_param = "with_count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.model_meta = queryset.model._meta
+        self.cursor_ordering = self.get_cursor_ordering(queryset, request, view)
+        if self.cursor_ordering is None:
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_cursor_queryset(queryset, request)
+
     def get_paginated_response(self, data):
+        if self.cursor_ordering is not None:
+            return self.get_cursor_paginated_response(data)
+
         response = Response(
             {
                 "page_size": self.page_size,  # The number of objects per page
                 "page_index": self.page.number,  # The current page number
                 "pages_count": self.page.paginator.num_pages,  # The total number of pages
                 "objects_count": self.page.paginator.count,  # The total number of objects
+                "objects_count_exact": self.get_objects_count_exact(),
                 "links": {
                     "next": self.get_next_link(),
                     "prev": self.get_previous_link(),
@@ -22,3 +59,170 @@ class DokoolaPaginator(pagination.PageNumberPagination):
             }
         )
         return response
+
+    def get_objects_count(self, queryset) -> ObjectsCount:
+        return ObjectsCount(queryset.count(), True)
+
+    def get_objects_count_exact(self) -> bool:
+        return True
+
+    # Cursor pagination
+
+    def get_cursor_ordering(self, queryset, request, view) -> tuple[str, ...] | None:
+        """
+        Returns the (timestamp, id) ordering to page on,
+        or None when the listing is paginated by page numbers.
+        """
+
+        mode = getattr(view, "pagination_mode", None)
+        if mode != "cursor" and self.cursor_query_param not in request.query_params:
+            return None
+
+        ordering = getattr(view, "cursor_ordering", None)
+        if ordering:
+            return tuple(ordering)
+
+        # Follows the direction of the queryset's own timestamp ordering
+        current = list(queryset.query.order_by or queryset.model._meta.ordering or [])
+        if current:
+            field = current[0]
+            # Ranked or otherwise sorted listings keep their order on page numbers
+            if not (isinstance(field, str) and field.lstrip("-") in CURSOR_FIELDS):
+                return None
+            return (field, "-pk" if field.startswith("-") else "pk")
+
+        for field in CURSOR_FIELDS:
+            try:
+                queryset.model._meta.get_field(field)
+                return (f"-{field}", "-pk")
+            except FieldDoesNotExist:
+                continue
+        return None
+
+    def paginate_cursor_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request) or self.page_size
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self.cursor_ordering
+
+        self.objects_count = self.objects_count_exact = None
+        if request.query_params.get(self.count_query_param) in ("1", "true"):
+            count = self.get_objects_count(queryset)
+            self.objects_count, self.objects_count_exact = count
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.keyset_filter(ordering, position, reverse))
+        if reverse:
+            queryset = queryset.reverse()
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = position is not None and (has_more or not reverse)
+
+        self.next_position = self.get_position(rows[-1]) if rows else None
+        self.previous_position = self.get_position(rows[0]) if rows else None
+        return rows
+
+    def get_cursor_paginated_response(self, data):
+        return Response(
+            {
+                "page_size": self.page_size,
+                "page_index": None,
+                "pages_count": (
+                    math.ceil(self.objects_count / self.page_size)
+                    if self.objects_count is not None
+                    else None
+                ),
+                "objects_count": self.objects_count,
+                "objects_count_exact": self.objects_count_exact,
+                "links": {
+                    "next": self.get_cursor_link(self.next_position, self.has_next),
+                    "prev": self.get_cursor_link(
+                        self.previous_position, self.has_previous, reverse=True
+                    ),
+                },
+                "payload": data,
+            }
+        )
+
+    def get_cursor_link(self, position, has_page, reverse=False) -> str | None:
+        if not has_page or position is None:
+            return None
+
+        payload = json.dumps({"p": position, "r": int(reverse)})
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request) -> tuple[list | None, bool]:
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            position = [
+                self.get_field(field).to_python(value)
+                for field, value in zip(self.cursor_ordering, payload["p"], strict=True)
+            ]
+            return position, bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound("Invalid cursor") from None
+
+    def get_position(self, row) -> list[str]:
+        values = []
+        for field in self.cursor_ordering:
+            name = self.get_field(field).attname
+            value = row[name] if isinstance(row, dict) else getattr(row, name)
+            values.append(
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+            )
+        return values
+
+    def get_field(self, field: str):
+        name = field.lstrip("-")
+        meta = self.model_meta
+        return meta.pk if name == "pk" else meta.get_field(name)
+
+    def keyset_filter(self, ordering, position, reverse: bool) -> Q:
+        """Matches the rows sorted after `position`, or before it when `reverse`"""
+
+        conditions = []
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+
+            equal = {ordering[i].lstrip("-"): position[i] for i in range(index)}
+            conditions.append(Q(**equal, **{f"{name}__{lookup}": position[index]}))
+
+        return reduce(or_, conditions)
+
+
+class EstimatedCountPaginator(DokoolaPaginator):
+    """
+    For the expensive search and listing views. Counts are cached for a short
+    while and estimated on large PostgreSQL listings, `objects_count_exact`
+    tells whether the count was estimated. The count is only displayed, it
+    doesn't decide which pages exist (see `CountingPaginator`).
+    """
+
+    django_paginator_class = CountingPaginator
+
+    def get_objects_count(self, queryset) -> ObjectsCount:
+        paginator = self.django_paginator_class
+        return count_objects(
+            queryset, paginator.count_timeout, paginator.count_estimate_threshold
+        )
+
+    def get_objects_count_exact(self) -> bool:
+        return self.page.paginator.objects_count.exact
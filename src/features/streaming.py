@@ -0,0 +1,118 @@
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+# The number of rows fetched from the database and serialized at once
+STREAM_CHUNK_SIZE = 500
+
+
+def stream_json(
+    object_list: Iterable,
+    serializer_class,
+    context: dict[str, Any] | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Encodes `object_list` as a JSON array, one chunk of rows at a time.
+
+    Querysets are read with `.iterator(chunk_size=...)`, so only a chunk of rows
+    (and of their prefetched relations) is held in memory while it's encoded.
+    """
+
+    encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    if isinstance(object_list, QuerySet):
+        objects = object_list.iterator(chunk_size=chunk_size)
+    else:
+        objects = iter(object_list)
+
+    yield b"["
+    separator = ""
+    while chunk := list(islice(objects, chunk_size)):
+        data = serializer_class(chunk, many=True, context=context or {}).data
+        yield (separator + ",".join(map(encoder.encode, data))).encode()
+        separator = ","
+    yield b"]"
+
+
+async def astream_json(
+    object_list: Iterable,
+    serializer_class,
+    context: dict[str, Any] | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    `stream_json` for ASGI servers, which read a sync iterator whole before
+    sending it. Each chunk is read and encoded in the request's sync thread.
+    """
+
+    chunks = stream_json(object_list, serializer_class, context, chunk_size)
+    read_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await read_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+def is_asgi(request) -> bool:
+    """Whether the (Django or DRF) request is served by an ASGI server"""
+
+    return isinstance(getattr(request, "_request", request), ASGIRequest)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    A JSON array response written while the rows are read from the database.
+    Pass `asynchronous=is_asgi(request)`, so that ASGI servers stream it too.
+    """
+
+    def __init__(
+        self,
+        object_list: Iterable,
+        serializer_class,
+        context: dict[str, Any] | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        filename: str | None = None,
+        asynchronous: bool = False,
+        **kwargs,
+    ):
+        kwargs.setdefault("content_type", "application/json")
+        encode = astream_json if asynchronous else stream_json
+        super().__init__(
+            encode(object_list, serializer_class, context, chunk_size), **kwargs
+        )
+        if filename:
+            self["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+
+class StreamingListMixin:
+    """
+    Streams the whole filtered queryset of a list view as a JSON array
+    when the view isn't paginated, or when the request asks for it with `?stream=1`.
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = STREAM_CHUNK_SIZE
+
+    def should_stream(self, request) -> bool:
+        if self.paginator is None:
+            return True
+        return request.query_params.get(self.stream_query_param) in ("1", "true")
+
+    def list(self, request, *args, **kwargs):
+        if not self.should_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        return StreamingJSONResponse(
+            self.filter_queryset(self.get_queryset()),
+            self.get_serializer_class(),
+            self.get_serializer_context(),
+            chunk_size=self.stream_chunk_size,
+            asynchronous=is_asgi(request),
+        )
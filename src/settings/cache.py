@@ -1,19 +1,54 @@
 import os
+from importlib.util import find_spec
 
-REDIS_USERNAME = os.getenv("REDIS_USERNAME", None)
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", None)
+from src.settings.shared import ENVIRONMENT
+
+REDIS_USERNAME = os.getenv("REDIS_USERNAME", os.getenv("REDIS_USER", None))
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", os.getenv("REDIS_PASS", None))
 REDIS_HOST = os.getenv("REDIS_HOST", None)
-REDIS_PORT = int(os.getenv("REDIS_PORT", 0))
+REDIS_PORT = int(os.getenv("REDIS_PORT", 0) or 6379)
+REDIS_DB = int(os.getenv("REDIS_DB", 0))
+
+CACHE_TIMEOUT = 60 * 15  # 15 minutes
+
+# LocMemCache evicts the least recently used entries
+LOCAL_CACHE_OPTIONS = {"MAX_ENTRIES": 5000, "CULL_FREQUENCY": 10}
+
+# Redis is shared by every worker, so an invalidation reaches all of them
+USE_REDIS = bool(REDIS_HOST and ENVIRONMENT != "test" and find_spec("redis"))
+
+REDIS_URL = None
 
-CACHES = {
-    "default": {
-        # "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        # "LOCATION": f"redis://{REDIS_USERNAME}:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}",
+if USE_REDIS:
+    credentials = ""
+    if REDIS_PASSWORD:
+        credentials = f"{REDIS_USERNAME or ''}:{REDIS_PASSWORD}@"
+
+    REDIS_URL = f"redis://{credentials}{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+
+    default_cache = {
+        # Falls back to an in-process cache while Redis can't be reached
+        "BACKEND": "core.services.cache.backends.RedisFallbackCache",
+        "LOCATION": REDIS_URL,
+        "TIMEOUT": CACHE_TIMEOUT,
+        "KEY_PREFIX": "dokoola",
+        "OPTIONS": {
+            "socket_timeout": 2,
+            "socket_connect_timeout": 2,
+            "retry_on_timeout": True,
+        },
+        "FALLBACK": {"OPTIONS": LOCAL_CACHE_OPTIONS},
+    }
+else:
+    default_cache = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "unique-snowflake",
-        "TIMEOUT": 60 * 15,  # 30 minutes
+        "TIMEOUT": CACHE_TIMEOUT,
+        "KEY_PREFIX": "dokoola",
+        "OPTIONS": LOCAL_CACHE_OPTIONS,
     }
-}
+
+CACHES = {"default": default_cache}
 
 
-__all__ = ("CACHES",)
\ No newline at end of file
+__all__ = ("CACHES",)
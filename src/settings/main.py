@@ -26,6 +26,7 @@ from .email import (
 )
 from .jwt import SIMPLE_JWT
 from .logger import LOG_CONFIG
+from .tasks import TASK_BACKGROUND_THREADS, TASK_MAX_ATTEMPTS, TASK_QUEUE_BACKEND
 from .unfold import UNFOLD
 from .whitenoice import STORAGES
 
@@ -59,7 +60,6 @@ INSTALLED_APPS = [
     # Third party apps
     "corsheaders",
     "rest_framework",
-    "after_response",
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
     # The core application services and utilities
@@ -0,0 +1,18 @@
+import os
+
+from src.settings.shared import ENVIRONMENT
+
+# "database" queues tasks for the `run_tasks` worker process,
+# "inline" runs them right away in the calling process
+TASK_QUEUE_BACKEND = os.getenv(
+    "TASK_QUEUE_BACKEND", "database" if ENVIRONMENT == "production" else "inline"
+)
+
+# How many times a failing task is run before it's marked as failed
+TASK_MAX_ATTEMPTS = int(os.getenv("TASK_MAX_ATTEMPTS", 3))
+
+# Threads running the in-process background work (e.g. logging) of a web worker
+TASK_BACKGROUND_THREADS = int(os.getenv("TASK_BACKGROUND_THREADS", 2))
+
+
+__all__ = ("TASK_QUEUE_BACKEND", "TASK_MAX_ATTEMPTS", "TASK_BACKGROUND_THREADS")
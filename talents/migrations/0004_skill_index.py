@@ -0,0 +1,67 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_skill"),
+        ("talents", "0003_alter_talent_badge_alter_talent_pricing_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TalentSkill",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "skill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="talent_skills",
+                        to="core.skill",
+                    ),
+                ),
+                (
+                    "talent",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="talent_skills",
+                        to="talents.talent",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="talent",
+            name="skill_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="talents",
+                through="talents.TalentSkill",
+                to="core.skill",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="talentskill",
+            index=models.Index(
+                fields=["skill", "talent"], name="talents_tal_skill_i_57a681_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="talentskill",
+            constraint=models.UniqueConstraint(
+                fields=("talent", "skill"), name="unique_talent_skill"
+            ),
+        ),
+    ]
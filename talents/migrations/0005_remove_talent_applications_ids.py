@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("talents", "0004_skill_index"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="talent",
+            name="applications_ids",
+        ),
+    ]
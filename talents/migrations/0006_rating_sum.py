@@ -0,0 +1,41 @@
+# Generated by Django 5.0.2 on 2026-10-18 13:31
+
+from django.db import migrations, models
+
+
+def backfill_ratings(apps, schema_editor):
+    Talent = apps.get_model("talents", "Talent")
+
+    Talent.objects.update(rating_sum=0, reviews_count=0)
+    rated = (
+        Talent.objects.annotate(
+            total=models.Sum("reviews__rating"), count=models.Count("reviews")
+        )
+        .filter(count__gt=0)
+        .values_list("pk", "total", "count")
+    )
+    for pk, total, count in rated:
+        Talent.objects.filter(pk=pk).update(
+            rating_sum=total, reviews_count=count, rating=total / count
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("talents", "0005_remove_talent_applications_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="talent",
+            name="rating_sum",
+            field=models.FloatField(blank=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="talent",
+            name="reviews_count",
+            field=models.IntegerField(blank=True, default=0),
+        ),
+        migrations.RunPython(backfill_ratings, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,7 @@
 from .certificate import Certificate
 from .education import Education
 from .portfolio import Portfolio
+from .skill import TalentSkill
 from .talent import Talent
 
-__all__ = ["Certificate", "Education", "Portfolio", "Talent"]
+__all__ = ["Certificate", "Education", "Portfolio", "Talent", "TalentSkill"]
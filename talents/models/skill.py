@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class TalentSkill(models.Model):
+    """Indexes the normalized skills of Talent.skills"""
+
+    talent = models.ForeignKey(
+        "Talent", on_delete=models.CASCADE, related_name="talent_skills"
+    )
+    skill = models.ForeignKey(
+        "core.Skill", on_delete=models.CASCADE, related_name="talent_skills"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["talent", "skill"], name="unique_talent_skill"
+            )
+        ]
+        indexes = [models.Index(fields=["skill", "talent"])]
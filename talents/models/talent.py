@@ -1,6 +1,6 @@
 from django.db import models
 
-from reviews.models import Review
+from reviews.models import RatedProfileMixin, Review
 from utilities.generator import primary_key_generator, public_id_generator
 
 from .certificate import Certificate
@@ -8,7 +8,7 @@ from .education import Education
 from .portfolio import Portfolio
 
 
-class Talent(models.Model):
+class Talent(RatedProfileMixin, models.Model):
     id = models.UUIDField(
         primary_key=True,
         default=primary_key_generator,
@@ -24,6 +24,9 @@ class Talent(models.Model):
     bio = models.TextField(max_length=1500, default="", blank=True)
 
     skills = models.CharField(max_length=1000, default="", blank=True)
+    skill_tags = models.ManyToManyField(
+        "core.Skill", through="TalentSkill", related_name="talents", blank=True
+    )
     pricing = models.CharField(max_length=20, default="", blank=True)
 
     reviews = models.ManyToManyField(Review, blank=True, related_name="talent_reviews")
@@ -34,6 +37,8 @@ class Talent(models.Model):
     )
 
     rating = models.FloatField(default=3.5, blank=True, db_index=True)
+    rating_sum = models.FloatField(default=0, blank=True)
+    reviews_count = models.IntegerField(default=0, blank=True)
     jobs_completed = models.IntegerField(default=0)
     badge = models.CharField(max_length=200, default="basic", db_index=True)
     bits = models.IntegerField(default=60, blank=True)
@@ -44,9 +49,8 @@ class Talent(models.Model):
 
     public_id = models.CharField(max_length=50, db_index=True, blank=True)
 
-    applications_ids = models.JSONField(default=list, blank=True, null=True)
-
     PUBLIC_ID_PREFIX = "TAL"
+    DEFAULT_RATING = 3.6
 
     def save(self, *args, **kwargs):
         if self._state.adding or not self.public_id:
@@ -62,13 +66,5 @@ class Talent(models.Model):
     def name(self):
         return self.user.name
 
-    def average_rating(self):
-        """Calculates the client's average rating"""
-        default_rating = 3.6
-        return (
-            self.reviews.aggregate(rating=models.Avg("rating"))["rating"]
-            or default_rating
-        )
-
     def __str__(self) -> str:
         return str(self.user.email)
@@ -1,13 +1,26 @@
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from rest_framework.generics import ListAPIView
 
-from .models import Talent
+from core.models import Skill
+from src.features.paginator import EstimatedCountPaginator
+
+from .models import Talent, TalentSkill
 from .serializers import TalentReadSerializer
 
 
 class TalentsSearchAPIView(ListAPIView):
     permission_classes = []
     serializer_class = TalentReadSerializer
+    pagination_class = EstimatedCountPaginator
+
+    @classmethod
+    def has_skill(cls, value: str):
+        """Matches the talents with a skill containing the given value"""
+        talent_skills = TalentSkill.objects.filter(
+            talent=OuterRef("pk"),
+            skill__slug__contains=Skill.objects.normalize(value),
+        )
+        return Q(Exists(talent_skills))
 
     @classmethod
     def make_query(cls, request):
@@ -23,19 +36,18 @@ class TalentsSearchAPIView(ListAPIView):
         if query and query.lower() != "all":
             query = query.replace("%20", " ")
             queryset = queryset.filter(
-                Q(skills__icontains=query)
+                cls.has_skill(query)
                 | Q(user__first_name__icontains=query)
                 | Q(user__last_name__icontains=query)
                 | Q(user__public_id__icontains=query)
                 | Q(title__icontains=query)
                 | Q(bio__icontains=query)
-                | Q(skills__icontains=query)
             )
 
         if category and category.lower() != "all":
             category = category.replace("%20", " ")
             queryset = queryset.filter(
-                Q(skills__icontains=category)
+                cls.has_skill(category)
                 | Q(title__icontains=category)
                 | Q(bio__icontains=category)
             )
@@ -1,3 +1,4 @@
+from .m2m_changed import *
 from .post_delete import *
 from .post_save import *
 from .pre_delete import *
@@ -0,0 +1,14 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from core.services.dashboard import TALENT_REVIEWS, DashboardRollupService
+from talents.models import Talent
+
+
+@receiver(m2m_changed, sender=Talent.reviews.through)
+def update_talent_reviews_dashboard(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    DashboardRollupService.schedule_reviews(
+        TALENT_REVIEWS, "talent_reviews", instance, action, reverse, pk_set
+    )
@@ -1,7 +1,8 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from talents.models import Talent
+from core.models import Skill
+from talents.models import Talent, TalentSkill
 
 
 @receiver(post_save, sender=Talent)
@@ -11,3 +12,9 @@ def create_talent(sender, instance: Talent, created, **kwargs):
         if not user.is_talent:
             user.is_talent = True
             user.save()
+
+
+@receiver(post_save, sender=Talent)
+def update_talent_skills(sender, instance: Talent, **kwargs):
+    """Keeps the talent's normalized skills in sync with its skills"""
+    Skill.objects.sync(TalentSkill, "talent", {instance.pk: instance.skills})
@@ -65,6 +65,8 @@ class TalentModelTest(TestCase):
         review1 = Review.objects.create(rating=5, author=review_user)
         review2 = Review.objects.create(rating=4, author=review_user)
         self.talent.reviews.add(review1, review2)
+        self.talent.update_rating(review1.rating)
+        self.talent.update_rating(review2.rating)
 
         # Test calculated average
         self.assertEqual(self.talent.average_rating(), 4.5)
@@ -1,6 +1,7 @@
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
+from proposals.models import Proposal
 from users.models import User
 
 from ..models import  Talent
@@ -13,7 +14,10 @@ class TalentApplicationIdsAPIView(GenericAPIView):
             user: User = request.user
             assert user.is_talent, "403: Forbidden request!"
             talent = Talent.objects.get(user=user)
-            return Response(talent.applications_ids or [], status=200)
+            job_ids = Proposal.objects.filter(talent=talent).values_list(
+                "job__public_id", flat=True
+            )
+            return Response(list(job_ids), status=200)
         except Talent.DoesNotExist:
             return AssertionError("403: Forbidden request!")
         except AssertionError as e:
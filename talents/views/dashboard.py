@@ -1,12 +1,16 @@
 from datetime import datetime
 
-from django.db.models import Avg, Count, F, Q, Sum
+from django.db.models import F, Q
 from rest_framework import serializers
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
-from contracts.models import Contract
-from jobs.models.job import JobStatusChoices
+from core.services.dashboard import (
+    TALENT_COMPLETED_CONTRACTS,
+    TALENT_CONTRACTS,
+    TALENT_REVIEWS,
+    DashboardRollupService,
+)
 from talents.models import Talent
 
 
@@ -80,12 +84,12 @@ class TalentDashboardSerializer(serializers.ModelSerializer):
             except:
                 pass
 
-            _query = Q(created_at__year=self.year) if self.year else Q(pk__isnull=False)
-
-            self.projects = (
-                Contract.objects.select_related()
-                .annotate(budget=F("proposal__budget"))
-                .filter(_query, talent=instance)
+            self.rollups = DashboardRollupService.read(
+                instance.pk,
+                [TALENT_CONTRACTS, TALENT_COMPLETED_CONTRACTS, TALENT_REVIEWS],
+                self.year or self.today.year,
+                self._this_month,
+                total_year=self.year,
             )
 
     def get_months(self, index: int):
@@ -106,19 +110,12 @@ class TalentDashboardSerializer(serializers.ModelSerializer):
 
     def get_total_earning(self, instance: Talent):
         try:
-            earnings = self.projects.aggregate(Sum("budget"))["budget__sum"] or 0.00
-            last_month = (
-                self.projects.filter(created_at__month=self._last_month).aggregate(
-                    Sum("budget")
-                )["budget__sum"]
-                or 0.00
-            )
-            this_month = (
-                self.projects.filter(created_at__month=self._this_month).aggregate(
-                    Sum("budget")
-                )["budget__sum"]
-                or 0.00
-            )
+            earnings = self.rollups.total(TALENT_CONTRACTS)
+            this_month = self.rollups.this_month(TALENT_CONTRACTS)
+            last_month = self.rollups.last_month(TALENT_CONTRACTS)
+
+            this_month = (this_month and this_month.total) or 0.00
+            last_month = (last_month and last_month.total) or 0.00
             if this_month and last_month:
                 percentage = ((this_month / 100) / (last_month / 100)) * 100
             else:
@@ -136,68 +133,27 @@ class TalentDashboardSerializer(serializers.ModelSerializer):
             return {"spent": 0.00}
 
     def get_client_reviews(self, instance: Talent):
-        try:
-            _query = Q(created_at__year=self.year) if self.year else Q(pk__isnull=False)
-
-            ratings = (
-                instance.reviews.select_related()
-                .filter(_query)
-                .values("id")
-                .annotate(
-                    year=F("created_at__year"),
-                    month=F("created_at__month"),
-                )
-            )
-
-            duplicate = {}
-            for review in ratings:
-                duplicate[review["month"]] = review
-
-            result = [
-                {
-                    "id": rating["id"],
-                    "year": rating["year"],
-                    "month": self.get_months(rating["month"] - 1),
-                    **instance.reviews.select_related()
-                    .filter(_query, created_at__month=rating["month"])
-                    .aggregate(count=Count("id", 0), avg_rating=Avg("rating")),
-                }
-                for rating in list(duplicate.values())[:6]
-            ]
-            return result
-        except Exception:
-            pass
-            return []
+        return [
+            {
+                "id": month.pk,
+                "year": month.year,
+                "month": self.get_months(month.month - 1),
+                "count": month.count,
+                "avg_rating": month.total / month.count,
+            }
+            for month in self.rollups.recent(TALENT_REVIEWS)
+        ]
 
     def get_completed_projects(self, instance: Talent):
-        completed_contracts = (
-            self.projects.annotate(
-                count=Count(F("completed_at__month")),
-                year=F("completed_at__year"),
-                month=F("completed_at__month"),
-            )
-            .values("budget", "month", "count", "year")
-            .filter(job__status=JobStatusChoices.COMPLETED)
-        )
-
-        unique = {}
-        computed = list(completed_contracts)[:6]
-
-        for project in computed:
-
-            project["month"] = self.get_months(project["month"] - 1)
-
-            _id = project["month"]
-
-            if unique.get(_id):
-                unique[_id]["budget"] += project["budget"]
-                unique[_id]["count"] += project["count"]
-            else:
-                unique[_id] = project
-
-        if unique.keys():
-            computed = list(unique.values())
-        return computed
+        return [
+            {
+                "budget": month.total,
+                "month": self.get_months(month.month - 1),
+                "count": month.count,
+                "year": month.year,
+            }
+            for month in self.rollups.recent(TALENT_COMPLETED_CONTRACTS)
+        ]
 
     def get_profile_completion(self, instance: Talent):
         portfolio = float(instance.portfolio.exists()) or 0.017
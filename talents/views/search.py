@@ -1,6 +1,8 @@
 from django.db.models import Q
 from rest_framework.generics import ListAPIView
 
+from src.features.paginator import EstimatedCountPaginator
+
 from ..models import Talent
 from ..serializers import TalentReadSerializer
 
@@ -8,6 +10,7 @@ from ..serializers import TalentReadSerializer
 class TalentSearchAPIView(ListAPIView):
     permission_classes = []
     serializer_class = TalentReadSerializer
+    pagination_class = EstimatedCountPaginator
 
     @classmethod
     def make_query(cls, request):
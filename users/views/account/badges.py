@@ -0,0 +1,13 @@
+"""A route controller for the request.user's unread counters."""
+
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+
+from core.services.badges import BadgeService
+
+
+class BadgesAPIView(GenericAPIView):
+    """Returns the number of unseen notifications and unread messages"""
+
+    def get(self, request, *args, **kwargs):
+        return Response(BadgeService.get(request.user.pk), status=200)
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from . import (
+    badges,
     login,
     logout,
     profile,
@@ -19,6 +20,7 @@ urlpatterns = [
         name="verify",
     ),
     path("logout/", logout.LogoutView.as_view(), name="logout"),
+    path("badges/", badges.BadgesAPIView.as_view(), name="badges"),
     path("signup/", signup.SignupAPIView.as_view(), name="signup"),
     path(
         "signup/mail-check/",